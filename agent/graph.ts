@@ -14,6 +14,28 @@ import { PostgresSaver } from '@langchain/langgraph-checkpoint-postgres';
 import { getTools } from './tools';
 import { buildSystemPrompt } from './prompt';
 
+let checkpointerPromise: Promise<PostgresSaver> | null = null;
+
+/**
+ * Get or create the shared Postgres checkpointer.
+ *
+ * Prefers SUPABASE_POOLER_URL (Supavisor transaction mode, port 6543) so
+ * checkpoint reads and writes reuse warm server connections, falling back to
+ * the direct SUPABASE_DB_URL. The pool and one-time table setup are shared
+ * across requests instead of being recreated per graph.
+ */
+function getCheckpointer(): Promise<PostgresSaver> {
+  if (!checkpointerPromise) {
+    const connString = process.env.SUPABASE_POOLER_URL || process.env.SUPABASE_DB_URL!;
+    const checkpointer = PostgresSaver.fromConnString(connString);
+    checkpointerPromise = checkpointer.setup().then(() => checkpointer);
+    checkpointerPromise.catch(() => {
+      checkpointerPromise = null;
+    });
+  }
+  return checkpointerPromise;
+}
+
 /**
  * Get the agent graph with session-aware prompt.
  *
@@ -25,8 +47,7 @@ export async function getAgentGraph() {
     temperature: 0,
   });
 
-  const checkpointer = PostgresSaver.fromConnString(process.env.SUPABASE_DB_URL!);
-  await checkpointer.setup();
+  const checkpointer = await getCheckpointer();
 
   return createReactAgent({
     llm: model,
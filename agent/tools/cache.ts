@@ -0,0 +1,207 @@
+/**
+ * In-memory LRU cache with per-entry TTL for agent tools.
+ */
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+export interface CacheStats {
+  size: number;
+  hits: number;
+  misses: number;
+  hitRate: number;
+}
+
+/**
+ * Bounded LRU cache whose entries expire after a fixed TTL.
+ *
+ * Relies on Map preserving insertion order: reads re-insert the entry so the
+ * first key is always the least recently used one.
+ */
+export class TTLCache<V> {
+  private entries = new Map<string, CacheEntry<V>>();
+  private hits = 0;
+  private misses = 0;
+
+  constructor(
+    private readonly maxSize: number = 2000,
+    private readonly ttlMs: number = 5 * 60 * 1000
+  ) {}
+
+  /**
+   * Get a cached value, or undefined if missing or expired
+   */
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+
+    if (!entry) {
+      this.misses++;
+      return undefined;
+    }
+
+    this.entries.delete(key);
+
+    if (entry.expiresAt <= Date.now()) {
+      this.misses++;
+      return undefined;
+    }
+
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  /**
+   * Store a value, evicting the least recently used entry when full
+   */
+  set(key: string, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+
+    while (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as string;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  getStats(): CacheStats {
+    const total = this.hits + this.misses;
+    return {
+      size: this.entries.size,
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: total > 0 ? this.hits / total : 0,
+    };
+  }
+}
+
+/**
+ * Wrap a read-only tool function so identical calls within the TTL return the
+ * previously formatted output without touching the database.
+ *
+ * The tool calls `skipCache()` when a query failed, so an error message is
+ * returned to the caller but the next identical call tries again. Results of
+ * calls that throw are never cached.
+ *
+ * @param toolName - Tool name, used to namespace cache keys
+ * @param fn - Tool implementation, given a callback that opts the current result out of caching
+ * @param ttlMs - How long a cached result stays valid (default 2 minutes)
+ * @returns Cached tool implementation
+ */
+export function withToolCache<A, R>(
+  toolName: string,
+  fn: (args: A, skipCache: () => void) => Promise<R>,
+  ttlMs: number = 2 * 60 * 1000
+): (args: A) => Promise<R> {
+  const cache = new TTLCache<R>(512, ttlMs);
+
+  return async (args: A) => {
+    const key = `${toolName}:${JSON.stringify(args)}`;
+    const cached = cache.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    let cacheable = true;
+    const result = await fn(args, () => {
+      cacheable = false;
+    });
+    if (cacheable) {
+      cache.set(key, result);
+    }
+    return result;
+  };
+}
+
+/**
+ * Fixed-capacity nearest-neighbor index over L2-normalized vectors.
+ *
+ * Vectors live in one preallocated Float32Array so a lookup is a single pass
+ * of dot products over contiguous memory. When full, the oldest row is
+ * overwritten. Each row carries a tag (only rows with the same tag are
+ * compared) and a value returned on a hit.
+ */
+export class EmbeddingIndex {
+  private readonly matrix: Float32Array;
+  private readonly tags: string[];
+  private readonly values: string[];
+  private size = 0;
+  private next = 0;
+
+  constructor(
+    private readonly dimensions: number,
+    private readonly capacity: number = 500
+  ) {
+    this.matrix = new Float32Array(dimensions * capacity);
+    this.tags = new Array(capacity);
+    this.values = new Array(capacity);
+  }
+
+  /**
+   * Add a vector (stored L2-normalized)
+   */
+  add(vector: ArrayLike<number>, tag: string, value: string): void {
+    const offset = this.next * this.dimensions;
+    const norm = Math.sqrt(dot(vector, vector, this.dimensions)) || 1;
+
+    for (let i = 0; i < this.dimensions; i++) {
+      this.matrix[offset + i] = vector[i] / norm;
+    }
+
+    this.tags[this.next] = tag;
+    this.values[this.next] = value;
+    this.next = (this.next + 1) % this.capacity;
+    this.size = Math.min(this.size + 1, this.capacity);
+  }
+
+  /**
+   * Find the most similar row with the given tag at or above minSimilarity
+   *
+   * @returns The row's value and cosine similarity, or null if none qualifies
+   */
+  findNearest(
+    vector: ArrayLike<number>,
+    tag: string,
+    minSimilarity: number
+  ): { value: string; similarity: number } | null {
+    const norm = Math.sqrt(dot(vector, vector, this.dimensions)) || 1;
+    let bestRow = -1;
+    let bestSimilarity = minSimilarity;
+
+    for (let row = 0; row < this.size; row++) {
+      if (this.tags[row] !== tag) continue;
+
+      const similarity = dotRow(this.matrix, row * this.dimensions, vector, this.dimensions) / norm;
+      if (similarity >= bestSimilarity) {
+        bestSimilarity = similarity;
+        bestRow = row;
+      }
+    }
+
+    return bestRow === -1 ? null : { value: this.values[bestRow], similarity: bestSimilarity };
+  }
+}
+
+function dot(a: ArrayLike<number>, b: ArrayLike<number>, length: number): number {
+  let sum = 0;
+  for (let i = 0; i < length; i++) {
+    sum += a[i] * b[i];
+  }
+  return sum;
+}
+
+function dotRow(matrix: Float32Array, offset: number, vector: ArrayLike<number>, length: number): number {
+  let sum = 0;
+  for (let i = 0; i < length; i++) {
+    sum += matrix[offset + i] * vector[i];
+  }
+  return sum;
+}
@@ -0,0 +1,149 @@
+/**
+ * Query embeddings for agent tools via the OpenAI embeddings endpoint.
+ */
+
+import { isTransientStatus, parseRetryAfter, withRetry } from '@/shared/retry';
+
+export const EMBEDDING_MODEL = 'text-embedding-3-small';
+
+const OPENAI_EMBEDDINGS_URL = 'https://api.openai.com/v1/embeddings';
+
+// A user is waiting on these, so keep the timeout and retry budget short
+const EMBEDDING_TIMEOUT_MS = 10000;
+const EMBEDDING_ATTEMPTS = 3;
+const EMBEDDING_MAX_RETRY_DELAY_MS = 5000;
+
+// Embeddings are requested base64-encoded: the payload is ~4x smaller than a
+// JSON array of 1536 decimal floats and decodes without per-number parsing
+interface EmbeddingsResponse {
+  data: {
+    index: number;
+    embedding: string;
+  }[];
+}
+
+/**
+ * Decode a base64-encoded little-endian float32 embedding
+ */
+function decodeEmbedding(encoded: string): number[] {
+  const bytes = Buffer.from(encoded, 'base64');
+  const embedding = new Array<number>(bytes.length / 4);
+  for (let i = 0; i < embedding.length; i++) {
+    embedding[i] = bytes.readFloatLE(i * 4);
+  }
+  return embedding;
+}
+
+/**
+ * Embed a batch of strings with a single OpenAI request.
+ *
+ * Calls the REST endpoint directly instead of going through LangChain's
+ * OpenAIEmbeddings, which adds callback and validation layers per call.
+ * Timeouts, network errors and transient statuses (429, 5xx) are retried,
+ * honoring Retry-After.
+ *
+ * @param inputs - Strings to embed
+ * @returns Embedding vectors in the same order as inputs
+ * @throws {Error} If OPENAI_API_KEY is not set or the request keeps failing
+ */
+export async function embedTexts(inputs: string[]): Promise<number[][]> {
+  const apiKey = process.env.OPENAI_API_KEY;
+  if (!apiKey) {
+    throw new Error('OPENAI_API_KEY environment variable not set');
+  }
+
+  let retryable = true;
+  let retryAfterMs: number | undefined;
+  const response = await withRetry(
+    async () => {
+      retryable = true;
+      retryAfterMs = undefined;
+      const attemptResponse = await fetch(OPENAI_EMBEDDINGS_URL, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${apiKey}`,
+        },
+        body: JSON.stringify({ model: EMBEDDING_MODEL, input: inputs, encoding_format: 'base64' }),
+        signal: AbortSignal.timeout(EMBEDDING_TIMEOUT_MS),
+      });
+
+      if (!attemptResponse.ok) {
+        retryable = isTransientStatus(attemptResponse.status);
+        retryAfterMs = parseRetryAfter(attemptResponse.headers.get('retry-after'));
+        throw new Error(
+          `Failed to generate embeddings: ${attemptResponse.status} ${await attemptResponse.text()}`
+        );
+      }
+      return attemptResponse;
+    },
+    {
+      attempts: EMBEDDING_ATTEMPTS,
+      maxDelayMs: EMBEDDING_MAX_RETRY_DELAY_MS,
+      shouldRetry: () => retryable,
+      retryDelayMs: () => retryAfterMs,
+    }
+  );
+
+  const { data } = (await response.json()) as EmbeddingsResponse;
+  const embeddings: number[][] = new Array(inputs.length);
+  for (const row of data) {
+    embeddings[row.index] = decodeEmbedding(row.embedding);
+  }
+  return embeddings;
+}
+
+// Queries arriving within this window are sent as one request; the agent
+// often issues several semantic searches in the same turn
+const BATCH_WINDOW_MS = 10;
+const MAX_BATCH_SIZE = 64;
+
+interface PendingQuery {
+  query: string;
+  resolve: (embedding: number[]) => void;
+  reject: (error: unknown) => void;
+}
+
+let pendingQueries: PendingQuery[] = [];
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+/**
+ * Send all buffered queries as a single embeddings request
+ */
+async function flushPendingQueries(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+
+  const batch = pendingQueries;
+  pendingQueries = [];
+
+  try {
+    const embeddings = await embedTexts(batch.map((item) => item.query));
+    batch.forEach((item, i) => item.resolve(embeddings[i]));
+  } catch (error) {
+    batch.forEach((item) => item.reject(error));
+  }
+}
+
+/**
+ * Embed a single query string.
+ *
+ * Concurrent calls are coalesced into batched requests of up to
+ * MAX_BATCH_SIZE inputs.
+ *
+ * @param query - Query text
+ * @returns Embedding vector
+ */
+export function embedQuery(query: string): Promise<number[]> {
+  return new Promise((resolve, reject) => {
+    pendingQueries.push({ query, resolve, reject });
+
+    if (pendingQueries.length >= MAX_BATCH_SIZE) {
+      void flushPendingQueries();
+    } else if (!flushTimer) {
+      flushTimer = setTimeout(() => void flushPendingQueries(), BATCH_WINDOW_MS);
+    }
+  });
+}
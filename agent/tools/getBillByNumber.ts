@@ -5,107 +5,71 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
-import { Database } from '@/database/types';
 import { normalizeBillNumber } from './utils';
+import { withToolCache } from './cache';
 
-type Bill = Database['public']['Tables']['bills']['Row'];
+// Sponsor entry as returned by get_bill_detail
+interface BillDetailSponsor {
+  id: string;
+  name: string;
+  party_affiliation: string | null;
+}
 
-// Type for bill query with session relation
-interface BillWithSession extends Omit<Bill, 'sessions'> {
-  sessions: {
-    year: number;
-    session_code: string;
-  } | null;
+// Shape of the JSON object returned by the get_bill_detail RPC
+interface BillDetail {
+  id: string;
+  bill_number: string;
+  title: string | null;
+  lr_number: string | null;
+  last_action: string | null;
+  proposed_effective_date: string | null;
+  session_year: number;
+  session_code: string;
+  primary_sponsors: BillDetailSponsor[];
+  cosponsors: BillDetailSponsor[];
 }
 
-// Type for sponsor query with nested relations
-interface SponsorWithLegislator {
-  is_primary: boolean;
-  session_legislators: {
-    legislators: {
-      id: string;
-      name: string;
-      party_affiliation: string | null;
-    };
-  } | null;
+/**
+ * Format a sponsor as "Name (ID: ...) (Party)"
+ */
+function formatSponsor(sponsor: BillDetailSponsor): string {
+  const name = sponsor.name || 'Unknown';
+  const party = sponsor.party_affiliation || '';
+  return party ? `${name} (ID: ${sponsor.id}) (${party})` : `${name} (ID: ${sponsor.id})`;
 }
 
 /**
  * Get detailed information about a specific bill
  */
 export const getBillByNumber = tool(
-  async ({ billNumber, sessionYear }) => {
+  withToolCache('get_bill_by_number', async ({ billNumber, sessionYear }, skipCache) => {
     const supabase = getSupabaseClient();
 
     // Normalize bill number
     const normalized = normalizeBillNumber(billNumber);
 
-    // Build query
-    let query = supabase
-      .from('bills')
-      .select(`
-        id,
-        bill_number,
-        title,
-        lr_number,
-        last_action,
-        proposed_effective_date,
-        sessions(year, session_code)
-      `)
-      .eq('bill_number', normalized);
-
-    if (sessionYear) {
-      // Get session first
-      const { data: sessionData } = await supabase
-        .from('sessions')
-        .select('id')
-        .eq('year', sessionYear)
-        .single();
+    // Bill, session and sponsors are resolved server-side in a single round trip
+    const { data, error } = await supabase.rpc('get_bill_detail', {
+      p_bill_number: normalized,
+      p_session_year: sessionYear,
+    });
 
-      if (sessionData) {
-        query = query.eq('session_id', sessionData.id);
-      }
+    if (error) {
+      console.error('Bill lookup error:', error);
+      skipCache();
+      return `Error looking up bill ${normalized}: ${error.message}`;
     }
 
-    const { data, error } = await query.single();
-
-    if (error || !data) {
+    if (!data) {
       return `Bill ${normalized} not found${sessionYear ? ` for session ${sessionYear}` : ''}.`;
     }
 
-    const billData = data as unknown as BillWithSession;
-
-    // Get sponsors
-    const { data: sponsorsData } = await supabase
-      .from('bill_sponsors')
-      .select(`
-        is_primary,
-        session_legislators(legislators(id, name, party_affiliation))
-      `)
-      .eq('bill_id', billData.id);
-
-    const primarySponsors: string[] = [];
-    const cosponsors: string[] = [];
-
-    const typedSponsors = sponsorsData as unknown as SponsorWithLegislator[];
-    typedSponsors?.forEach((sponsor) => {
-      const leg = sponsor.session_legislators?.legislators;
-      if (!leg) return;
-
-      const name = leg.name || 'Unknown';
-      const party = leg.party_affiliation || '';
-      const sponsorStr = party ? `${name} (ID: ${leg.id}) (${party})` : `${name} (ID: ${leg.id})`;
-
-      if (sponsor.is_primary) {
-        primarySponsors.push(sponsorStr);
-      } else {
-        cosponsors.push(sponsorStr);
-      }
-    });
+    const billData = data as unknown as BillDetail;
+    const primarySponsors = billData.primary_sponsors.map(formatSponsor);
+    const cosponsors = billData.cosponsors.map(formatSponsor);
 
-    const sessions = billData.sessions;
     const result = `Bill: ${billData.bill_number} (ID: ${billData.id})
-Session: ${sessions?.year} ${sessions?.session_code}
+Session: ${billData.session_year} ${billData.session_code}
 Title: ${billData.title || 'N/A'}
 LR Number: ${billData.lr_number || 'N/A'}
 Last Action: ${billData.last_action || 'N/A'}
@@ -116,7 +80,7 @@ Co-sponsors: ${cosponsors.length > 0 ? cosponsors.slice(0, 5).join(', ') : 'None
 ${cosponsors.length > 5 ? `(and ${cosponsors.length - 5} more)` : ''}`;
 
     return result.trim();
-  },
+  }),
   {
     name: 'get_bill_by_number',
     description:
@@ -5,77 +5,58 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
-import { Database } from '@/database/types';
 import { normalizeBillNumber } from './utils';
-
-type Bill = Database['public']['Tables']['bills']['Row'];
-type BillAction = Database['public']['Tables']['bill_actions']['Row'];
-
-// Type for bill query with session relation
-interface BillWithSession extends Omit<Bill, 'sessions'> {
-  sessions: {
-    year: number;
-    session_code: string;
-  } | null;
+import { withToolCache } from './cache';
+
+// Shape of the JSON object returned by the get_bill_timeline RPC
+interface BillTimeline {
+  id: string;
+  bill_number: string;
+  session_year: number;
+  session_code: string;
+  actions: {
+    action_date: string | null;
+    description: string;
+  }[];
 }
 
 /**
  * Get the legislative timeline/history for a bill
  */
 export const getBillTimeline = tool(
-  async ({ billNumber, sessionYear }) => {
+  withToolCache('get_bill_timeline', async ({ billNumber, sessionYear }, skipCache) => {
     const supabase = getSupabaseClient();
 
     // Normalize bill number
     const normalized = normalizeBillNumber(billNumber);
 
-    // Get bill ID
-    let billQuery = supabase
-      .from('bills')
-      .select('id, bill_number, sessions(year, session_code)')
-      .eq('bill_number', normalized);
-
-    if (sessionYear) {
-      const { data: sessionData } = await supabase
-        .from('sessions')
-        .select('id')
-        .eq('year', sessionYear)
-        .single();
+    // Bill and its actions are resolved server-side in a single round trip
+    const { data, error } = await supabase.rpc('get_bill_timeline', {
+      p_bill_number: normalized,
+      p_session_year: sessionYear,
+    });
 
-      if (sessionData) {
-        billQuery = billQuery.eq('session_id', sessionData.id);
-      }
+    if (error) {
+      console.error('Bill lookup error:', error);
+      skipCache();
+      return `Error looking up bill ${normalized}: ${error.message}`;
     }
 
-    const { data: billData, error: billError } = await billQuery.single();
-
-    if (billError || !billData) {
+    if (!data) {
       return `Bill ${normalized} not found${sessionYear ? ` for session ${sessionYear}` : ''}.`;
     }
 
-    const typedBill = billData as unknown as BillWithSession;
-
-    // Get actions
-    const { data: actionsData } = await supabase
-      .from('bill_actions')
-      .select('action_date, description, sequence_order')
-      .eq('bill_id', typedBill.id)
-      .order('sequence_order');
+    const typedBill = data as unknown as BillTimeline;
 
-    if (!actionsData || actionsData.length === 0) {
+    if (typedBill.actions.length === 0) {
       return `No actions found for ${normalized}.`;
     }
 
-    const typedActions = actionsData as BillAction[];
-    const sessions = typedBill.sessions;
-    const timeline = [`Timeline for ${typedBill.bill_number} (${sessions?.year} ${sessions?.session_code}):`];
-
-    typedActions.forEach((action) => {
-      timeline.push(`${action.action_date}: ${action.description}`);
-    });
+    const header = `Timeline for ${typedBill.bill_number} (${typedBill.session_year} ${typedBill.session_code}):`;
+    const lines = typedBill.actions.map((action) => `${action.action_date}: ${action.description}`);
 
-    return timeline.join('\n');
-  },
+    return `${header}\n${lines.join('\n')}`;
+  }),
   {
     name: 'get_bill_timeline',
     description:
@@ -6,6 +6,7 @@ import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
 import { normalizeBillNumber } from './utils';
+import { withToolCache } from './cache';
 
 // Type for hearing query with nested relations
 interface HearingWithRelations {
@@ -31,8 +32,14 @@ interface HearingWithRelations {
  * Get committee hearing information
  */
 export const getCommitteeHearings = tool(
-  async ({ billNumber, committeeId, upcomingOnly, pastDays, limit }) => {
+  withToolCache('get_committee_hearings', async ({ billNumber, committeeId, committeeName, upcomingOnly, pastDays, limit }, skipCache) => {
     const supabase = getSupabaseClient();
+    const normalized = billNumber ? normalizeBillNumber(billNumber) : null;
+
+    // Inner joins let bill number and committee name filters run in the same
+    // request instead of resolving the bill or committee ID first
+    const billsEmbed = normalized ? 'bills!inner' : 'bills';
+    const committeesEmbed = committeeName && !committeeId ? 'committees!inner' : 'committees';
 
     let query = supabase
       .from('bill_hearings')
@@ -41,31 +48,21 @@ export const getCommitteeHearings = tool(
         hearing_time,
         hearing_time_text,
         location,
-        bills(id, bill_number, title, sessions(year, session_code)),
-        committees(name)
+        ${billsEmbed}(id, bill_number, title, sessions(year, session_code)),
+        ${committeesEmbed}(name)
       `);
 
     // Filter by bill number if provided
-    if (billNumber) {
-      const normalized = normalizeBillNumber(billNumber);
-
-      // Get bill ID first
-      const { data: billData } = await supabase
-        .from('bills')
-        .select('id')
-        .eq('bill_number', normalized)
-        .single();
-
-      if (!billData) {
-        return `Bill ${normalized} not found.`;
-      }
-
-      query = query.eq('bill_id', billData.id);
+    if (normalized) {
+      query = query.eq('bills.bill_number', normalized);
     }
 
     // Filter by committee ID if provided
     if (committeeId) {
       query = query.eq('committee_id', committeeId);
+    } else if (committeeName) {
+      // Filter by committee name (partial match) if no ID was given
+      query = query.ilike('committees.name', `%${committeeName}%`);
     }
 
     // Date filtering
@@ -95,7 +92,16 @@ export const getCommitteeHearings = tool(
 
     const { data, error } = await query;
 
-    if (error || !data || data.length === 0) {
+    if (error) {
+      console.error('Hearing search error:', error);
+      skipCache();
+      return `Error searching for hearings: ${error.message}`;
+    }
+
+    if (!data || data.length === 0) {
+      if (normalized && !upcomingOnly && !pastDays) {
+        return `No hearings found for ${normalized}.`;
+      }
       if (upcomingOnly) {
         return 'No upcoming hearings found.';
       }
@@ -122,14 +128,15 @@ Location: ${hearing.location || 'TBD'}
     });
 
     return results.join('\n\n');
-  },
+  }),
   {
     name: 'get_committee_hearings',
     description:
-      'Get committee hearing information. Use this when the user asks about hearings - both upcoming and recent past hearings. If filtering by committee, first use get_committee_info to find the committee ID. Examples: "Which bills have upcoming hearings?", "What hearings happened this week?", "When is HB1366 being heard?"',
+      'Get committee hearing information. Use this when the user asks about hearings - both upcoming and recent past hearings. Filter by committee with committeeName (partial match), or committeeId if already known from get_committee_info. Examples: "Which bills have upcoming hearings?", "What hearings happened this week?", "When is HB1366 being heard?"',
     schema: z.object({
       billNumber: z.string().optional().describe('Optional bill number to filter by'),
-      committeeId: z.string().optional().describe('Optional committee UUID to filter by (use get_committee_info to find the ID first)'),
+      committeeId: z.string().optional().describe('Optional committee UUID to filter by (from get_committee_info)'),
+      committeeName: z.string().optional().describe('Optional committee name to filter by (partial match, e.g. "Health"). Ignored if committeeId is provided'),
       upcomingOnly: z.boolean().optional().describe('Set to true to only show hearings scheduled for today or in the future'),
       pastDays: z.number().optional().describe('Number of days to look back for recent past hearings (e.g., 7 for last week, 30 for last month). Cannot be used with upcomingOnly.'),
       limit: z.number().optional().describe('Maximum number of results to return (default 25)'),
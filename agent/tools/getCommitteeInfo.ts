@@ -5,6 +5,7 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
+import { withToolCache } from './cache';
 
 // Type for fuzzy search RPC result
 interface FuzzyCommitteeResult {
@@ -18,7 +19,7 @@ interface FuzzyCommitteeResult {
  * Get information about a committee
  */
 export const getCommitteeInfo = tool(
-  async ({ name }) => {
+  withToolCache('get_committee_info', async ({ name }, skipCache) => {
     const supabase = getSupabaseClient();
 
     // Use fuzzy search with pg_trgm for typo tolerance
@@ -34,7 +35,8 @@ export const getCommitteeInfo = tool(
 
     if (error) {
       console.error('Fuzzy search error:', error);
-      return `No committee found matching '${name}'. Try searching with different keywords.`;
+      skipCache();
+      return `Error searching for committees: ${error.message}`;
     }
 
     const committees =
@@ -46,30 +48,35 @@ export const getCommitteeInfo = tool(
       return `No committee found matching '${name}'. Try searching with different keywords like "health", "budget", or "education".`;
     }
 
-    // Get hearing counts for each committee
-    const results: string[] = [];
+    // Get hearing counts for each committee (all count queries run concurrently)
+    const today = new Date().toISOString().split('T')[0];
 
-    for (const committee of committees.slice(0, 5)) {
-      // Count upcoming hearings for this committee
-      const today = new Date().toISOString().split('T')[0];
-      const { count: upcomingCount } = await supabase
-        .from('bill_hearings')
-        .select('*', { count: 'exact', head: true })
-        .eq('committee_id', committee.id)
-        .gte('hearing_date', today);
+    const results = await Promise.all(committees.slice(0, 5).map(async (committee) => {
+      const [
+        { count: upcomingCount, error: upcomingError },
+        { count: totalCount, error: totalError },
+      ] = await Promise.all([
+        // Count upcoming hearings for this committee
+        supabase
+          .from('bill_hearings')
+          .select('id', { count: 'exact', head: true })
+          .eq('committee_id', committee.id)
+          .gte('hearing_date', today),
+        // Count total hearings
+        supabase
+          .from('bill_hearings')
+          .select('id', { count: 'exact', head: true })
+          .eq('committee_id', committee.id),
+      ]);
 
-      // Count total hearings
-      const { count: totalCount } = await supabase
-        .from('bill_hearings')
-        .select('*', { count: 'exact', head: true })
-        .eq('committee_id', committee.id);
+      if (upcomingError || totalError) {
+        skipCache();
+      }
 
-      const result = `- ${committee.name} (ID: ${committee.id})
+      return `- ${committee.name} (ID: ${committee.id})
   ${committee.description || 'No description available'}
   Upcoming hearings: ${upcomingCount || 0} | Total hearings: ${totalCount || 0}`;
-
-      results.push(result);
-    }
+    }));
 
     const header =
       committees.length === 1
@@ -77,7 +84,7 @@ export const getCommitteeInfo = tool(
         : `Found ${committees.length} committees matching '${name}' (showing top ${Math.min(committees.length, 5)}):`;
 
     return `${header}\n\n${results.join('\n\n')}`;
-  },
+  }),
   {
     name: 'get_committee_info',
     description:
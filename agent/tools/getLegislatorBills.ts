@@ -5,6 +5,8 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
+import { getSessionByYear } from './utils';
+import { withToolCache } from './cache';
 
 // Type for sponsored bill query result
 interface SponsoredBillResult {
@@ -25,15 +27,25 @@ interface SponsoredBillResult {
  * Get bills sponsored by a legislator
  */
 export const getLegislatorBills = tool(
-  async ({ legislatorId, sessionYear, includeCosponsored = false }) => {
+  withToolCache('get_legislator_bills', async ({ legislatorId, sessionYear, includeCosponsored = false, limit = 100 }, skipCache) => {
     const supabase = getSupabaseClient();
 
-    // First verify the legislator exists
-    const { data: legislator } = await supabase
-      .from('legislators')
-      .select('id, name')
-      .eq('id', legislatorId)
-      .single();
+    // Verify the legislator exists and resolve the session concurrently
+    const [{ data: legislator, error: legislatorError }, sessionData] = await Promise.all([
+      supabase
+        .from('legislators')
+        .select('id, name')
+        .eq('id', legislatorId)
+        .single(),
+      sessionYear ? getSessionByYear(sessionYear) : null,
+    ]);
+
+    // PGRST116 means no legislator has this ID
+    if (legislatorError && legislatorError.code !== 'PGRST116') {
+      console.error('Legislator lookup error:', legislatorError);
+      skipCache();
+      return `Error looking up legislator '${legislatorId}': ${legislatorError.message}`;
+    }
 
     if (!legislator) {
       return `Legislator with ID '${legislatorId}' not found. Use get_legislator_info first to find the legislator.`;
@@ -42,23 +54,23 @@ export const getLegislatorBills = tool(
     // Get session_legislator IDs for this legislator (possibly across multiple sessions)
     let sessionLegQuery = supabase
       .from('session_legislators')
-      .select('id, sessions(year, session_code)')
+      .select('id')
       .eq('legislator_id', legislatorId);
 
     if (sessionYear) {
       // Filter to specific session year
-      const { data: sessionData } = await supabase
-        .from('sessions')
-        .select('id')
-        .eq('year', sessionYear)
-        .single();
-
       if (sessionData) {
         sessionLegQuery = sessionLegQuery.eq('session_id', sessionData.id);
       }
     }
 
-    const { data: sessionLegislators } = await sessionLegQuery;
+    const { data: sessionLegislators, error: sessionLegError } = await sessionLegQuery;
+
+    if (sessionLegError) {
+      console.error('Error fetching session records:', sessionLegError);
+      skipCache();
+      return `Error fetching session records for ${legislator.name}.`;
+    }
 
     if (!sessionLegislators || sessionLegislators.length === 0) {
       return `${legislator.name} has no session records${sessionYear ? ` for ${sessionYear}` : ''}.`;
@@ -78,18 +90,20 @@ export const getLegislatorBills = tool(
           last_action,
           sessions(year, session_code)
         )
-      `)
+      `, { count: 'exact' })
       .in('session_legislator_id', sessionLegIds)
-      .order('is_primary', { ascending: false });
+      .order('is_primary', { ascending: false })
+      .limit(limit);
 
     if (!includeCosponsored) {
       sponsorQuery = sponsorQuery.eq('is_primary', true);
     }
 
-    const { data: sponsoredBills, error } = await sponsorQuery;
+    const { data: sponsoredBills, count: totalCount, error } = await sponsorQuery;
 
     if (error) {
       console.error('Error fetching sponsored bills:', error);
+      skipCache();
       return `Error fetching bills for ${legislator.name}.`;
     }
 
@@ -124,8 +138,13 @@ export const getLegislatorBills = tool(
       });
     }
 
+    if (totalCount && totalCount > typedBills.length) {
+      results.push('');
+      results.push(`(Showing ${typedBills.length} of ${totalCount} bills)`);
+    }
+
     return `Bills for ${legislator.name}${sessionYear ? ` (${sessionYear})` : ''}:\n\n${results.join('\n')}`;
-  },
+  }),
   {
     name: 'get_legislator_bills',
     description:
@@ -134,6 +153,7 @@ export const getLegislatorBills = tool(
       legislatorId: z.string().describe('Legislator UUID (get this from get_legislator_info first)'),
       sessionYear: z.number().optional().describe('Filter by session year (e.g., 2026)'),
       includeCosponsored: z.boolean().optional().default(false).describe('Include bills where legislator is a co-sponsor (default: false, only primary sponsored bills)'),
+      limit: z.number().optional().default(100).describe('Maximum number of bills to return (default 100)'),
     }),
   }
 );
@@ -5,6 +5,7 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
+import { withToolCache } from './cache';
 
 // Type for fuzzy search RPC result
 interface FuzzyLegislatorResult {
@@ -16,6 +17,7 @@ interface FuzzyLegislatorResult {
   years_served: number | null;
   is_active: boolean;
   similarity_score: number;
+  text_rank: number;
 }
 
 // Type for session legislator with session info
@@ -27,17 +29,53 @@ interface SessionLegislatorWithSession {
   } | null;
 }
 
+// The top match is treated as the answer when its full-text rank is at least
+// this multiple of the runner-up's
+const CONFIDENT_RANK_RATIO = 2;
+
+/**
+ * Pick a single high-confidence match, if there is one.
+ *
+ * A unique case-insensitive exact name match wins outright; otherwise the top
+ * result must clearly outrank the second on text_rank, the ordering the search
+ * itself uses. Trigram similarity isn't compared since it mostly rewards
+ * shorter names.
+ */
+function findConfidentMatch(
+  name: string,
+  legislators: FuzzyLegislatorResult[]
+): FuzzyLegislatorResult | null {
+  if (legislators.length < 2) {
+    return null;
+  }
+
+  const query = name.trim().toLowerCase();
+  const exactMatches = legislators.filter((leg) => leg.name.toLowerCase() === query);
+  if (exactMatches.length === 1) {
+    return exactMatches[0];
+  }
+
+  const [top, second] = legislators;
+  if (
+    exactMatches.length === 0 &&
+    second.text_rank > 0 &&
+    top.text_rank >= CONFIDENT_RANK_RATIO * second.text_rank
+  ) {
+    return top;
+  }
+
+  return null;
+}
+
 /**
  * Get information about a legislator
  */
 export const getLegislatorInfo = tool(
-  async ({ name }) => {
+  withToolCache('get_legislator_info', async ({ name }, skipCache) => {
     const supabase = getSupabaseClient();
 
-    // Use fuzzy search with pg_trgm for typo tolerance
-    // Note: search_legislators_fuzzy is a custom RPC function not in auto-generated types
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const { data: fuzzyMatches, error } = await (supabase as any).rpc(
+    // Full-text name matches rank first, with pg_trgm similarity for typo tolerance
+    const { data: fuzzyMatches, error } = await supabase.rpc(
       'search_legislators_fuzzy',
       {
         search_name: name,
@@ -49,7 +87,8 @@ export const getLegislatorInfo = tool(
 
     if (error) {
       console.error('Fuzzy search error:', error);
-      return `No legislator found matching '${name}'. Try searching with a different spelling or just the last name.`;
+      skipCache();
+      return `Error searching for legislators: ${error.message}`;
     }
 
     const legislators = fuzzyMatches && (fuzzyMatches as unknown[]).length > 0
@@ -60,13 +99,15 @@ export const getLegislatorInfo = tool(
       return `No legislator found matching '${name}'. Try searching with a different spelling or just the last name.`;
     }
 
-    // Get district info for all matching legislators (up to 5)
-    const topMatches = legislators.slice(0, 5);
-    const results: string[] = [];
+    // Only look up the clear winner when there is one; otherwise get district
+    // info for all matching legislators (up to 5)
+    const confidentMatch = findConfidentMatch(name, legislators);
+    const topMatches = confidentMatch ? [confidentMatch] : legislators.slice(0, 5);
 
-    for (const leg of topMatches) {
+    // District lookups are independent, so run them concurrently
+    const results = await Promise.all(topMatches.map(async (leg) => {
       // Get current district from most recent session
-      const { data: sessionLegData } = await supabase
+      const { data: sessionLegData, error: sessionLegError } = await supabase
         .from('session_legislators')
         .select(`
           district,
@@ -76,6 +117,10 @@ export const getLegislatorInfo = tool(
         .order('sessions(year)', { ascending: false })
         .limit(1);
 
+      if (sessionLegError) {
+        skipCache();
+      }
+
       const typedSessionLeg = sessionLegData as unknown as SessionLegislatorWithSession[];
       const currentDistrict = typedSessionLeg?.[0]?.district;
       const sessionInfo = typedSessionLeg?.[0]?.sessions;
@@ -84,11 +129,15 @@ export const getLegislatorInfo = tool(
         ? `District ${currentDistrict}${sessionInfo ? ` (${sessionInfo.year})` : ''}`
         : 'No district info';
 
-      const result = `- ${leg.name} (ID: ${leg.id})
+      return `- ${leg.name} (ID: ${leg.id})
   ${leg.party_affiliation || 'Unknown party'} | ${districtStr} | ${leg.is_active ? 'Active' : 'Inactive'}
   Type: ${leg.legislator_type || 'N/A'} | Years Served: ${leg.years_served || 'N/A'}`;
+    }));
 
-      results.push(result);
+    if (confidentMatch) {
+      const others = legislators.filter((leg) => leg.id !== confidentMatch.id);
+      const otherNames = others.slice(0, 4).map((leg) => `${leg.name} (ID: ${leg.id})`).join(', ');
+      return `Best match for '${name}':\n\n${results[0]}\n\nOther possible matches: ${otherNames}${others.length > 4 ? ` (+ ${others.length - 4} more)` : ''}`;
     }
 
     const header = legislators.length === 1
@@ -96,7 +145,7 @@ export const getLegislatorInfo = tool(
       : `Found ${legislators.length} legislators matching '${name}' (showing top ${topMatches.length}):`;
 
     return `${header}\n\n${results.join('\n\n')}`;
-  },
+  }),
   {
     name: 'get_legislator_info',
     description:
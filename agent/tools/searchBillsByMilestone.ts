@@ -5,6 +5,7 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
+import { withToolCache } from './cache';
 
 // Milestone enum values
 const MILESTONES = [
@@ -41,7 +42,7 @@ interface BillWithMilestone {
  * Search bills by legislative milestone
  */
 export const searchBillsByMilestone = tool(
-  async ({ milestone, sessionYear, chamber, limit = 20 }) => {
+  withToolCache('search_bills_by_milestone', async ({ milestone, sessionYear, chamber, limit = 20 }, skipCache) => {
     const supabase = getSupabaseClient();
 
     const pattern = MILESTONE_PATTERNS[milestone as Milestone];
@@ -67,20 +68,6 @@ export const searchBillsByMilestone = tool(
       countQuery = countQuery.ilike('bills.bill_number', prefix);
     }
 
-    const { data: countData } = await countQuery;
-
-    // Count unique bill IDs from the count query
-    const uniqueBillIdsForCount = new Set<string>();
-    if (countData) {
-      for (const row of countData) {
-        const bill = row.bills as unknown as { id: string };
-        if (bill?.id) {
-          uniqueBillIdsForCount.add(bill.id);
-        }
-      }
-    }
-    const totalCount = uniqueBillIdsForCount.size;
-
     // Build the query to find bills with matching actions
     let query = supabase
       .from('bill_actions')
@@ -110,13 +97,31 @@ export const searchBillsByMilestone = tool(
     // Order by action date descending - fetch more to account for deduplication
     query = query.order('action_date', { ascending: false }).limit(limit * 3);
 
-    const { data, error } = await query;
+    // The count and page queries are independent, so run them concurrently
+    const [{ data: countData, error: countError }, { data, error }] = await Promise.all([countQuery, query]);
+
+    // Count unique bill IDs from the count query
+    const uniqueBillIdsForCount = new Set<string>();
+    if (countData) {
+      for (const row of countData) {
+        const bill = row.bills as unknown as { id: string };
+        if (bill?.id) {
+          uniqueBillIdsForCount.add(bill.id);
+        }
+      }
+    }
+    const totalCount = uniqueBillIdsForCount.size;
 
     if (error) {
       console.error('Milestone search error:', error);
+      skipCache();
       return `Error searching for bills: ${error.message}`;
     }
 
+    if (countError) {
+      skipCache();
+    }
+
     if (!data || data.length === 0) {
       const yearStr = sessionYear ? ` in ${sessionYear}` : '';
       const chamberStr = chamber ? ` from the ${chamber}` : '';
@@ -173,7 +178,7 @@ ${milestoneLabel}: ${bill.action_date}
       : `Found ${totalCount}${chamberStr} bill${totalCount === 1 ? '' : 's'} that ${milestoneLabel}${yearStr}:\n\n`;
 
     return header + formattedResults.join('\n\n');
-  },
+  }),
   {
     name: 'search_bills_by_milestone',
     description:
@@ -5,62 +5,63 @@
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
 import { getSupabaseClient } from '@/database/client';
-import { Database } from '@/database/types';
+import { getSessionByYear } from './utils';
+import { withToolCache } from './cache';
 
-type Bill = Database['public']['Tables']['bills']['Row'];
-
-// Type for bill query with session relation
-interface BillWithSession extends Omit<Bill, 'sessions'> {
-  sessions: {
-    year: number;
-    session_code: string;
-  } | null;
+// Type for bill query result
+interface BillSummary {
+  id: string;
+  bill_number: string;
+  title: string | null;
 }
 
 /**
  * Search bills by legislative session year
  */
 export const searchBillsByYear = tool(
-  async ({ sessionYear, limit = 20 }) => {
+  withToolCache('search_bills_by_year', async ({ sessionYear, limit = 20 }, skipCache) => {
     const supabase = getSupabaseClient();
 
     // Get session
-    const { data: sessionData, error: sessionError } = await supabase
-      .from('sessions')
-      .select('id')
-      .eq('year', sessionYear)
-      .single();
+    const sessionData = await getSessionByYear(sessionYear);
 
-    if (sessionError || !sessionData) {
+    if (!sessionData) {
       return `No session found for year ${sessionYear}.`;
     }
 
-    // First get total count
-    const { count: totalCount } = await supabase
-      .from('bills')
-      .select('id', { count: 'exact', head: true })
-      .eq('session_id', sessionData.id);
+    // Get total count and the limited page of bills concurrently
+    const [{ count: totalCount, error: countError }, { data, error }] = await Promise.all([
+      supabase
+        .from('bills')
+        .select('id', { count: 'exact', head: true })
+        .eq('session_id', sessionData.id),
+      supabase
+        .from('bills')
+        .select('id, bill_number, title')
+        .eq('session_id', sessionData.id)
+        .order('bill_number')
+        .limit(limit),
+    ]);
+
+    if (error) {
+      console.error('Bill search error:', error);
+      skipCache();
+      return `Error searching for bills: ${error.message}`;
+    }
 
-    // Get bills with limit
-    const { data, error } = await supabase
-      .from('bills')
-      .select(`
-        id,
-        bill_number,
-        title,
-        sessions(year, session_code)
-      `)
-      .eq('session_id', sessionData.id)
-      .limit(limit);
+    if (countError) {
+      skipCache();
+    }
 
-    if (error || !data || data.length === 0) {
+    if (!data || data.length === 0) {
       return `No bills found for ${sessionYear}.`;
     }
 
-    const typedBills = data as unknown as BillWithSession[];
+    // Every bill belongs to the session looked up above, so session info
+    // doesn't need to be embedded per row
+    const typedBills = data as BillSummary[];
     const results = typedBills.map((bill) => {
-      const sessions = bill.sessions;
-      return `${bill.bill_number} (ID: ${bill.id}) - ${sessions?.year} ${sessions?.session_code}: ${bill.title || 'No title'}`;
+      return `${bill.bill_number} (ID: ${bill.id}) - ${sessionYear} ${sessionData.session_code}: ${bill.title || 'No title'}`;
     });
 
     const total = totalCount || data.length;
@@ -70,7 +71,7 @@ export const searchBillsByYear = tool(
       : `Found ${total} bill${total === 1 ? '' : 's'} for ${sessionYear}:\n\n`;
 
     return header + results.join('\n');
-  },
+  }),
   {
     name: 'search_bills_by_year',
     description:
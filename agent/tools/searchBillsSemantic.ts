@@ -4,13 +4,59 @@
 
 import { tool } from '@langchain/core/tools';
 import { z } from 'zod';
-import { OpenAIEmbeddings } from '@langchain/openai';
-import {
-  SupabaseVectorStore,
-  SupabaseFilterRPCCall,
-} from '@langchain/community/vectorstores/supabase';
 import { getSupabaseClient } from '@/database/client';
 import { MILESTONE_PATTERNS, MILESTONES, type Milestone } from './searchBillsByMilestone';
+import { EmbeddingIndex, TTLCache } from './cache';
+import { EMBEDDING_MODEL, embedQuery } from './embeddings';
+
+// Query embeddings are deterministic for a given model, so repeated questions
+// can skip the OpenAI round trip entirely. Vectors are stored as float32 (the
+// precision the API returns), half the memory of a number[] of doubles.
+const queryEmbeddingCache = new TTLCache<Float32Array>(2000, 5 * 60 * 1000);
+
+// Formatted responses keyed by the full set of tool arguments
+const responseCache = new TTLCache<string>(2000, 5 * 60 * 1000);
+
+// Recent query embeddings, tagged by filter arguments and pointing at their
+// response cache key, so near-duplicate wordings of a question reuse the answer
+const EMBEDDING_DIMENSIONS = 1536;
+const NEAR_DUPLICATE_SIMILARITY = 0.97;
+const recentQueries = new EmbeddingIndex(EMBEDDING_DIMENSIONS, 500);
+
+// Characters of matched chunk content shown per result
+const SNIPPET_LENGTH = 300;
+
+/**
+ * Normalize a query string for use as a cache key
+ */
+function normalizeQuery(query: string): string {
+  return query.trim().toLowerCase().replace(/\s+/g, ' ');
+}
+
+/**
+ * Embed a query, reusing a cached vector for repeated questions
+ */
+async function getQueryEmbedding(query: string, normalizedQuery: string): Promise<number[]> {
+  const embeddingKey = `${EMBEDDING_MODEL}:${normalizedQuery}`;
+  const cached = queryEmbeddingCache.get(embeddingKey);
+  if (cached) {
+    return Array.from(cached);
+  }
+
+  const queryEmbedding = await embedQuery(query);
+  queryEmbeddingCache.set(embeddingKey, Float32Array.from(queryEmbedding));
+  return queryEmbedding;
+}
+
+/**
+ * Hit/miss counters for the semantic search caches
+ */
+export function getSemanticSearchCacheStats() {
+  return {
+    embeddings: queryEmbeddingCache.getStats(),
+    responses: responseCache.getStats(),
+  };
+}
 
 // Type for embedding metadata
 interface BillEmbeddingMetadata {
@@ -26,86 +72,125 @@ interface BillEmbeddingMetadata {
   content_type?: string;
 }
 
+// Row returned by the match_bill_embeddings RPC (embedding column excluded)
+interface MatchedEmbedding {
+  id: string;
+  content: string;
+  metadata: BillEmbeddingMetadata | null;
+  similarity: number;
+}
+
 /**
  * Search for bills using semantic similarity with optional metadata filters
  */
 export const searchBillsSemantic = tool(
   async ({ query, limit = 20, sessionYear, sessionCode, sponsorName, committeeName, chamber, milestone }) => {
+    const normalizedQuery = normalizeQuery(query);
+    const filterKey = JSON.stringify([
+      EMBEDDING_MODEL,
+      limit,
+      sessionYear ?? null,
+      sessionCode ?? null,
+      sponsorName ?? null,
+      committeeName ?? null,
+      chamber ?? null,
+      milestone ?? null,
+    ]);
+    const responseKey = `${filterKey}|${normalizedQuery}`;
+
+    const cachedResponse = responseCache.get(responseKey);
+    if (cachedResponse !== undefined) {
+      return cachedResponse;
+    }
+
     const supabase = getSupabaseClient();
 
-    // If milestone filter is specified, first get bill IDs that have reached that milestone
-    let milestoneBillIds: Set<string> | null = null;
-    if (milestone) {
-      const pattern = MILESTONE_PATTERNS[milestone as Milestone];
-      const { data: milestoneData } = await supabase
-        .from('bill_actions')
-        .select('bill_id')
-        .ilike('description', pattern);
-
-      if (!milestoneData || milestoneData.length === 0) {
-        return `No bills found that have ${milestone.replace(/_/g, ' ')} matching your query.`;
+    // If milestone filter is specified, get bill IDs that have reached that milestone
+    const milestoneQuery = milestone
+      ? supabase
+          .from('bill_actions')
+          .select('bill_id')
+          .ilike('description', MILESTONE_PATTERNS[milestone as Milestone])
+      : null;
+
+    try {
+      // Search with a higher limit to get total count of available results
+      // This helps inform the user if there are more results than shown
+      const searchLimit = Math.max(limit * 3, 50);
+
+      // Embedding the query and the milestone lookup are independent
+      const [queryEmbedding, milestoneResult] = await Promise.all([
+        getQueryEmbedding(query, normalizedQuery),
+        milestoneQuery,
+      ]);
+
+      // A differently worded but near-identical question with the same filters
+      // can reuse that question's response
+      const nearDuplicate = recentQueries.findNearest(queryEmbedding, filterKey, NEAR_DUPLICATE_SIMILARITY);
+      if (nearDuplicate) {
+        const nearResponse = responseCache.get(nearDuplicate.value);
+        if (nearResponse !== undefined) {
+          return nearResponse;
+        }
       }
 
-      milestoneBillIds = new Set(milestoneData.map((row) => row.bill_id));
-    }
+      let milestoneBillIds: Set<string> | null = null;
+      if (milestoneResult) {
+        const milestoneData = milestoneResult.data;
 
-    // Initialize embeddings and vector store
-    const embeddings = new OpenAIEmbeddings({
-      model: 'text-embedding-3-small',
-    });
+        if (!milestoneData || milestoneData.length === 0) {
+          return `No bills found that have ${milestone!.replace(/_/g, ' ')} matching your query.`;
+        }
 
-    const vectorStore = new SupabaseVectorStore(embeddings, {
-      client: supabase,
-      tableName: 'bill_embeddings',
-      queryName: 'match_bill_embeddings',
-    });
+        milestoneBillIds = new Set(milestoneData.map((row) => row.bill_id));
+      }
 
-    // Build metadata filter function
-    // With function-type filters, PostgREST applies filters AFTER the RPC returns results
-    // LangChain automatically adds .limit(k) after our filter function returns
-    const filter: SupabaseFilterRPCCall = (rpc) => {
-      let query = rpc;
+      // Call the RPC directly so the 1536-dim embedding column is not sent
+      // back and chunk content is truncated server-side.
+      // PostgREST applies these metadata filters AFTER the RPC returns its
+      // candidates (match_count defaults to 500), then limits the result.
+      let rpcQuery = supabase
+        .rpc('match_bill_embeddings', {
+          query_embedding: JSON.stringify(queryEmbedding),
+          snippet_len: SNIPPET_LENGTH,
+        })
+        .select('id, content, metadata, similarity');
 
       // Filter by session year
       if (sessionYear) {
-        query = query.filter('metadata->session_year', 'eq', sessionYear);
+        rpcQuery = rpcQuery.filter('metadata->session_year', 'eq', sessionYear);
       }
 
       // Filter by session code
       if (sessionCode) {
-        query = query.filter('metadata->>session_code', 'eq', sessionCode);
+        rpcQuery = rpcQuery.filter('metadata->>session_code', 'eq', sessionCode);
       }
 
       // Filter by sponsor name (partial match with ILIKE)
       if (sponsorName) {
-        query = query.ilike('metadata->>primary_sponsor_name', `%${sponsorName}%`);
+        rpcQuery = rpcQuery.ilike('metadata->>primary_sponsor_name', `%${sponsorName}%`);
       }
 
       // Filter by committee name (check if array contains value)
       // Note: This uses JSONB containment - checks if committee_names array includes the value
       if (committeeName) {
-        query = query.contains('metadata->committee_names', JSON.stringify([committeeName]));
+        rpcQuery = rpcQuery.contains('metadata->committee_names', JSON.stringify([committeeName]));
       }
 
       // Filter by chamber (House or Senate) using bill_number prefix
       // House bills start with H (HB, HJR, HCR), Senate bills start with S (SB, SJR, SCR)
       if (chamber) {
         const prefix = chamber.toLowerCase() === 'house' ? 'H%' : 'S%';
-        query = query.ilike('metadata->>bill_number', prefix);
+        rpcQuery = rpcQuery.ilike('metadata->>bill_number', prefix);
       }
 
-      return query;
-    };
+      const { data: matches, error: searchError } = await rpcQuery.limit(searchLimit);
 
-    try {
-      // Search with a higher limit to get total count of available results
-      // This helps inform the user if there are more results than shown
-      const searchLimit = Math.max(limit * 3, 50);
-      const allResults = await vectorStore.similaritySearchWithScore(
-        query,
-        searchLimit,
-        filter
-      );
+      if (searchError) {
+        throw searchError;
+      }
+
+      const allResults = (matches ?? []) as unknown as MatchedEmbedding[];
 
       if (allResults.length === 0) {
         return 'No bills found matching that query with the given filters.';
@@ -114,8 +199,8 @@ export const searchBillsSemantic = tool(
       // Filter by milestone if specified
       let filteredResults = allResults;
       if (milestoneBillIds) {
-        filteredResults = allResults.filter(([doc]) => {
-          const billId = (doc.metadata as BillEmbeddingMetadata).bill_id;
+        filteredResults = allResults.filter((match) => {
+          const billId = match.metadata?.bill_id;
           return billId && milestoneBillIds.has(billId);
         });
 
@@ -131,7 +216,7 @@ export const searchBillsSemantic = tool(
 
       // Fetch bill summaries for all results to show
       const billIds = resultsToShow
-        .map(([doc]) => (doc.metadata as BillEmbeddingMetadata).bill_id)
+        .map((match) => match.metadata?.bill_id)
         .filter((id): id is string => !!id);
 
       const { data: bills } = await supabase
@@ -142,9 +227,9 @@ export const searchBillsSemantic = tool(
       const billsMap = new Map(bills?.map(b => [b.id, b]) || []);
 
       // Format results
-      const formattedResults = resultsToShow.map(([doc, score]) => {
-        const meta = (doc.metadata || {}) as BillEmbeddingMetadata;
-        const content = doc.pageContent || '';
+      const formattedResults = resultsToShow.map((match) => {
+        const meta = match.metadata || {};
+        const content = match.content || '';
         const billData = billsMap.get(meta.bill_id || '');
 
         // Build sponsor string with ID for clickable links
@@ -172,9 +257,6 @@ export const searchBillsSemantic = tool(
         const committees = meta.committee_names ? meta.committee_names.join(', ') : '';
         const committeesStr = committees ? `\nCommittees: ${committees}` : '';
 
-        // Convert score to similarity (LangChain returns distance, we want similarity)
-        const similarity = 1 - score;
-
         // Format with summary and matched content sections
         const summarySection = billData?.title
           ? `Summary: ${billData.title}\n`
@@ -184,8 +266,8 @@ export const searchBillsSemantic = tool(
 Session: ${meta.session_year} ${meta.session_code || ''}
 Document Type: ${meta.content_type || 'Unknown'}
 Sponsor: ${sponsorStr}${cosponsorsStr}${committeesStr}
-Similarity: ${similarity.toFixed(2)}
-${summarySection}Matched Content: ${content.substring(0, 300)}...
+Similarity: ${match.similarity.toFixed(2)}
+${summarySection}Matched Content: ${content.substring(0, SNIPPET_LENGTH)}...
 ---`;
       });
 
@@ -194,7 +276,10 @@ ${summarySection}Matched Content: ${content.substring(0, 300)}...
         ? `Found ${totalCount} matching results. Showing top ${limit}:\n\n`
         : `Found ${totalCount} matching result${totalCount === 1 ? '' : 's'}:\n\n`;
 
-      return header + formattedResults.join('\n\n');
+      const response = header + formattedResults.join('\n\n');
+      responseCache.set(responseKey, response);
+      recentQueries.add(queryEmbedding, filterKey, responseKey);
+      return response;
     } catch (error) {
       console.error('Semantic search error:', error);
       return 'Error searching bills. Please try again.';
@@ -2,10 +2,54 @@
  * Shared utility functions for agent tools.
  */
 
+import { getSupabaseClient } from '@/database/client';
+
+// Bill number without a space between prefix and number (e.g., "HB1366")
+const UNSPACED_BILL_NUMBER = /^([A-Z]+)(\d+)$/;
+
 /**
  * Normalize bill number to match database format (e.g., "HB1366" -> "HB 1366")
  */
 export function normalizeBillNumber(billNumber: string): string {
   const cleaned = billNumber.toUpperCase().trim();
-  return cleaned.replace(/^([A-Z]+)(\d+)$/, '$1 $2');
+  return cleaned.replace(UNSPACED_BILL_NUMBER, '$1 $2');
+}
+
+// Session reference as returned by getSessionByYear
+export interface SessionRef {
+  id: string;
+  session_code: string;
+}
+
+// Sessions never change once created, so year lookups are cached for the
+// lifetime of the process
+const sessionsByYear = new Map<number, SessionRef>();
+
+/**
+ * Get the session for a year, caching successful lookups
+ *
+ * @returns The session, or null if there isn't exactly one for the year
+ * @throws {Error} If the lookup itself fails
+ */
+export async function getSessionByYear(year: number): Promise<SessionRef | null> {
+  const cached = sessionsByYear.get(year);
+  if (cached) {
+    return cached;
+  }
+
+  const { data, error } = await getSupabaseClient()
+    .from('sessions')
+    .select('id, session_code')
+    .eq('year', year)
+    .single();
+
+  // PGRST116 means the year didn't match exactly one row
+  if (error && error.code !== 'PGRST116') {
+    throw new Error(`Failed to get session for ${year}: ${error.message}`);
+  }
+
+  if (data) {
+    sessionsByYear.set(year, data);
+  }
+  return data ?? null;
 }
@@ -9,10 +9,163 @@ import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import { Database } from '@/database/types';
 
 // Type aliases for convenience
-type Bill = Database['public']['Tables']['bills']['Row'];
 type BillInsert = Database['public']['Tables']['bills']['Insert'];
 type BillDocument = Database['public']['Tables']['bill_documents']['Row'];
 
+/**
+ * Timeout and retry budget for Supabase HTTP requests
+ */
+interface RequestPolicy {
+  /** Upper bound on a single request, so a stalled connection fails instead of hanging */
+  timeoutMs: number;
+  /** Total attempts including the first */
+  maxAttempts: number;
+}
+
+// Ingestion workers can wait out a slow or briefly unavailable database
+const INGESTION_REQUEST_POLICY: RequestPolicy = { timeoutMs: 30000, maxAttempts: 5 };
+
+// Agent tools and API routes answer a waiting user: fail fast, retry once
+const INTERACTIVE_REQUEST_POLICY: RequestPolicy = { timeoutMs: 10000, maxAttempts: 2 };
+
+// Transient failures (network errors, timeouts, and the statuses below) are
+// retried with exponential backoff and full jitter
+const RETRY_BASE_DELAY_MS = 500;
+const RETRY_MAX_DELAY_MS = 10000;
+const RETRYABLE_STATUSES = new Set([429, 502, 503, 504]);
+
+// RPC functions that can be replayed safely: reads, and writes that replace a
+// bill's rows wholesale
+const IDEMPOTENT_RPCS = new Set([
+  'get_bill_detail',
+  'get_bill_timeline',
+  'ingest_bill',
+  'match_bill_embeddings',
+  'match_bill_embeddings_filtered',
+  'search_legislators_fuzzy',
+]);
+
+const RPC_PATH_PATTERN = /\/rest\/v1\/rpc\/([^/?]+)/;
+
+// PostgREST caps rows per response, so bulk prefetches page through results
+const PREFETCH_PAGE_SIZE = 1000;
+
+// Document title hierarchy for determining the most recent bill version
+const DOCUMENT_HIERARCHY = [
+  'truly agreed',
+  'senate substitute',
+  'senate committee substitute',
+  'perfected',
+  'committee',
+  'introduced',
+];
+
+// All hierarchy terms as one alternation, so a title is scanned once for every
+// term. No term starts inside a higher-priority one, so non-overlapping
+// matches still find the best rank.
+const DOCUMENT_HIERARCHY_PATTERN = new RegExp(DOCUMENT_HIERARCHY.join('|'), 'g');
+const DOCUMENT_HIERARCHY_RANK = new Map(DOCUMENT_HIERARCHY.map((term, rank) => [term, rank]));
+
+/**
+ * Rank of the highest-priority hierarchy term in a lowercased document title
+ *
+ * @returns Index into DOCUMENT_HIERARCHY, or -1 if no term appears
+ */
+function getHierarchyRank(titleLower: string): number {
+  let best = -1;
+  for (const match of titleLower.matchAll(DOCUMENT_HIERARCHY_PATTERN)) {
+    const rank = DOCUMENT_HIERARCHY_RANK.get(match[0])!;
+    if (best === -1 || rank < best) best = rank;
+  }
+  return best;
+}
+
+/**
+ * Whether replaying a PostgREST request can't duplicate its effect: reads,
+ * updates and deletes, upserts (a Prefer resolution header), and the RPCs in
+ * IDEMPOTENT_RPCS. Plain inserts create new rows with server-generated IDs,
+ * so a replay after a lost response would insert them twice.
+ */
+function isIdempotentRequest(input: Parameters<typeof fetch>[0], init?: RequestInit): boolean {
+  const method = (init?.method ?? (input instanceof Request ? input.method : 'GET')).toUpperCase();
+  if (method !== 'POST') return true;
+
+  const url = input instanceof Request ? input.url : String(input);
+  const rpc = url.match(RPC_PATH_PATTERN);
+  if (rpc) return IDEMPOTENT_RPCS.has(rpc[1]);
+
+  const prefer = new Headers(init?.headers ?? (input instanceof Request ? input.headers : undefined)).get('Prefer');
+  return prefer?.includes('resolution=') ?? false;
+}
+
+/**
+ * Build a fetch that aborts requests exceeding the policy's timeout (while
+ * still honoring any caller-provided abort signal) and retries transient
+ * failures. Requests aborted by the caller and non-transient statuses (4xx,
+ * 500) are not retried. Non-idempotent requests are only retried on a 429,
+ * which the server sends without processing the request.
+ */
+function createRetryingFetch(policy: RequestPolicy): typeof fetch {
+  return async (input, init) => {
+    const idempotent = isIdempotentRequest(input, init);
+
+    for (let attempt = 1; ; attempt++) {
+      const timeoutSignal = AbortSignal.timeout(policy.timeoutMs);
+      const signal = init?.signal ? AbortSignal.any([init.signal, timeoutSignal]) : timeoutSignal;
+
+      try {
+        const response = await fetch(input, { ...init, signal });
+        const retryable = idempotent ? RETRYABLE_STATUSES.has(response.status) : response.status === 429;
+        if (!retryable || attempt >= policy.maxAttempts) {
+          return response;
+        }
+        await response.body?.cancel();
+      } catch (error) {
+        // A failed non-idempotent request may still have been applied
+        if (!idempotent || init?.signal?.aborted || attempt >= policy.maxAttempts) throw error;
+      }
+
+      const backoffCap = Math.min(RETRY_MAX_DELAY_MS, RETRY_BASE_DELAY_MS * 2 ** (attempt - 1));
+      await new Promise((resolve) => setTimeout(resolve, Math.random() * backoffCap));
+    }
+  };
+}
+
+/**
+ * Create a server-side Supabase client with the given request policy
+ *
+ * @throws {Error} If credentials are not provided
+ */
+function createSupabaseClient(
+  policy: RequestPolicy,
+  supabaseUrl?: string,
+  supabaseKey?: string
+): SupabaseClient<Database> {
+  const url = supabaseUrl || process.env.SUPABASE_URL;
+  const key = supabaseKey || process.env.SUPABASE_KEY;
+
+  if (!url || !key) {
+    throw new Error(
+      'Supabase credentials not found. ' +
+      'Set SUPABASE_URL and SUPABASE_KEY environment variables or pass them as arguments.'
+    );
+  }
+
+  // Static API key: no user session to persist or refresh. Requests go
+  // through Node's global fetch, whose connection pool keeps sockets to the
+  // Supabase host alive across calls.
+  return createClient<Database>(url, key, {
+    auth: {
+      persistSession: false,
+      autoRefreshToken: false,
+      detectSessionInUrl: false,
+    },
+    global: {
+      fetch: createRetryingFetch(policy),
+    },
+  });
+}
+
 /**
  * Legislator data for upsert operations (without auto-generated fields)
  */
@@ -21,6 +174,22 @@ export type LegislatorData = Omit<
   'id' | 'created_at' | 'updated_at'
 >;
 
+/**
+ * Build the legislators row for an upsert, mapping empty fields to null
+ */
+function toLegislatorRecord(legislatorData: LegislatorData) {
+  return {
+    name: legislatorData.name,
+    legislator_type: legislatorData.legislator_type || null,
+    party_affiliation: legislatorData.party_affiliation || null,
+    year_elected: legislatorData.year_elected || null,
+    years_served: legislatorData.years_served || null,
+    picture_url: legislatorData.picture_url || null,
+    is_active: legislatorData.is_active !== undefined ? legislatorData.is_active : true,
+    profile_url: legislatorData.profile_url || null,
+  };
+}
+
 /**
  * Sponsor data for bill insertion (without bill_id, added during insertion)
  */
@@ -56,6 +225,17 @@ export type DocumentData = Omit<
   'bill_id' | 'id' | 'created_at'
 >;
 
+/**
+ * A session_legislator row flattened with its legislator's identifying fields
+ */
+export interface SessionLegislatorRecord {
+  id: string;
+  district: string | null;
+  name: string;
+  legislator_type: string | null;
+  profile_url: string | null;
+}
+
 /**
  * Nested query result types
  */
@@ -77,11 +257,15 @@ interface CommitteeQueryResult {
   } | null;
 }
 
-interface BillWithSessionQuery extends Bill {
+interface BillMetadataQuery {
+  id: string;
+  bill_number: string;
   sessions: {
     year: number;
     session_code: string;
   } | null;
+  bill_sponsors: SponsorQueryResult[] | null;
+  bill_hearings: CommitteeQueryResult[] | null;
 }
 
 /**
@@ -89,6 +273,12 @@ interface BillWithSessionQuery extends Bill {
  */
 export class DatabaseClient {
   private _client: SupabaseClient<Database>;
+  private committeeCache: Map<string, string> = new Map();
+  private sessionCache: Map<string, string> = new Map();
+  private legislatorIdCache: Map<string, string> = new Map();
+  private legislatorsPrefetched = false;
+  private billIdCache: Map<string, string> = new Map();
+  private prefetchedBillSessions: Set<string> = new Set();
 
   /**
    * Initialize the database connection.
@@ -98,17 +288,7 @@ export class DatabaseClient {
    * @throws {Error} If credentials are not provided
    */
   constructor(supabaseUrl?: string, supabaseKey?: string) {
-    const url = supabaseUrl || process.env.SUPABASE_URL;
-    const key = supabaseKey || process.env.SUPABASE_KEY;
-
-    if (!url || !key) {
-      throw new Error(
-        'Supabase credentials not found. ' +
-        'Set SUPABASE_URL and SUPABASE_KEY environment variables or pass them as arguments.'
-      );
-    }
-
-    this._client = createClient<Database>(url, key);
+    this._client = createSupabaseClient(INGESTION_REQUEST_POLICY, supabaseUrl, supabaseKey);
   }
 
   /**
@@ -131,72 +311,195 @@ export class DatabaseClient {
    * @returns Session UUID
    */
   async getOrCreateSession(year: number, sessionCode: string): Promise<string> {
+    const cacheKey = `${year}:${sessionCode}`;
+    const cachedId = this.sessionCache.get(cacheKey);
+    if (cachedId) {
+      return cachedId;
+    }
+
     try {
-      // Try to find existing session
-      const { data: existingData, error: selectError } = await this._client
+      // Insert, or return the existing row on the (year, session_code) conflict
+      const { data, error } = await this._client
         .from('sessions')
+        .upsert({ year, session_code: sessionCode }, { onConflict: 'year,session_code' })
         .select('id')
-        .eq('year', year)
-        .eq('session_code', sessionCode);
+        .single();
 
-      if (selectError) throw selectError;
+      if (error) throw error;
+      if (!data) throw new Error('Failed to create session');
+
+      this.sessionCache.set(cacheKey, data.id);
+      return data.id;
+    } catch (error) {
+      throw new Error(`Failed to get or create session: ${error}`);
+    }
+  }
+
+  /**
+   * Check whether an ingestion phase already completed for a session.
+   *
+   * @param sessionId - Session UUID
+   * @param phase - Phase name (e.g., 'house_bills')
+   * @returns True if the phase was marked done
+   */
+  async isSessionPhaseDone(sessionId: string, phase: string): Promise<boolean> {
+    try {
+      const { data, error } = await this._client
+        .from('session_scrape_runs')
+        .select('session_id')
+        .eq('session_id', sessionId)
+        .eq('phase', phase)
+        .limit(1);
+
+      if (error) throw error;
+
+      return (data && data.length > 0) || false;
+    } catch (error) {
+      throw new Error(`Failed to check session phase: ${error}`);
+    }
+  }
 
-      if (existingData && existingData.length > 0) {
-        return existingData[0].id;
+  /**
+   * Mark an ingestion phase as completed for a session.
+   *
+   * @param sessionId - Session UUID
+   * @param phase - Phase name (e.g., 'house_bills')
+   */
+  async markSessionPhaseDone(sessionId: string, phase: string): Promise<void> {
+    try {
+      const { error } = await this._client
+        .from('session_scrape_runs')
+        .upsert(
+          { session_id: sessionId, phase, completed_at: new Date().toISOString() },
+          { onConflict: 'session_id,phase' }
+        );
+
+      if (error) throw error;
+    } catch (error) {
+      throw new Error(`Failed to mark session phase done: ${error}`);
+    }
+  }
+
+  /**
+   * Load every legislator ID into the legislator cache, so upserts skip the
+   * per-legislator lookup by name. After this, a name missing from the cache
+   * is known to be new.
+   *
+   * @returns Number of legislators cached
+   */
+  async prefetchLegislators(): Promise<number> {
+    try {
+      for (let from = 0; ; from += PREFETCH_PAGE_SIZE) {
+        const { data, error } = await this._client
+          .from('legislators')
+          .select('id, name')
+          .order('id')
+          .range(from, from + PREFETCH_PAGE_SIZE - 1);
+
+        if (error) throw error;
+
+        for (const legislator of data || []) {
+          this.legislatorIdCache.set(legislator.name, legislator.id);
+        }
+
+        if (!data || data.length < PREFETCH_PAGE_SIZE) break;
       }
 
-      // Create new session
-      const { data: insertData, error: insertError } = await this._client
-        .from('sessions')
-        .insert({
-          year,
-          session_code: sessionCode,
-        })
-        .select('id')
-        .single();
+      this.legislatorsPrefetched = true;
+      return this.legislatorIdCache.size;
+    } catch (error) {
+      throw new Error(`Failed to prefetch legislators: ${error}`);
+    }
+  }
+
+  /**
+   * Load the IDs of every bill already stored for a session, so bill upserts
+   * and existence checks for that session skip the per-bill lookup.
+   *
+   * @param sessionId - Session UUID
+   * @returns Number of bills cached
+   */
+  async prefetchSessionBills(sessionId: string): Promise<number> {
+    try {
+      let count = 0;
 
-      if (insertError) throw insertError;
-      if (!insertData) throw new Error('Failed to create session');
+      for (let from = 0; ; from += PREFETCH_PAGE_SIZE) {
+        const { data, error } = await this._client
+          .from('bills')
+          .select('id, bill_number')
+          .eq('session_id', sessionId)
+          .order('id')
+          .range(from, from + PREFETCH_PAGE_SIZE - 1);
 
-      return insertData.id;
+        if (error) throw error;
+
+        for (const bill of data || []) {
+          this.billIdCache.set(`${sessionId}:${bill.bill_number}`, bill.id);
+        }
+        count += data?.length || 0;
+
+        if (!data || data.length < PREFETCH_PAGE_SIZE) break;
+      }
+
+      this.prefetchedBillSessions.add(sessionId);
+      return count;
     } catch (error) {
-      throw new Error(`Failed to get or create session: ${error}`);
+      throw new Error(`Failed to prefetch session bills: ${error}`);
     }
   }
 
+  /**
+   * Look up a bill ID, using the prefetched IDs when the session was loaded
+   */
+  private async findBillId(billNumber: string, sessionId: string): Promise<string | null> {
+    const cachedId = this.billIdCache.get(`${sessionId}:${billNumber}`);
+    if (cachedId || this.prefetchedBillSessions.has(sessionId)) {
+      return cachedId ?? null;
+    }
+
+    const { data, error } = await this._client
+      .from('bills')
+      .select('id')
+      .eq('bill_number', billNumber)
+      .eq('session_id', sessionId)
+      .limit(1);
+
+    if (error) throw error;
+
+    const billId = data?.[0]?.id ?? null;
+    if (billId) {
+      this.billIdCache.set(`${sessionId}:${billNumber}`, billId);
+    }
+    return billId;
+  }
+
   /**
    * Get or create a committee record.
    *
+   * Upserts on the unique committee name, so a new committee costs one round
+   * trip and a committee already seen by this client costs none.
+   *
    * @param committeeName - Name of the committee
    * @returns Committee UUID
    */
   async getOrCreateCommittee(committeeName: string): Promise<string> {
-    try {
-      // Try to find existing committee
-      const { data: existingData, error: selectError } = await this._client
-        .from('committees')
-        .select('id')
-        .eq('name', committeeName);
-
-      if (selectError) throw selectError;
-
-      if (existingData && existingData.length > 0) {
-        return existingData[0].id;
-      }
+    const cachedId = this.committeeCache.get(committeeName);
+    if (cachedId) {
+      return cachedId;
+    }
 
-      // Create new committee
-      const { data: insertData, error: insertError } = await this._client
+    try {
+      const { data, error } = await this._client
         .from('committees')
-        .insert({
-          name: committeeName,
-        })
+        .upsert({ name: committeeName }, { onConflict: 'name' })
         .select('id')
         .single();
 
-      if (insertError) throw insertError;
-      if (!insertData) throw new Error('Failed to create committee');
+      if (error) throw error;
+      if (!data) throw new Error('Failed to create committee');
 
-      return insertData.id;
+      this.committeeCache.set(committeeName, data.id);
+      return data.id;
     } catch (error) {
       throw new Error(`Failed to get or create committee: ${error}`);
     }
@@ -210,55 +513,66 @@ export class DatabaseClient {
    */
   async upsertLegislator(legislatorData: LegislatorData): Promise<[string, boolean]> {
     try {
-      // Try to find existing legislator by name
-      const { data: existingData, error: selectError } = await this._client
+      // Existing names are known from the prefetched IDs, loaded once per client
+      if (!this.legislatorsPrefetched) {
+        await this.prefetchLegislators();
+      }
+      const wasUpdated = this.legislatorIdCache.has(legislatorData.name);
+
+      // Insert, or update the existing row on the name conflict
+      const { data, error } = await this._client
         .from('legislators')
+        .upsert(toLegislatorRecord(legislatorData), { onConflict: 'name' })
         .select('id')
-        .eq('name', legislatorData.name);
-
-      if (selectError) throw selectError;
-
-      const legislatorRecord = {
-        name: legislatorData.name,
-        legislator_type: legislatorData.legislator_type || null,
-        party_affiliation: legislatorData.party_affiliation || null,
-        year_elected: legislatorData.year_elected || null,
-        years_served: legislatorData.years_served || null,
-        picture_url: legislatorData.picture_url || null,
-        is_active: legislatorData.is_active !== undefined ? legislatorData.is_active : true,
-        profile_url: legislatorData.profile_url || null,
-      };
+        .single();
 
-      let wasUpdated = false;
-      let legislatorId: string;
+      if (error) throw error;
+      if (!data) throw new Error('Failed to upsert legislator');
 
-      if (existingData && existingData.length > 0) {
-        // Update existing legislator
-        legislatorId = existingData[0].id;
-        const { error: updateError } = await this._client
-          .from('legislators')
-          .update(legislatorRecord)
-          .eq('id', legislatorId);
-
-        if (updateError) throw updateError;
-        wasUpdated = true;
-      } else {
-        // Insert new legislator
-        const { data: insertData, error: insertError } = await this._client
-          .from('legislators')
-          .insert(legislatorRecord)
-          .select('id')
-          .single();
+      this.legislatorIdCache.set(legislatorData.name, data.id);
+      return [data.id, wasUpdated];
+    } catch (error) {
+      throw new Error(`Failed to upsert legislator: ${error}`);
+    }
+  }
 
-        if (insertError) throw insertError;
-        if (!insertData) throw new Error('Failed to insert legislator');
+  /**
+   * Insert or update many legislator records with one request.
+   *
+   * @param legislators - Legislator details; a repeated name keeps its last entry
+   * @returns Map of legislator name to [legislator_id, was_updated]
+   */
+  async upsertLegislators(legislators: LegislatorData[]): Promise<Map<string, [string, boolean]>> {
+    const results = new Map<string, [string, boolean]>();
+    if (legislators.length === 0) {
+      return results;
+    }
 
-        legislatorId = insertData.id;
+    try {
+      // Existing names are known from the prefetched IDs, loaded once per client
+      if (!this.legislatorsPrefetched) {
+        await this.prefetchLegislators();
       }
 
-      return [legislatorId, wasUpdated];
+      // Postgres rejects an upsert that touches the same row twice
+      const recordsByName = new Map(legislators.map((l) => [l.name, toLegislatorRecord(l)]));
+
+      const { data, error } = await this._client
+        .from('legislators')
+        .upsert(Array.from(recordsByName.values()), { onConflict: 'name' })
+        .select('id, name');
+
+      if (error) throw error;
+
+      for (const legislator of data || []) {
+        results.set(legislator.name, [legislator.id, this.legislatorIdCache.has(legislator.name)]);
+      }
+      for (const legislator of data || []) {
+        this.legislatorIdCache.set(legislator.name, legislator.id);
+      }
+      return results;
     } catch (error) {
-      throw new Error(`Failed to upsert legislator: ${error}`);
+      throw new Error(`Failed to upsert legislators: ${error}`);
     }
   }
 
@@ -276,50 +590,87 @@ export class DatabaseClient {
     district: string
   ): Promise<string> {
     try {
-      // Check if this session-district mapping already exists
-      const { data: existingData, error: selectError } = await this._client
+      // Insert, or repoint an existing session-district mapping to this legislator
+      const { data, error } = await this._client
         .from('session_legislators')
+        .upsert(
+          { session_id: sessionId, legislator_id: legislatorId, district },
+          { onConflict: 'session_id,district' }
+        )
         .select('id')
-        .eq('session_id', sessionId)
-        .eq('district', district);
+        .single();
 
-      if (selectError) throw selectError;
-
-      let sessionLegislatorId: string;
-
-      if (existingData && existingData.length > 0) {
-        // Update existing record to point to this legislator
-        sessionLegislatorId = existingData[0].id;
-        const { error: updateError } = await this._client
-          .from('session_legislators')
-          .update({ legislator_id: legislatorId })
-          .eq('id', sessionLegislatorId);
-
-        if (updateError) throw updateError;
-      } else {
-        // Create new session_legislator record
-        const { data: insertData, error: insertError } = await this._client
-          .from('session_legislators')
-          .insert({
-            session_id: sessionId,
-            legislator_id: legislatorId,
-            district,
-          })
-          .select('id')
-          .single();
-
-        if (insertError) throw insertError;
-        if (!insertData) throw new Error('Failed to create session_legislator');
-
-        sessionLegislatorId = insertData.id;
-      }
+      if (error) throw error;
+      if (!data) throw new Error('Failed to create session_legislator');
 
-      return sessionLegislatorId;
+      return data.id;
     } catch (error) {
       throw new Error(`Failed to link legislator to session: ${error}`);
     }
   }
 
+  /**
+   * Link many legislators to a session with one request.
+   *
+   * @param sessionId - Session UUID
+   * @param links - Legislator UUID and district pairs; a repeated district keeps its last entry
+   */
+  async linkLegislatorsToSession(
+    sessionId: string,
+    links: Array<{ legislatorId: string; district: string }>
+  ): Promise<void> {
+    if (links.length === 0) {
+      return;
+    }
+
+    try {
+      // Postgres rejects an upsert that touches the same row twice
+      const rowsByDistrict = new Map(
+        links.map(({ legislatorId, district }) => [
+          district,
+          { session_id: sessionId, legislator_id: legislatorId, district },
+        ])
+      );
+
+      // Insert, or repoint existing session-district mappings
+      const { error } = await this._client
+        .from('session_legislators')
+        .upsert(Array.from(rowsByDistrict.values()), { onConflict: 'session_id,district' });
+
+      if (error) throw error;
+    } catch (error) {
+      throw new Error(`Failed to link legislators to session: ${error}`);
+    }
+  }
+
+  /**
+   * Get every session_legislator for a session with its legislator's name, type and profile URL.
+   * Used by scrapers to resolve sponsors in memory instead of querying per sponsor.
+   *
+   * @param sessionId - Session UUID
+   * @returns Session legislator records
+   */
+  async getSessionLegislators(sessionId: string): Promise<SessionLegislatorRecord[]> {
+    try {
+      const { data, error } = await this._client
+        .from('session_legislators')
+        .select('id, district, legislators!inner(name, legislator_type, profile_url)')
+        .eq('session_id', sessionId);
+
+      if (error) throw error;
+
+      return (data || []).map((row) => ({
+        id: row.id,
+        district: row.district,
+        name: row.legislators.name,
+        legislator_type: row.legislators.legislator_type,
+        profile_url: row.legislators.profile_url,
+      }));
+    } catch (error) {
+      throw new Error(`Failed to get session legislators: ${error}`);
+    }
+  }
+
   /**
    * Look up a session_legislator by district for a specific session.
    *
@@ -504,6 +855,10 @@ export class DatabaseClient {
   /**
    * Insert or update a bill with all related data.
    *
+   * Everything is written in one ingest_bill RPC call and transaction, so a
+   * failure leaves the bill's previous rows untouched. Requires
+   * 025_add_ingest_bill_function.sql.
+   *
    * This is a complex operation that handles:
    * - Bill creation/update
    * - Sponsors (primary and co-sponsors)
@@ -528,130 +883,42 @@ export class DatabaseClient {
     documentsData?: DocumentData[]
   ): Promise<[string, boolean]> {
     try {
-      // Ensure session_id is in bill_record
-      const billRecordWithSession = {
-        ...billRecord,
-        session_id: sessionId,
-      };
-
-      // Check if bill already exists
-      const { data: existingBill, error: selectError } = await this._client
-        .from('bills')
-        .select('id')
-        .eq('bill_number', billRecord.bill_number)
-        .eq('session_id', sessionId);
-
-      if (selectError) throw selectError;
-
-      let billId: string;
-      let wasUpdated = false;
-
-      if (existingBill && existingBill.length > 0) {
-        // Update existing bill
-        billId = existingBill[0].id;
-        wasUpdated = true;
-
-        const { error: updateError } = await this._client
-          .from('bills')
-          .update(billRecordWithSession)
-          .eq('id', billId);
-
-        if (updateError) throw updateError;
-
-        // Delete existing related data to re-insert fresh data
-        await this._client.from('bill_sponsors').delete().eq('bill_id', billId);
-        await this._client.from('bill_actions').delete().eq('bill_id', billId);
-        await this._client.from('bill_hearings').delete().eq('bill_id', billId);
-        await this._client.from('bill_documents').delete().eq('bill_id', billId);
-      } else {
-        // Insert new bill
-        const { data: insertData, error: insertError } = await this._client
-          .from('bills')
-          .insert(billRecordWithSession)
-          .select('id')
-          .single();
-
-        if (insertError) throw insertError;
-        if (!insertData) throw new Error('Failed to insert bill');
-
-        billId = insertData.id;
-      }
-
-      // Insert sponsors
-      if (sponsorsData && sponsorsData.length > 0) {
-        for (const sponsor of sponsorsData) {
-          if (sponsor.session_legislator_id) {
-            try {
-              await this._client.from('bill_sponsors').insert({
-                bill_id: billId,
-                session_legislator_id: sponsor.session_legislator_id,
-                is_primary: sponsor.is_primary || false,
-              });
-            } catch (error) {
-              console.warn(`Warning: Could not insert sponsor: ${error}`);
-            }
-          }
-        }
-      }
-
-      // Insert actions
-      if (actionsData && actionsData.length > 0) {
-        for (const action of actionsData) {
-          try {
-            await this._client.from('bill_actions').insert({
-              bill_id: billId,
-              action_date: action.action_date,
-              description: action.description,
-              sequence_order: action.sequence_order || 0,
-            });
-          } catch (error) {
-            console.warn(`Warning: Could not insert action: ${error}`);
-          }
-        }
-      }
-
-      // Insert hearings
-      if (hearingsData && hearingsData.length > 0) {
-        for (const hearing of hearingsData) {
-          try {
-            // Get or create committee
-            const committeeId = await this.getOrCreateCommittee(hearing.committee_name);
-
-            const hearingRecord: Database['public']['Tables']['bill_hearings']['Insert'] = {
-              bill_id: billId,
-              committee_id: committeeId,
-              hearing_date: hearing.hearing_date || null,
-              hearing_time: hearing.hearing_time || null,
-              location: hearing.location || null,
-              hearing_time_text: hearing.hearing_time_text || null,
-            };
-
-            await this._client.from('bill_hearings').insert(hearingRecord);
-          } catch (error) {
-            console.warn(`Warning: Could not insert hearing: ${error}`);
-          }
-        }
-      }
+      const { data, error } = await this._client.rpc('ingest_bill', {
+        p_session_id: sessionId,
+        p_bill: billRecord,
+        p_sponsors: (sponsorsData || [])
+          .filter((sponsor) => sponsor.session_legislator_id)
+          .map((sponsor) => ({
+            session_legislator_id: sponsor.session_legislator_id,
+            is_primary: sponsor.is_primary || false,
+          })),
+        p_actions: (actionsData || []).map((action) => ({
+          action_date: action.action_date,
+          description: action.description,
+          sequence_order: action.sequence_order || 0,
+        })),
+        p_hearings: (hearingsData || []).map((hearing) => ({
+          committee_name: hearing.committee_name,
+          hearing_date: hearing.hearing_date || null,
+          hearing_time: hearing.hearing_time || null,
+          location: hearing.location || null,
+          hearing_time_text: hearing.hearing_time_text || null,
+        })),
+        p_documents: (documentsData || []).map((doc) => ({
+          document_id: doc.document_id,
+          document_title: doc.document_title,
+          document_type: doc.document_type,
+          document_url: doc.document_url,
+          extracted_text: doc.extracted_text,
+        })),
+      });
 
-      // Insert documents
-      if (documentsData && documentsData.length > 0) {
-        for (const doc of documentsData) {
-          try {
-            await this._client.from('bill_documents').insert({
-              bill_id: billId,
-              document_id: doc.document_id,
-              document_title: doc.document_title,
-              document_type: doc.document_type,
-              document_url: doc.document_url,
-              extracted_text: doc.extracted_text,
-            });
-          } catch (error) {
-            console.warn(`Warning: Could not insert document: ${error}`);
-          }
-        }
-      }
+      if (error) throw error;
+      if (!data) throw new Error('ingest_bill returned no result');
 
-      return [billId, wasUpdated];
+      const result = data as unknown as { bill_id: string; was_updated: boolean };
+      this.billIdCache.set(`${sessionId}:${billRecord.bill_number}`, result.bill_id);
+      return [result.bill_id, result.was_updated];
     } catch (error) {
       throw new Error(`Failed to upsert bill: ${error}`);
     }
@@ -712,6 +979,55 @@ export class DatabaseClient {
     }
   }
 
+  /**
+   * Get the IDs of a session's bills that are fully stored: they have
+   * documents with extracted text, and every one of those the scrapers embed
+   * (all but fiscal notes) has embeddings_generated_at set. Loaded in one
+   * paged query instead of a check per bill.
+   *
+   * A bill whose embeddings failed is left out, so the next run without
+   * --force processes it again.
+   *
+   * @param sessionId - Session UUID
+   * @returns Set of bill UUIDs
+   */
+  async getFullyEmbeddedBillIds(sessionId: string): Promise<Set<string>> {
+    try {
+      const storedBillIds = new Set<string>();
+      const unembeddedBillIds = new Set<string>();
+
+      for (let from = 0; ; from += PREFETCH_PAGE_SIZE) {
+        const { data, error } = await this._client
+          .from('bill_documents')
+          .select('id, bill_id, document_id, document_url, embeddings_generated_at, bills!inner(session_id)')
+          .eq('bills.session_id', sessionId)
+          .not('extracted_text', 'is', null)
+          .order('id')
+          .range(from, from + PREFETCH_PAGE_SIZE - 1);
+
+        if (error) throw error;
+
+        for (const document of data || []) {
+          storedBillIds.add(document.bill_id);
+
+          const isFiscalNote = document.document_url?.includes('.ORG') || document.document_id?.includes('.ORG');
+          if (!isFiscalNote && !document.embeddings_generated_at) {
+            unembeddedBillIds.add(document.bill_id);
+          }
+        }
+
+        if (!data || data.length < PREFETCH_PAGE_SIZE) break;
+      }
+
+      for (const billId of unembeddedBillIds) {
+        storedBillIds.delete(billId);
+      }
+      return storedBillIds;
+    } catch (error) {
+      throw new Error(`Failed to get fully embedded bills: ${error}`);
+    }
+  }
+
   /**
    * Check if a bill exists by bill number and session.
    *
@@ -721,16 +1037,7 @@ export class DatabaseClient {
    */
   async getBillIdByNumber(billNumber: string, sessionId: string): Promise<string | null> {
     try {
-      const { data, error } = await this._client
-        .from('bills')
-        .select('id')
-        .eq('bill_number', billNumber)
-        .eq('session_id', sessionId)
-        .limit(1);
-
-      if (error) throw error;
-
-      return data && data.length > 0 ? data[0].id : null;
+      return await this.findBillId(billNumber, sessionId);
     } catch (error) {
       console.error(`Failed to get bill ID: ${error}`);
       return null;
@@ -788,38 +1095,23 @@ export class DatabaseClient {
         return [];
       }
 
-      // Document title hierarchy for determining most recent version
-      const hierarchy = [
-        'truly agreed',
-        'senate substitute',
-        'senate committee substitute',
-        'perfected',
-        'committee',
-        'introduced',
-      ];
-
-      // Find introduced version
+      // Single pass: normalize each title once, track the first introduced
+      // version and the document with the best (lowest) hierarchy rank
       let introduced: BillDocument | null = null;
+      let mostRecent: BillDocument | null = null;
+      let mostRecentRank = DOCUMENT_HIERARCHY.length;
+
       for (const doc of legislativeDocs) {
         const titleLower = (doc.document_title || '').toLowerCase();
-        if (titleLower.includes('introduced')) {
+
+        if (!introduced && titleLower.includes('introduced')) {
           introduced = doc;
-          break;
         }
-      }
 
-      // Find most recent version based on hierarchy
-      let mostRecent: BillDocument | null = null;
-      for (const priorityType of hierarchy) {
-        for (const doc of legislativeDocs) {
-          const titleLower = (doc.document_title || '').toLowerCase();
-          if (titleLower.includes(priorityType)) {
-            mostRecent = doc;
-            break;
-          }
-        }
-        if (mostRecent) {
-          break;
+        const rank = getHierarchyRank(titleLower);
+        if (rank !== -1 && rank < mostRecentRank) {
+          mostRecent = doc;
+          mostRecentRank = rank;
         }
       }
 
@@ -870,90 +1162,56 @@ export class DatabaseClient {
     }>;
   } | null> {
     try {
-      // Get bill with session info
+      // Bill, session, sponsors and hearing committees in one embedded select
       const { data: billData, error: billError } = await this._client
         .from('bills')
-        .select('id, bill_number, session_id, sessions(year, session_code)')
+        .select(
+          'id, bill_number, sessions(year, session_code), ' +
+            'bill_sponsors(is_primary, session_legislators(id, legislators(id, name))), ' +
+            'bill_hearings(committees(id, name))'
+        )
         .eq('id', billId)
-        .single();
+        .maybeSingle();
 
       if (billError) throw billError;
       if (!billData) return null;
 
-      // Get primary sponsor
-      let primarySponsor: { id: string; name: string } | null = null;
-      const { data: primarySponsorData, error: primarySponsorError } = await this._client
-        .from('bill_sponsors')
-        .select('is_primary, session_legislators(id, legislators(id, name))')
-        .eq('bill_id', billId)
-        .eq('is_primary', true);
-
-      if (primarySponsorError) throw primarySponsorError;
-
-      const typedPrimarySponsor = primarySponsorData as unknown as SponsorQueryResult[];
-      if (typedPrimarySponsor && typedPrimarySponsor.length > 0) {
-        const sl = typedPrimarySponsor[0].session_legislators;
-        if (sl && sl.legislators) {
-          primarySponsor = {
-            id: sl.legislators.id,
-            name: sl.legislators.name,
-          };
-        }
-      }
+      const typedBillData = billData as unknown as BillMetadataQuery;
 
-      // Get co-sponsors
+      // Split sponsors into primary and co-sponsors
+      let primarySponsor: { id: string; name: string } | null = null;
       const cosponsors: Array<{ id: string; name: string }> = [];
-      const { data: cosponsorsData, error: cosponsorsError } = await this._client
-        .from('bill_sponsors')
-        .select('is_primary, session_legislators(id, legislators(id, name))')
-        .eq('bill_id', billId)
-        .eq('is_primary', false);
-
-      if (cosponsorsError) throw cosponsorsError;
-
-      const typedCosponsors = cosponsorsData as unknown as SponsorQueryResult[];
-      if (typedCosponsors) {
-        for (const sponsor of typedCosponsors) {
-          const sl = sponsor.session_legislators;
-          if (sl && sl.legislators) {
-            cosponsors.push({
-              id: sl.legislators.id,
-              name: sl.legislators.name,
-            });
-          }
+
+      for (const sponsor of typedBillData.bill_sponsors || []) {
+        const legislator = sponsor.session_legislators?.legislators;
+        if (!legislator) continue;
+
+        if (sponsor.is_primary) {
+          primarySponsor ??= { id: legislator.id, name: legislator.name };
+        } else {
+          cosponsors.push({ id: legislator.id, name: legislator.name });
         }
       }
 
-      // Get committees from hearings
+      // Distinct committees from hearings
       const committees: Array<{ id: string; name: string }> = [];
-      const { data: committeesData, error: committeesError } = await this._client
-        .from('bill_hearings')
-        .select('committees(id, name)')
-        .eq('bill_id', billId);
-
-      if (committeesError) throw committeesError;
-
-      const typedCommittees = committeesData as unknown as CommitteeQueryResult[];
-      if (typedCommittees) {
-        const seenCommitteeIds = new Set<string>();
-        for (const hearing of typedCommittees) {
-          const comm = hearing.committees;
-          if (comm && !seenCommitteeIds.has(comm.id)) {
-            committees.push({
-              id: comm.id,
-              name: comm.name,
-            });
-            seenCommitteeIds.add(comm.id);
-          }
+      const seenCommitteeIds = new Set<string>();
+      for (const hearing of typedBillData.bill_hearings || []) {
+        const comm = hearing.committees;
+        if (comm && !seenCommitteeIds.has(comm.id)) {
+          committees.push({
+            id: comm.id,
+            name: comm.name,
+          });
+          seenCommitteeIds.add(comm.id);
         }
       }
 
-      const typedBillData = billData as unknown as BillWithSessionQuery;
       const sessions = typedBillData.sessions;
 
       return {
-        bill_id: billData.id,
-        bill_number: billData.bill_number,
+        bill_id: typedBillData.id,
+        bill_number: typedBillData.bill_number,
         session_year: sessions?.year || 0,
         session_code: sessions?.session_code || '',
         primary_sponsor: primarySponsor,
@@ -989,7 +1247,9 @@ export class DatabaseClient {
 
   /**
    * Delete all embeddings for a specific bill.
-   * Used to ensure idempotency when re-processing a bill with --force.
+   *
+   * Storing a bill already removes its embeddings (they cascade from the
+   * replaced bill_documents rows), so the scrapers don't need this.
    *
    * @param billId - Bill UUID
    */
@@ -1023,11 +1283,21 @@ export function getDatabase(): DatabaseClient {
   return dbInstance;
 }
 
+// Singleton client for agent tools and API routes
+let interactiveClient: SupabaseClient<Database> | null = null;
+
 /**
- * Get the Supabase client directly (for compatibility with existing code).
+ * Get the Supabase client used by the agent tools and API routes.
+ *
+ * Separate from the ingestion DatabaseClient's: requests time out sooner and
+ * are retried at most once, so a struggling database can't stall a user's
+ * request for minutes.
  *
  * @returns Supabase client instance
  */
 export function getSupabaseClient(): SupabaseClient<Database> {
-  return getDatabase().client;
+  if (!interactiveClient) {
+    interactiveClient = createSupabaseClient(INTERACTIVE_REQUEST_POLICY);
+  }
+  return interactiveClient;
 }
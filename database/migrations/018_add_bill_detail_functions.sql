@@ -0,0 +1,97 @@
+-- Single round-trip lookups for the agent's bill tools
+--
+-- get_bill_by_number and get_bill_timeline previously made 2-3 PostgREST
+-- requests per call (optional session lookup, bill lookup, then sponsors or
+-- actions). These functions resolve the bill and its children in one query
+-- and return a single JSON object (or NULL when the bill does not exist).
+--
+-- When no session year is given, the most recent session containing the bill
+-- number is used.
+
+CREATE OR REPLACE FUNCTION get_bill_detail(
+  p_bill_number TEXT,
+  p_session_year INT DEFAULT NULL
+)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+SET search_path TO public
+AS $$
+  SELECT json_build_object(
+    'id', b.id,
+    'bill_number', b.bill_number,
+    'title', b.title,
+    'lr_number', b.lr_number,
+    'last_action', b.last_action,
+    'proposed_effective_date', b.proposed_effective_date,
+    'session_year', s.year,
+    'session_code', s.session_code,
+    'primary_sponsors', COALESCE(sp.primary_sponsors, '[]'::json),
+    'cosponsors', COALESCE(sp.cosponsors, '[]'::json)
+  )
+  FROM bills b
+  JOIN sessions s ON s.id = b.session_id
+  LEFT JOIN LATERAL (
+    SELECT
+      json_agg(
+        json_build_object('id', l.id, 'name', l.name, 'party_affiliation', l.party_affiliation)
+        ORDER BY bs.created_at
+      ) FILTER (WHERE bs.is_primary) AS primary_sponsors,
+      json_agg(
+        json_build_object('id', l.id, 'name', l.name, 'party_affiliation', l.party_affiliation)
+        ORDER BY bs.created_at
+      ) FILTER (WHERE bs.is_primary IS NOT TRUE) AS cosponsors
+    FROM bill_sponsors bs
+    JOIN session_legislators sl ON sl.id = bs.session_legislator_id
+    JOIN legislators l ON l.id = sl.legislator_id
+    WHERE bs.bill_id = b.id
+  ) sp ON TRUE
+  WHERE
+    b.bill_number = p_bill_number
+    AND (p_session_year IS NULL OR s.year = p_session_year)
+  ORDER BY s.year DESC, s.session_code
+  LIMIT 1;
+$$;
+
+COMMENT ON FUNCTION get_bill_detail IS
+'Bill details with session and sponsors (split into primary and co-sponsors) as one JSON object.
+Parameters: p_bill_number (normalized, e.g. ''HB 1366''), p_session_year (optional).';
+
+CREATE OR REPLACE FUNCTION get_bill_timeline(
+  p_bill_number TEXT,
+  p_session_year INT DEFAULT NULL
+)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+SET search_path TO public
+AS $$
+  SELECT json_build_object(
+    'id', b.id,
+    'bill_number', b.bill_number,
+    'session_year', s.year,
+    'session_code', s.session_code,
+    'actions', COALESCE(
+      (
+        SELECT json_agg(
+          json_build_object('action_date', a.action_date, 'description', a.description)
+          ORDER BY a.sequence_order
+        )
+        FROM bill_actions a
+        WHERE a.bill_id = b.id
+      ),
+      '[]'::json
+    )
+  )
+  FROM bills b
+  JOIN sessions s ON s.id = b.session_id
+  WHERE
+    b.bill_number = p_bill_number
+    AND (p_session_year IS NULL OR s.year = p_session_year)
+  ORDER BY s.year DESC, s.session_code
+  LIMIT 1;
+$$;
+
+COMMENT ON FUNCTION get_bill_timeline IS
+'Bill actions ordered by sequence_order, with the bill''s session, as one JSON object.
+Parameters: p_bill_number (normalized, e.g. ''HB 1366''), p_session_year (optional).';
@@ -0,0 +1,61 @@
+-- Let semantic search request truncated content from match_bill_embeddings
+--
+-- The agent only shows the first 300 characters of each matched chunk, but the
+-- RPC returned full chunk content for up to 500 candidates. The new optional
+-- snippet_len parameter truncates content server-side; NULL (the default,
+-- used by LangChain's SupabaseVectorStore) keeps the full text.
+--
+-- The signature changes, so the old function must be dropped first to avoid
+-- an ambiguous overload.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS match_bill_embeddings(VECTOR(1536), INT, JSONB);
+
+CREATE FUNCTION match_bill_embeddings(
+    query_embedding VECTOR(1536),
+    match_count INT DEFAULT 500,
+    filter JSONB DEFAULT '{}'::jsonb,
+    snippet_len INT DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    content TEXT,
+    metadata JSONB,
+    embedding VECTOR(1536),
+    similarity FLOAT
+)
+LANGUAGE plpgsql
+SET search_path TO public, extensions
+AS $$
+BEGIN
+    -- Set probes higher for better recall (default is 1, which is too low)
+    -- With lists=100, probes=10 searches 10% of clusters
+    SET LOCAL ivfflat.probes = 10;
+
+    RETURN QUERY
+    SELECT
+        bill_embeddings.id,
+        CASE
+            WHEN snippet_len IS NULL THEN bill_embeddings.content
+            ELSE left(bill_embeddings.content, snippet_len)
+        END AS content,
+        bill_embeddings.metadata,
+        bill_embeddings.embedding,
+        1 - (bill_embeddings.embedding <=> query_embedding) AS similarity
+    FROM bill_embeddings
+    WHERE
+        -- Apply metadata filters if provided
+        (filter = '{}'::jsonb OR bill_embeddings.metadata @> filter)
+    ORDER BY bill_embeddings.embedding <=> query_embedding
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON FUNCTION match_bill_embeddings IS
+'Similarity search function compatible with LangChain SupabaseVectorStore.
+Sets ivfflat.probes=10 for better recall with IVFFlat index.
+Parameters: query_embedding (vector), match_count (int), filter (jsonb),
+snippet_len (int, optional - truncates returned content).';
+
+COMMIT;
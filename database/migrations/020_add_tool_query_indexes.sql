@@ -0,0 +1,27 @@
+-- Indexes backing the agent tools' filter patterns
+--
+-- Already covered by existing indexes:
+--   bills (bill_number, session_id)     - unique constraint
+--   sessions (year, session_code)       - idx_sessions_year_code (year is the leading column)
+--   bill_hearings (bill_id)             - idx_bill_hearings_bill_id
+--   legislators name trigram            - idx_legislators_name_trgm (013)
+
+-- get_bill_timeline: WHERE bill_id = ? ORDER BY sequence_order
+CREATE INDEX IF NOT EXISTS idx_bill_actions_bill_id_sequence
+  ON bill_actions (bill_id, sequence_order);
+
+-- Milestone searches: description ILIKE '%...%'
+CREATE INDEX IF NOT EXISTS idx_bill_actions_description_trgm
+  ON bill_actions USING GIN (description extensions.gin_trgm_ops);
+
+-- get_committee_info: trigram similarity on committee names
+CREATE INDEX IF NOT EXISTS idx_committees_name_trgm
+  ON committees USING GIN (name extensions.gin_trgm_ops);
+
+-- get_committee_hearings: upcoming/recent date ranges ordered by date
+CREATE INDEX IF NOT EXISTS idx_bill_hearings_hearing_date
+  ON bill_hearings (hearing_date);
+
+-- get_committee_hearings filtered by committee, ordered by date
+CREATE INDEX IF NOT EXISTS idx_bill_hearings_committee_id_hearing_date
+  ON bill_hearings (committee_id, hearing_date);
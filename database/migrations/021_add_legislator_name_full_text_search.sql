@@ -0,0 +1,65 @@
+-- Rank legislator name searches with full-text matching plus trigram similarity
+--
+-- search_legislators_fuzzy only used whole-string trigram similarity, so a
+-- last-name-only query (e.g. 'Smith' vs 'John Smith') scored low and could fall
+-- under the threshold. Names containing every query word now always match and
+-- are ranked first, with trigram similarity as the tiebreak and typo fallback.
+-- The full-text rank is returned as text_rank so callers can judge how clearly
+-- the top result wins on the same ordering the function uses.
+
+ALTER TABLE legislators
+  ADD COLUMN IF NOT EXISTS name_tsv TSVECTOR
+  GENERATED ALWAYS AS (to_tsvector('simple', name)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_legislators_name_tsv ON legislators USING GIN (name_tsv);
+
+-- Adding a result column changes the return type, which CREATE OR REPLACE can't do
+DROP FUNCTION IF EXISTS search_legislators_fuzzy(TEXT, FLOAT, INT, BOOLEAN);
+
+CREATE OR REPLACE FUNCTION search_legislators_fuzzy(
+  search_name TEXT,
+  similarity_threshold FLOAT DEFAULT 0.3,
+  max_results INT DEFAULT 10,
+  active_only BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+  id UUID,
+  name TEXT,
+  legislator_type TEXT,
+  party_affiliation TEXT,
+  year_elected INT,
+  years_served INT,
+  is_active BOOLEAN,
+  similarity_score REAL,
+  text_rank REAL
+)
+LANGUAGE plpgsql
+SET search_path TO public, extensions
+AS $$
+DECLARE
+  -- Must be matched against name_tsv (not name) to use the GIN index
+  name_query TSQUERY := plainto_tsquery('simple', search_name);
+BEGIN
+  RETURN QUERY
+  SELECT
+    l.id,
+    l.name,
+    l.legislator_type,
+    l.party_affiliation,
+    l.year_elected,
+    l.years_served,
+    l.is_active,
+    similarity(l.name, search_name) AS similarity_score,
+    ts_rank(l.name_tsv, name_query) AS text_rank
+  FROM legislators l
+  WHERE
+    (l.name_tsv @@ name_query OR similarity(l.name, search_name) > similarity_threshold)
+    AND (NOT active_only OR l.is_active = TRUE)
+  ORDER BY
+    text_rank DESC,
+    similarity_score DESC
+  LIMIT max_results;
+END;
+$$;
+
+COMMENT ON FUNCTION search_legislators_fuzzy IS 'Search for legislators by name. Full-text matches on name_tsv rank first, then trigram similarity above threshold.';
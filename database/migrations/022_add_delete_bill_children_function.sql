@@ -0,0 +1,20 @@
+-- Remove a bill's child rows in one call
+--
+-- upsertBill clears sponsors, actions, hearings and documents before
+-- re-inserting them for an existing bill. Issuing four PostgREST DELETEs cost
+-- four round trips and could leave a bill partially cleared if one failed.
+-- This function deletes all four in a single transaction.
+
+CREATE OR REPLACE FUNCTION delete_bill_children(p_bill_id UUID)
+RETURNS VOID
+LANGUAGE sql
+VOLATILE
+SET search_path TO public
+AS $$
+  DELETE FROM bill_sponsors WHERE bill_id = p_bill_id;
+  DELETE FROM bill_actions WHERE bill_id = p_bill_id;
+  DELETE FROM bill_hearings WHERE bill_id = p_bill_id;
+  DELETE FROM bill_documents WHERE bill_id = p_bill_id;
+$$;
+
+COMMENT ON FUNCTION delete_bill_children IS 'Delete a bill''s sponsors, actions, hearings and documents in one transaction (used before re-inserting them on update).';
@@ -0,0 +1,55 @@
+-- Replace all of a bill's child rows in one transaction
+--
+-- upsertBill cleared a bill's sponsors, actions, hearings and documents and
+-- then bulk-inserted the new rows per table: five requests, with a window in
+-- which a failure left the bill with no children. This function does the
+-- delete and all four inserts in a single call and a single transaction.
+--
+-- Each argument is a JSON array of rows with the table's column names
+-- (bill_id is supplied by p_bill_id). Hearings carry a resolved committee_id.
+
+CREATE OR REPLACE FUNCTION replace_bill_children(
+  p_bill_id UUID,
+  p_sponsors JSONB DEFAULT '[]'::JSONB,
+  p_actions JSONB DEFAULT '[]'::JSONB,
+  p_hearings JSONB DEFAULT '[]'::JSONB,
+  p_documents JSONB DEFAULT '[]'::JSONB
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SET search_path TO public
+AS $$
+BEGIN
+  PERFORM delete_bill_children(p_bill_id);
+
+  INSERT INTO bill_sponsors (bill_id, session_legislator_id, is_primary)
+  SELECT p_bill_id, r.session_legislator_id, COALESCE(r.is_primary, FALSE)
+  FROM jsonb_to_recordset(p_sponsors) AS r(session_legislator_id UUID, is_primary BOOLEAN);
+
+  INSERT INTO bill_actions (bill_id, action_date, description, sequence_order)
+  SELECT p_bill_id, r.action_date, r.description, COALESCE(r.sequence_order, 0)
+  FROM jsonb_to_recordset(p_actions) AS r(action_date DATE, description TEXT, sequence_order INT);
+
+  INSERT INTO bill_hearings (bill_id, committee_id, hearing_date, hearing_time, location, hearing_time_text)
+  SELECT p_bill_id, r.committee_id, r.hearing_date, r.hearing_time, r.location, r.hearing_time_text
+  FROM jsonb_to_recordset(p_hearings) AS r(
+    committee_id UUID,
+    hearing_date DATE,
+    hearing_time TIME,
+    location TEXT,
+    hearing_time_text TEXT
+  );
+
+  INSERT INTO bill_documents (bill_id, document_id, document_title, document_type, document_url, extracted_text)
+  SELECT p_bill_id, r.document_id, r.document_title, r.document_type, r.document_url, r.extracted_text
+  FROM jsonb_to_recordset(p_documents) AS r(
+    document_id TEXT,
+    document_title TEXT,
+    document_type TEXT,
+    document_url TEXT,
+    extracted_text TEXT
+  );
+END;
+$$;
+
+COMMENT ON FUNCTION replace_bill_children IS 'Atomically replace a bill''s sponsors, actions, hearings and documents with the given JSON row arrays.';
@@ -0,0 +1,15 @@
+-- Unique constraint on legislator names for upsert-on-conflict
+--
+-- DatabaseClient.upsertLegislator writes with INSERT ... ON CONFLICT (name),
+-- which needs a unique index on the conflict target. bills, sessions,
+-- session_legislators and committees already have theirs:
+--   bills (bill_number, session_id)
+--   sessions (year, session_code)
+--   session_legislators (session_id, district)
+--   committees (name)
+--
+-- Fails if duplicate names exist; merge those rows first:
+--   SELECT name, COUNT(*) FROM legislators GROUP BY name HAVING COUNT(*) > 1;
+
+ALTER TABLE legislators
+  ADD CONSTRAINT legislators_name_key UNIQUE (name);
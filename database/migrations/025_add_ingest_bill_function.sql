@@ -0,0 +1,106 @@
+-- Upsert a bill and replace all of its child rows in one call
+--
+-- upsertBill still took two requests per bill: the bill upsert, then
+-- replace_bill_children. This function does both in a single call and a
+-- single transaction, and resolves hearing committees by name itself, so new
+-- committees don't cost an extra request either.
+--
+-- p_bill holds the bill's columns (without session_id). On update only the
+-- keys present in p_bill are changed, matching a PostgREST upsert. Hearings
+-- carry committee_name instead of committee_id. The other arrays use the same
+-- row shapes as replace_bill_children. Requires
+-- 023_add_replace_bill_children_function.sql.
+--
+-- Returns {"bill_id": ..., "was_updated": ...}; was_updated is true when the
+-- bill already existed.
+
+CREATE OR REPLACE FUNCTION ingest_bill(
+  p_session_id UUID,
+  p_bill JSONB,
+  p_sponsors JSONB DEFAULT '[]'::JSONB,
+  p_actions JSONB DEFAULT '[]'::JSONB,
+  p_hearings JSONB DEFAULT '[]'::JSONB,
+  p_documents JSONB DEFAULT '[]'::JSONB
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET search_path TO public
+AS $$
+DECLARE
+  v_bill_id UUID;
+  v_was_updated BOOLEAN;
+BEGIN
+  INSERT INTO bills (
+    session_id,
+    bill_number,
+    title,
+    lr_number,
+    bill_string,
+    last_action,
+    proposed_effective_date,
+    calendar_status,
+    hearing_status,
+    bill_url
+  )
+  SELECT
+    p_session_id,
+    r.bill_number,
+    r.title,
+    r.lr_number,
+    r.bill_string,
+    r.last_action,
+    r.proposed_effective_date,
+    r.calendar_status,
+    r.hearing_status,
+    r.bill_url
+  FROM jsonb_to_record(p_bill) AS r(
+    bill_number TEXT,
+    title TEXT,
+    lr_number TEXT,
+    bill_string TEXT,
+    last_action TEXT,
+    proposed_effective_date TEXT,
+    calendar_status TEXT,
+    hearing_status TEXT,
+    bill_url TEXT
+  )
+  ON CONFLICT (bill_number, session_id) DO UPDATE SET
+    title = CASE WHEN p_bill ? 'title' THEN EXCLUDED.title ELSE bills.title END,
+    lr_number = CASE WHEN p_bill ? 'lr_number' THEN EXCLUDED.lr_number ELSE bills.lr_number END,
+    bill_string = CASE WHEN p_bill ? 'bill_string' THEN EXCLUDED.bill_string ELSE bills.bill_string END,
+    last_action = CASE WHEN p_bill ? 'last_action' THEN EXCLUDED.last_action ELSE bills.last_action END,
+    proposed_effective_date = CASE
+      WHEN p_bill ? 'proposed_effective_date' THEN EXCLUDED.proposed_effective_date
+      ELSE bills.proposed_effective_date
+    END,
+    calendar_status = CASE WHEN p_bill ? 'calendar_status' THEN EXCLUDED.calendar_status ELSE bills.calendar_status END,
+    hearing_status = CASE WHEN p_bill ? 'hearing_status' THEN EXCLUDED.hearing_status ELSE bills.hearing_status END,
+    bill_url = CASE WHEN p_bill ? 'bill_url' THEN EXCLUDED.bill_url ELSE bills.bill_url END
+  -- xmax is 0 only for a freshly inserted row version
+  RETURNING id, NOT (xmax = 0) INTO v_bill_id, v_was_updated;
+
+  -- Sponsors, actions and documents; hearings are inserted below
+  PERFORM replace_bill_children(v_bill_id, p_sponsors, p_actions, '[]'::JSONB, p_documents);
+
+  INSERT INTO committees (name)
+  SELECT DISTINCT r.committee_name
+  FROM jsonb_to_recordset(p_hearings) AS r(committee_name TEXT)
+  WHERE r.committee_name IS NOT NULL
+  ON CONFLICT (name) DO NOTHING;
+
+  INSERT INTO bill_hearings (bill_id, committee_id, hearing_date, hearing_time, location, hearing_time_text)
+  SELECT v_bill_id, c.id, r.hearing_date, r.hearing_time, r.location, r.hearing_time_text
+  FROM jsonb_to_recordset(p_hearings) AS r(
+    committee_name TEXT,
+    hearing_date DATE,
+    hearing_time TIME,
+    location TEXT,
+    hearing_time_text TEXT
+  )
+  JOIN committees c ON c.name = r.committee_name;
+
+  RETURN jsonb_build_object('bill_id', v_bill_id, 'was_updated', v_was_updated);
+END;
+$$;
+
+COMMENT ON FUNCTION ingest_bill IS 'Upsert a bill and atomically replace its sponsors, actions, hearings (by committee name) and documents in one call.';
@@ -0,0 +1,22 @@
+-- Record which sessions a chamber's scrape has finished
+--
+-- scrape-house-all and scrape-senate-all walk every session since 2000, and a
+-- crash part way through meant re-scraping each bill list (and the House
+-- roster) before reaching the unfinished sessions. Bills with extracted text
+-- were skipped, but only after their session had been listed again.
+--
+-- A row is written once a full scrape of a closed session for a phase
+-- ('house_bills' or 'senate_bills') stores every bill, document, embedding and
+-- roster entry; --skip-done skips sessions that have one. Open sessions are
+-- never marked, since their bills keep changing.
+
+CREATE TABLE IF NOT EXISTS session_scrape_runs (
+  session_id UUID NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+  phase TEXT NOT NULL,
+  completed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (session_id, phase)
+);
+
+ALTER TABLE session_scrape_runs ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE session_scrape_runs IS 'Completed ingestion phases per session. RLS enabled, no policies = service role only.';
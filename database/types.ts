@@ -302,6 +302,7 @@ export type Database = {
           is_active: boolean | null
           legislator_type: string | null
           name: string
+          name_tsv: unknown | null
           party_affiliation: string | null
           picture_url: string | null
           profile_url: string | null
@@ -315,6 +316,7 @@ export type Database = {
           is_active?: boolean | null
           legislator_type?: string | null
           name: string
+          name_tsv?: never
           party_affiliation?: string | null
           picture_url?: string | null
           profile_url?: string | null
@@ -328,6 +330,7 @@ export type Database = {
           is_active?: boolean | null
           legislator_type?: string | null
           name?: string
+          name_tsv?: never
           party_affiliation?: string | null
           picture_url?: string | null
           profile_url?: string | null
@@ -376,6 +379,32 @@ export type Database = {
           },
         ]
       }
+      session_scrape_runs: {
+        Row: {
+          completed_at: string
+          phase: string
+          session_id: string
+        }
+        Insert: {
+          completed_at?: string
+          phase: string
+          session_id: string
+        }
+        Update: {
+          completed_at?: string
+          phase?: string
+          session_id?: string
+        }
+        Relationships: [
+          {
+            foreignKeyName: "session_scrape_runs_session_id_fkey"
+            columns: ["session_id"]
+            isOneToOne: false
+            referencedRelation: "sessions"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
       sessions: {
         Row: {
           created_at: string | null
@@ -411,8 +440,36 @@ export type Database = {
       [_ in never]: never
     }
     Functions: {
+      delete_bill_children: {
+        Args: { p_bill_id: string }
+        Returns: undefined
+      }
+      get_bill_detail: {
+        Args: { p_bill_number: string; p_session_year?: number }
+        Returns: Json
+      }
+      get_bill_timeline: {
+        Args: { p_bill_number: string; p_session_year?: number }
+        Returns: Json
+      }
+      ingest_bill: {
+        Args: {
+          p_actions?: Json
+          p_bill: Json
+          p_documents?: Json
+          p_hearings?: Json
+          p_session_id: string
+          p_sponsors?: Json
+        }
+        Returns: Json
+      }
       match_bill_embeddings: {
-        Args: { filter?: Json; match_count?: number; query_embedding: string }
+        Args: {
+          filter?: Json
+          match_count?: number
+          query_embedding: string
+          snippet_len?: number
+        }
         Returns: {
           content: string
           embedding: string
@@ -439,6 +496,35 @@ export type Database = {
           similarity: number
         }[]
       }
+      replace_bill_children: {
+        Args: {
+          p_actions?: Json
+          p_bill_id: string
+          p_documents?: Json
+          p_hearings?: Json
+          p_sponsors?: Json
+        }
+        Returns: undefined
+      }
+      search_legislators_fuzzy: {
+        Args: {
+          active_only?: boolean
+          max_results?: number
+          search_name: string
+          similarity_threshold?: number
+        }
+        Returns: {
+          id: string
+          is_active: boolean
+          legislator_type: string
+          name: string
+          party_affiliation: string
+          similarity_score: number
+          text_rank: number
+          year_elected: number
+          years_served: number
+        }[]
+      }
     }
     Enums: {
       [_ in never]: never
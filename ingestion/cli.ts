@@ -7,12 +7,17 @@
  */
 
 import { config } from 'dotenv';
-import { resolve } from 'path';
+import { join, resolve } from 'path';
 import { writeFileSync } from 'fs';
 
 // Load environment variables from .env.local
 config({ path: resolve(process.cwd(), '.env.local') });
 
+// libuv runs file I/O, DNS lookups and zlib on a thread pool of 4 by default,
+// which the concurrent downloads and cache reads queue behind. Only takes
+// effect before the pool's first use, so it's set before anything async runs.
+process.env.UV_THREADPOOL_SIZE ??= '16';
+
 // Handle unhandled promise rejections gracefully
 process.on('unhandledRejection', (reason, promise) => {
   console.error('\n❌ Unhandled Promise Rejection:');
@@ -26,9 +31,10 @@ import { Command } from 'commander';
 import { chromium } from 'playwright';
 import { scrapeBillsForSession } from './house/scraper';
 import { scrapeSenateBillsForSession } from './senate/scraper';
+import { SessionScrapeStats } from './shared/types';
 import { scrapeBillList } from './house/bills';
 import { scrapeSendBillList } from './senate/bills';
-import { DatabaseClient } from '@/database/client';
+import { getDatabase } from '@/database/client';
 
 // All Missouri House sessions from 2026 to 2000
 const SESSIONS = [
@@ -133,6 +139,79 @@ const SESSIONS = [
   { year: 2000, sessionCode: 'R', description: '2000 Regular Session' },
 ];
 
+// Sessions scraped at once by the scrape-*-all commands. Sessions share no
+// data, so their downloads, page loads and embeddings overlap; the shared PDF
+// download and OpenAI request limits still apply across all of them.
+const DEFAULT_SESSION_CONCURRENCY = 3;
+
+type SessionInfo = (typeof SESSIONS)[number];
+
+/**
+ * Scrape sessions with a bounded number running at once, then print a summary.
+ *
+ * Each session gets its own PDF directory: Senate document IDs (e.g. SB834I)
+ * repeat across sessions, so concurrent sessions must not share files.
+ *
+ * @param chamber - Chamber name for log headers
+ * @param sessions - Sessions to scrape
+ * @param concurrency - Maximum sessions in flight
+ * @param scrapeSession - Scrapes one session into the given PDF directory, returning its bill counts
+ */
+async function scrapeSessions(
+  chamber: string,
+  sessions: SessionInfo[],
+  concurrency: number,
+  scrapeSession: (session: SessionInfo, pdfDir: string) => Promise<SessionScrapeStats>
+): Promise<void> {
+  const stats = {
+    sessionsProcessed: 0,
+    sessionsFailed: 0,
+    billsProcessed: 0,
+    billsSkipped: 0,
+    billsFailed: 0,
+  };
+
+  let nextIndex = 0;
+  const sessionWorker = async (): Promise<void> => {
+    while (nextIndex < sessions.length) {
+      const session = sessions[nextIndex++];
+      try {
+        console.log(`\n${'='.repeat(80)}`);
+        console.log(`SCRAPING ${chamber}: ${session.description}`);
+        console.log('='.repeat(80));
+
+        const { processed, skipped, failed } = await scrapeSession(
+          session,
+          join('bill_pdfs', `${session.year}${session.sessionCode}`)
+        );
+
+        stats.sessionsProcessed++;
+        stats.billsProcessed += processed;
+        stats.billsSkipped += skipped;
+        stats.billsFailed += failed;
+      } catch (error) {
+        console.error(`\n❌ FATAL ERROR processing ${session.description}:`, error);
+        stats.sessionsFailed++;
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.max(1, Math.min(concurrency, sessions.length)) }, sessionWorker)
+  );
+
+  // Print final summary
+  console.log('\n' + '='.repeat(80));
+  console.log('FINAL SUMMARY');
+  console.log('='.repeat(80));
+  console.log(`Sessions processed: ${stats.sessionsProcessed}/${sessions.length}`);
+  console.log(`Sessions failed: ${stats.sessionsFailed}`);
+  console.log(
+    `Bills processed: ${stats.billsProcessed}, skipped: ${stats.billsSkipped}, failed: ${stats.billsFailed}`
+  );
+  console.log('='.repeat(80));
+}
+
 const program = new Command();
 
 program
@@ -176,7 +255,7 @@ program
   .description('Scrape House legislators and bills for a session')
   .option('--year <year>', 'Session year', '2026')
   .option('--session-code <code>', 'Session code (R, S1, S2)', 'R')
-  .option('--force', 'Re-process bills that already have extracted text', false)
+  .option('--force', 'Re-process bills that already have extracted text and embeddings', false)
   .option('--bills <bills>', 'Comma-separated list of bill numbers to process')
   .option('--skip-legislators', 'Skip legislator scraping (use when legislators already exist)', false)
   .action(async (options) => {
@@ -193,7 +272,7 @@ program
       console.log(`Processing ${bills.length} specific bill(s): ${bills.slice(0, 5).join(', ')}${bills.length > 5 ? '...' : ''}`);
     }
     if (!force) {
-      console.log('Bills with existing extracted text will be skipped (use --force to re-process).\n');
+      console.log('Bills with existing extracted text and embeddings will be skipped (use --force to re-process).\n');
     } else {
       console.log('--force enabled: All bills will be re-processed.\n');
     }
@@ -244,7 +323,7 @@ program
   .option('--year <year>', 'Session year', '2026')
   .option('--session-code <code>', 'Session code (R, S1, S2)', 'R')
   .option('--limit <limit>', 'Limit number of bills to process')
-  .option('--force', 'Re-process bills that already have extracted text', false)
+  .option('--force', 'Re-process bills that already have extracted text and embeddings', false)
   .option('--bills <bills>', 'Comma-separated list of bill numbers to process')
   .option('--skip-legislators', 'Skip legislator scraping (use when legislators already exist)', false)
   .action(async (options) => {
@@ -262,7 +341,7 @@ program
       console.log(`Processing ${bills.length} specific bill(s): ${bills.slice(0, 5).join(', ')}${bills.length > 5 ? '...' : ''}`);
     }
     if (!force) {
-      console.log('Bills with existing extracted text will be skipped (use --force to re-process).\n');
+      console.log('Bills with existing extracted text and embeddings will be skipped (use --force to re-process).\n');
     } else {
       console.log('--force enabled: All bills will be re-processed.\n');
     }
@@ -281,8 +360,12 @@ program
   .command('scrape-house-all')
   .description('Scrape all House sessions from 2026 to 2000')
   .option('--start-year <year>', 'Start from a specific year and work backwards', '2026')
+  .option('--concurrency <n>', 'Number of sessions to scrape at once', String(DEFAULT_SESSION_CONCURRENCY))
+  .option('--skip-done', 'Skip closed sessions a previous run scraped completely')
   .action(async (options) => {
     const startYear = parseInt(options.startYear);
+    const concurrency = parseInt(options.concurrency) || DEFAULT_SESSION_CONCURRENCY;
+    const skipDone = options.skipDone;
 
     // Filter sessions to start from specified year
     const sessionsToProcess = SESSIONS.filter(s => s.year <= startYear);
@@ -290,38 +373,19 @@ program
     console.log('='.repeat(80));
     console.log(`SCRAPING ALL HOUSE SESSIONS (${startYear}-2000)`);
     console.log('='.repeat(80));
-    console.log(`\nTotal sessions to process: ${sessionsToProcess.length}`);
-
-    const db = new DatabaseClient();
+    console.log(`\nTotal sessions to process: ${sessionsToProcess.length} (${concurrency} at a time)`);
 
-    const stats = {
-      sessionsProcessed: 0,
-      sessionsFailed: 0,
-    };
+    const db = getDatabase();
 
-    for (const { year, sessionCode, description } of sessionsToProcess) {
-      try {
-        console.log(`\n${'='.repeat(80)}`);
-        console.log(`SCRAPING HOUSE: ${description}`);
-        console.log('='.repeat(80));
-
-        await scrapeBillsForSession({ year, sessionCode }, db);
-
-        stats.sessionsProcessed++;
-      } catch (error) {
-        console.error(`\n❌ FATAL ERROR processing ${description}:`, error);
-        stats.sessionsFailed++;
-        continue;
-      }
+    // One Chromium for every session; each scraper opens its own context in it
+    const browser = await chromium.launch({ headless: true });
+    try {
+      await scrapeSessions('HOUSE', sessionsToProcess, concurrency, ({ year, sessionCode }, pdfDir) =>
+        scrapeBillsForSession({ year, sessionCode, pdfDir, skipDone, browser }, db)
+      );
+    } finally {
+      await browser.close();
     }
-
-    // Print final summary
-    console.log('\n' + '='.repeat(80));
-    console.log('FINAL SUMMARY');
-    console.log('='.repeat(80));
-    console.log(`Sessions processed: ${stats.sessionsProcessed}/${sessionsToProcess.length}`);
-    console.log(`Sessions failed: ${stats.sessionsFailed}`);
-    console.log('='.repeat(80));
   });
 
 // Scrape all Senate sessions command
@@ -329,8 +393,12 @@ program
   .command('scrape-senate-all')
   .description('Scrape all Senate sessions from 2026 to 2000')
   .option('--start-year <year>', 'Start from a specific year and work backwards', '2026')
+  .option('--concurrency <n>', 'Number of sessions to scrape at once', String(DEFAULT_SESSION_CONCURRENCY))
+  .option('--skip-done', 'Skip closed sessions a previous run scraped completely')
   .action(async (options) => {
     const startYear = parseInt(options.startYear);
+    const concurrency = parseInt(options.concurrency) || DEFAULT_SESSION_CONCURRENCY;
+    const skipDone = options.skipDone;
 
     // Filter sessions to start from specified year
     const sessionsToProcess = SESSIONS.filter(s => s.year <= startYear);
@@ -338,38 +406,19 @@ program
     console.log('='.repeat(80));
     console.log(`SCRAPING ALL SENATE SESSIONS (${startYear}-2000)`);
     console.log('='.repeat(80));
-    console.log(`\nTotal sessions to process: ${sessionsToProcess.length}`);
-
-    const db = new DatabaseClient();
-
-    const stats = {
-      sessionsProcessed: 0,
-      sessionsFailed: 0,
-    };
-
-    for (const { year, sessionCode, description } of sessionsToProcess) {
-      try {
-        console.log(`\n${'='.repeat(80)}`);
-        console.log(`SCRAPING SENATE: ${description}`);
-        console.log('='.repeat(80));
+    console.log(`\nTotal sessions to process: ${sessionsToProcess.length} (${concurrency} at a time)`);
 
-        await scrapeSenateBillsForSession({ year, sessionCode }, db);
+    const db = getDatabase();
 
-        stats.sessionsProcessed++;
-      } catch (error) {
-        console.error(`\n❌ FATAL ERROR processing ${description}:`, error);
-        stats.sessionsFailed++;
-        continue;
-      }
+    // One Chromium for every session; each scraper opens its own context in it
+    const browser = await chromium.launch({ headless: true });
+    try {
+      await scrapeSessions('SENATE', sessionsToProcess, concurrency, ({ year, sessionCode }, pdfDir) =>
+        scrapeSenateBillsForSession({ year, sessionCode, pdfDir, skipDone, browser }, db)
+      );
+    } finally {
+      await browser.close();
     }
-
-    // Print final summary
-    console.log('\n' + '='.repeat(80));
-    console.log('FINAL SUMMARY');
-    console.log('='.repeat(80));
-    console.log(`Sessions processed: ${stats.sessionsProcessed}/${sessionsToProcess.length}`);
-    console.log(`Sessions failed: ${stats.sessionsFailed}`);
-    console.log('='.repeat(80));
   });
 
 program.parse();
@@ -3,6 +3,8 @@
  */
 
 import { Page } from 'playwright';
+import { fetchHtml, isClosedSession, parseTableRows } from '../shared/html';
+import { ScrapedAction } from '../shared/types';
 
 /**
  * Get the bill actions URL for a specific bill.
@@ -19,35 +21,29 @@ function getActionsUrl(billNumber: string, year?: number, sessionCode: string =
  * @param billNumber - Bill number (e.g., "HB 1366")
  * @param year - Session year
  * @param sessionCode - Session code
- * @returns Pipe-delimited string of actions (date | description)
+ * @returns Actions in page order
  */
 export async function scrapeActions(
   page: Page,
   billNumber: string,
   year?: number,
   sessionCode: string = 'R'
-): Promise<string> {
+): Promise<ScrapedAction[]> {
   const url = getActionsUrl(billNumber, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  const html = await fetchHtml(page, url, { immutable: isClosedSession(year) });
 
-  const actions = await page.evaluate(() => {
-    const rows = Array.from(document.querySelectorAll('tr'));
-    const actionStrings: string[] = [];
+  const actions: ScrapedAction[] = [];
+  for (const row of parseTableRows(html)) {
+    const cells = row.filter((cell) => cell.tag === 'TD');
+    if (cells.length >= 3) {
+      const date = cells[0].text;
+      const description = cells[2].text;
 
-    for (let i = 0; i < rows.length; i++) {
-      const cells = Array.from(rows[i].querySelectorAll('td'));
-      if (cells.length >= 3) {
-        const date = cells[0].textContent?.trim() || '';
-        const description = cells[2].textContent?.trim() || '';
-
-        if (date && description && date !== 'Date') {
-          actionStrings.push(date + ' | ' + description);
-        }
+      if (date && description && date !== 'Date') {
+        actions.push({ action_date: date, description });
       }
     }
-
-    return actionStrings.join(' || ');
-  });
+  }
 
   return actions;
 }
@@ -3,7 +3,9 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
 import { BillListItem, BillDetails } from '../shared/types';
+import { fetchHtml, HtmlCell, isClosedSession, parseTables } from '../shared/html';
 
 const BASE_URL = 'https://house.mo.gov/billlist.aspx';
 const ARCHIVE_URL = 'https://archive.house.mo.gov/billlist.aspx';
@@ -26,6 +28,22 @@ function getBillDetailUrl(billNumber: string, year?: number, sessionCode: string
   return `${base}/BillContent.aspx?bill=${billNumber}&year=${year}&code=${sessionCode}&style=new`;
 }
 
+/**
+ * Resolve a link's href against the page URL, as the DOM's anchor.href would.
+ */
+function resolveHref(href: string | null, pageUrl: string): string {
+  return href ? new URL(href, pageUrl).href : '';
+}
+
+/**
+ * Find the bill list table: the first table mentioning a House or Senate bill.
+ */
+function findBillTable(html: string): HtmlCell[][] | undefined {
+  return parseTables(html).find((rows) =>
+    rows.some((cells) => cells.some((cell) => cell.text.includes('HB') || cell.text.includes('SB')))
+  );
+}
+
 /**
  * Scrape all bills from the Missouri House bill list page.
  *
@@ -40,75 +58,68 @@ export async function scrapeBillList(
   sessionCode: string = 'R'
 ): Promise<BillListItem[]> {
   const url = getBillListUrl(year, sessionCode);
-  console.log(`Navigating to ${url}...`);
-
-  await page.goto(url, { waitUntil: 'networkidle' });
-  await page.waitForSelector('table', { timeout: 10000 });
+  console.log(`Fetching ${url}...`);
+
+  // The list is rendered server-side, so fetch the HTML directly and only fall
+  // back to a browser navigation if no bill table comes back
+  let html = await fetchHtml(page, url, { immutable: isClosedSession(year) });
+  let pageUrl = url;
+  let billTable = findBillTable(html);
+
+  if (!billTable) {
+    console.log('Bill table not found in raw HTML, loading page in browser...');
+    await gotoWithRetry(page, url, { waitUntil: 'domcontentloaded' });
+    await page.waitForSelector('table', { timeout: 10000 });
+    html = await page.content();
+    pageUrl = page.url();
+    billTable = findBillTable(html);
+  }
 
   console.log('Extracting bill data...');
 
-  const bills = await page.evaluate(() => {
-    const bills: BillListItem[] = [];
-    const tables = Array.from(document.querySelectorAll('table'));
-    const billTable = tables.find(
-      (t) => t.innerText.includes('HB') || t.innerText.includes('SB')
-    );
+  const bills: BillListItem[] = [];
+  let currentBill: BillListItem | null = null;
+
+  for (const row of billTable || []) {
+    const cells = row.filter((cell) => cell.tag === 'TD');
 
-    if (!billTable) {
-      return [];
+    // Skip header rows
+    if (cells.length === 0 || row.some((cell) => cell.tag === 'TH')) {
+      continue;
     }
 
-    const rows = Array.from(billTable.querySelectorAll('tr'));
-    let currentBill: BillListItem | null = null;
+    // Check if this is a bill number row (typically has 5 cells)
+    if (cells.length >= 4) {
+      const billNumberCell = cells[0];
 
-    for (const row of rows) {
-      const cells = Array.from(row.querySelectorAll('td'));
+      if (billNumberCell.linkText !== null) {
+        const billNumber = billNumberCell.linkText;
+        const billUrl = resolveHref(billNumberCell.linkHref, pageUrl);
 
-      // Skip header rows
-      if (cells.length === 0 || row.querySelector('th')) {
-        continue;
-      }
+        // Extract sponsor
+        const sponsorCell = cells[1];
+        const sponsor = sponsorCell.linkText ?? sponsorCell.text;
+        const sponsorUrl = resolveHref(sponsorCell.linkHref, pageUrl);
 
-      // Check if this is a bill number row (typically has 5 cells)
-      if (cells.length >= 4) {
-        const billNumberCell = cells[0];
-        const billLink = billNumberCell.querySelector('a');
-
-        if (billLink) {
-          const billNumber = billLink.textContent?.trim() || '';
-          const billUrl = (billLink as HTMLAnchorElement).href;
-
-          // Extract sponsor
-          const sponsorCell = cells[1];
-          const sponsorLink = sponsorCell.querySelector('a');
-          const sponsor = sponsorLink
-            ? sponsorLink.textContent?.trim() || ''
-            : sponsorCell.textContent?.trim() || '';
-          const sponsorUrl = sponsorLink ? (sponsorLink as HTMLAnchorElement).href : '';
-
-          currentBill = {
-            bill_number: billNumber,
-            bill_url: billUrl,
-            sponsor: sponsor,
-            sponsor_url: sponsorUrl,
-            description: '',
-          };
-
-          bills.push(currentBill);
-        }
-      }
-      // Check if this is a description row (typically has 2 cells)
-      else if (cells.length === 2 && currentBill) {
-        const descriptionCell = cells[1];
-        currentBill.description = descriptionCell.textContent?.trim() || '';
+        currentBill = {
+          bill_number: billNumber,
+          bill_url: billUrl,
+          sponsor: sponsor,
+          sponsor_url: sponsorUrl,
+          description: '',
+        };
+
+        bills.push(currentBill);
       }
     }
-
-    return bills;
-  });
+    // Check if this is a description row (typically has 2 cells)
+    else if (cells.length === 2 && currentBill) {
+      currentBill.description = cells[1].text;
+    }
+  }
 
   console.log(`Found ${bills.length} bills`);
-  return bills as BillListItem[];
+  return bills;
 }
 
 /**
@@ -127,7 +138,8 @@ export async function scrapeBillDetails(
   sessionCode: string = 'R'
 ): Promise<BillDetails> {
   const url = getBillDetailUrl(billNumber, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'domcontentloaded' });
+  await page.waitForSelector('main', { state: 'attached', timeout: 10000 });
 
   const details = await page.evaluate((): BillDetails => {
     const result: BillDetails = {
@@ -177,45 +189,28 @@ export async function scrapeBillDetails(
       result.sponsor_url = (sponsorLink as HTMLAnchorElement).href;
     }
 
-    // Extract various labeled fields by searching for label text
-    const allElements = Array.from(document.querySelectorAll('main *'));
-    const labelTexts = [
-      'Proposed Effective Date:',
-      'LR Number:',
-      'Last Action:',
-      'Bill String:',
-      'Next House Hearing:',
-      'Calendar:',
-    ];
-
-    for (let i = 0; i < allElements.length; i++) {
+    // Extract various labeled fields: the element after each label holds its
+    // value. One pass over main's elements with a label -> field lookup.
+    const labelFields = new Map<string, Exclude<keyof BillDetails, 'bill_documents'>>([
+      ['Proposed Effective Date:', 'proposed_effective_date'],
+      ['LR Number:', 'lr_number'],
+      ['Last Action:', 'last_action'],
+      ['Bill String:', 'bill_string'],
+      ['Next House Hearing:', 'hearing_status'],
+      ['Calendar:', 'calendar_status'],
+    ]);
+    const allElements = document.querySelectorAll('main *');
+
+    for (let i = 0; i < allElements.length - 1; i++) {
       const el = allElements[i];
-      const text = el.textContent?.trim() || '';
-      if (labelTexts.includes(text)) {
-        const nextEl = allElements[i + 1];
-        if (nextEl) {
-          const value = nextEl.textContent?.trim() || '';
-          switch (text) {
-            case 'Proposed Effective Date:':
-              result.proposed_effective_date = value;
-              break;
-            case 'LR Number:':
-              result.lr_number = value;
-              break;
-            case 'Last Action:':
-              result.last_action = value;
-              break;
-            case 'Bill String:':
-              result.bill_string = value;
-              break;
-            case 'Next House Hearing:':
-              result.hearing_status = value;
-              break;
-            case 'Calendar:':
-              result.calendar_status = value;
-              break;
-          }
-        }
+
+      // Labels are single-text elements; skipping containers avoids reading
+      // textContent for every subtree, which made this pass quadratic
+      if (el.childElementCount > 1) continue;
+
+      const field = labelFields.get(el.textContent?.trim() || '');
+      if (field) {
+        result[field] = allElements[i + 1].textContent?.trim() || '';
       }
     }
 
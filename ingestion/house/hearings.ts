@@ -3,6 +3,8 @@
  */
 
 import { Page } from 'playwright';
+import { fetchHtml, isClosedSession, parseTableRows } from '../shared/html';
+import { ScrapedHearing } from '../shared/types';
 
 /**
  * Get the bill hearings URL for a specific bill.
@@ -56,71 +58,63 @@ export function parseHearingTime(timeStr: string): string | null {
  * @param billNumber - Bill number (e.g., "HB 1366")
  * @param year - Session year
  * @param sessionCode - Session code
- * @returns Pipe-delimited string of hearings (committee | date | time | location)
+ * @returns Hearings in page order
  */
 export async function scrapeHearings(
   page: Page,
   billNumber: string,
   year?: number,
   sessionCode: string = 'R'
-): Promise<string> {
+): Promise<ScrapedHearing[]> {
   const url = getHearingsUrl(billNumber, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
-
-  const hearings = await page.evaluate(() => {
-    const table = document.querySelector('table');
-    if (!table) return '';
-
-    const rows = Array.from(table.querySelectorAll('tr'));
-    const hearingStrings: string[] = [];
-
-    let currentCommittee = '';
-    let currentDate = '';
-    let currentTime = '';
-    let currentLocation = '';
-
-    for (let i = 0; i < rows.length; i++) {
-      const row = rows[i];
-      const cells = Array.from(row.querySelectorAll('td, th'));
-
-      if (cells.length === 1 && cells[0].tagName === 'TH') {
-        // This is a committee header row
-        if (currentCommittee && currentDate) {
-          hearingStrings.push(
-            currentCommittee + ' | ' + currentDate + ' | ' + currentTime + ' | ' + currentLocation
-          );
-        }
-
-        const committeeLink = cells[0].querySelector('a');
-        currentCommittee = committeeLink
-          ? committeeLink.textContent?.trim() || ''
-          : cells[0].textContent?.trim() || '';
-        currentDate = '';
-        currentTime = '';
-        currentLocation = '';
-      } else if (cells.length === 2) {
-        const label = cells[0].textContent?.trim() || '';
-        const value = cells[1].textContent?.trim() || '';
-
-        if (label === 'Date:') {
-          currentDate = value;
-        } else if (label === 'Time:') {
-          currentTime = value;
-        } else if (label === 'Location:') {
-          currentLocation = value;
-        }
+  const html = await fetchHtml(page, url, { immutable: isClosedSession(year) });
+
+  const hearings: ScrapedHearing[] = [];
+
+  let currentCommittee = '';
+  let currentDate = '';
+  let currentTime = '';
+  let currentLocation = '';
+
+  for (const cells of parseTableRows(html, true)) {
+    if (cells.length === 1 && cells[0].tag === 'TH') {
+      // This is a committee header row
+      if (currentCommittee && currentDate) {
+        hearings.push({
+          committee_name: currentCommittee,
+          hearing_date: currentDate,
+          hearing_time_text: currentTime,
+          location: currentLocation,
+        });
       }
-    }
 
-    // Add the last hearing
-    if (currentCommittee && currentDate) {
-      hearingStrings.push(
-        currentCommittee + ' | ' + currentDate + ' | ' + currentTime + ' | ' + currentLocation
-      );
+      currentCommittee = cells[0].linkText ?? cells[0].text;
+      currentDate = '';
+      currentTime = '';
+      currentLocation = '';
+    } else if (cells.length === 2) {
+      const label = cells[0].text;
+      const value = cells[1].text;
+
+      if (label === 'Date:') {
+        currentDate = value;
+      } else if (label === 'Time:') {
+        currentTime = value;
+      } else if (label === 'Location:') {
+        currentLocation = value;
+      }
     }
+  }
 
-    return hearingStrings.join(' || ');
-  });
+  // Add the last hearing
+  if (currentCommittee && currentDate) {
+    hearings.push({
+      committee_name: currentCommittee,
+      hearing_date: currentDate,
+      hearing_time_text: currentTime,
+      location: currentLocation,
+    });
+  }
 
   return hearings;
 }
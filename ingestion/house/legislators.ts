@@ -2,8 +2,20 @@
  * Scrapes Missouri House of Representatives legislators and inserts them into Supabase.
  */
 
-import { chromium, Browser, Page } from 'playwright';
-import { DatabaseClient } from '@/database/client';
+import { chromium, Browser, BrowserContext, Page } from 'playwright';
+import { blockUnusedResources, gotoWithRetry } from '../shared/browser';
+import { extractTextNodes, fetchHtml, htmlToText, isClosedSession } from '../shared/html';
+import { DatabaseClient, getDatabase, LegislatorData } from '@/database/client';
+
+// Profile pages loaded at once; each in-flight profile gets its own pooled page
+const PROFILE_CONCURRENCY = 8;
+
+// Profile page patterns (see scrapeLegislatorDetails)
+const H1_PATTERN = /<h1\b[^>]*>([\s\S]*?)<\/h1>/i;
+const MAIN_PATTERN = /<main\b[^>]*>([\s\S]*)<\/main>/i;
+const MEMBER_PHOTO_PATTERN = /<img\b[^>]*?\bsrc\s*=\s*(?:"([^"]*MemberPhoto[^"]*)"|'([^']*MemberPhoto[^']*)')/i;
+const MISSING_TITLE_SPACE_PATTERN = /^(Representative|Senator)([A-Z])/;
+const TITLE_PREFIX_PATTERN = /^(Representative|Senator)\s+/;
 
 /**
  * Legislator list item from roster page
@@ -41,7 +53,10 @@ export class MoLegislatorScraper {
   private year: number | null;
   private sessionCode: string;
   private browser: Browser | null = null;
+  private sharedBrowser?: Browser;
+  private context: BrowserContext | null = null;
   private page: Page | null = null;
+  private pages: Page[] = [];
   private db: DatabaseClient;
 
   /**
@@ -50,26 +65,37 @@ export class MoLegislatorScraper {
    * @param year - Legislative year (null for current session)
    * @param sessionCode - Session code (R for Regular, E for Extraordinary)
    * @param db - Database instance for all database operations
+   * @param browser - Browser to open the context in (launches and owns one if not provided)
    */
-  constructor(year: number | null = null, sessionCode: string = 'R', db?: DatabaseClient) {
+  constructor(year: number | null = null, sessionCode: string = 'R', db?: DatabaseClient, browser?: Browser) {
     this.year = year;
     this.sessionCode = sessionCode;
-    this.db = db || new DatabaseClient();
+    this.db = db || getDatabase();
+    this.sharedBrowser = browser;
   }
 
   /**
-   * Start the browser and page.
+   * Start the browser and a pool of pages sharing one context.
    */
   async start(): Promise<void> {
-    this.browser = await chromium.launch({ headless: true });
-    this.page = await this.browser.newPage();
+    this.browser = this.sharedBrowser ?? (await chromium.launch({ headless: true }));
+    const context = await this.browser.newContext();
+    await blockUnusedResources(context);
+    this.context = context;
+    this.pages = await Promise.all(
+      Array.from({ length: PROFILE_CONCURRENCY }, () => context.newPage())
+    );
+    this.page = this.pages[0];
   }
 
   /**
-   * Close the browser.
+   * Close the context, and the browser unless it was passed in.
    */
   async close(): Promise<void> {
-    if (this.browser) {
+    if (this.context) {
+      await this.context.close();
+    }
+    if (this.browser && !this.sharedBrowser) {
       await this.browser.close();
     }
   }
@@ -99,7 +125,7 @@ export class MoLegislatorScraper {
 
     const url = this.getRosterUrl();
     console.log(`Navigating to ${url}...`);
-    await this.page.goto(url, { waitUntil: 'networkidle' });
+    await gotoWithRetry(this.page, url, { waitUntil: 'domcontentloaded' });
 
     // Wait for content to load
     await this.page.waitForSelector('main', { timeout: 10000 });
@@ -115,13 +141,15 @@ export class MoLegislatorScraper {
       // Find all links that go to MemberDetails
       const links = Array.from(main.querySelectorAll('a[href*="MemberDetails"]'));
 
-      // Group links by district (each legislator has 2 links - first and last name)
+      // Group links by district (each legislator has 2 links - first and last
+      // name), remembering the grid row the links sit in
       const districtMap = new Map<
         string,
         {
           profile_url: string;
           district: string;
           name_parts: string[];
+          row: Element | null;
         }
       >();
 
@@ -135,45 +163,49 @@ export class MoLegislatorScraper {
               profile_url: href,
               district: district,
               name_parts: [],
+              row: link.closest('tr'),
             });
           }
           districtMap.get(district)!.name_parts.push(link.textContent?.trim() || '');
         }
       }
 
-      // Now find party affiliations by looking at StaticText elements
-      const staticTexts = Array.from(document.querySelectorAll('main *'));
-      const parties: string[] = [];
+      const isParty = (text: string) =>
+        text === 'R' || text === 'D' || text === 'Republican' || text === 'Democrat';
 
-      for (const el of staticTexts) {
-        const text = el.textContent?.trim() || '';
-        if (text === 'R' || text === 'D' || text === 'Republican' || text === 'Democrat') {
-          parties.push(text);
+      // Read each legislator's party from their own row, so a row without one
+      // can't shift every later legislator's party
+      const districtArray = Array.from(districtMap.values());
+      let parties: string[];
+      if (districtArray.every((legislator) => legislator.row !== null)) {
+        parties = districtArray.map((legislator) => {
+          for (const el of Array.from(legislator.row!.querySelectorAll('*'))) {
+            const text = el.textContent?.trim() || '';
+            if (isParty(text)) return text;
+          }
+          return '';
+        });
+      } else {
+        // No grid rows to scope by: pair the page's party labels with the
+        // legislators in order
+        parties = [];
+        for (const el of Array.from(main.querySelectorAll('*'))) {
+          const text = el.textContent?.trim() || '';
+          if (isParty(text)) {
+            parties.push(text);
+          }
         }
       }
 
-      // Convert map to array and add party info
-      const districtArray = Array.from(districtMap.values());
       for (let i = 0; i < districtArray.length && i < parties.length; i++) {
         const legislator = districtArray[i];
         // Combine name parts (usually last name, first name)
         const name = legislator.name_parts.join(' ');
 
-        // Add party
-        const party = parties[i];
-        let partyAbbrev: string;
-        if (party === 'R') {
-          partyAbbrev = 'R';
-        } else if (party === 'D') {
-          partyAbbrev = 'D';
-        } else {
-          partyAbbrev = party;
-        }
-
         legislators.push({
           name,
           district: legislator.district,
-          party_abbrev: partyAbbrev,
+          party_abbrev: parties[i],
           profile_url: legislator.profile_url,
         });
       }
@@ -185,115 +217,211 @@ export class MoLegislatorScraper {
     return legislators;
   }
 
+  /**
+   * Scrape detailed information for many legislators concurrently, one
+   * profile per pooled page.
+   *
+   * @param profileUrls - URLs of the legislators' profile pages
+   * @returns Details (or the error that prevented scraping them) for each URL, in order
+   */
+  async scrapeAllLegislatorDetails(profileUrls: string[]): Promise<Array<LegislatorDetails | Error>> {
+    if (this.pages.length === 0) {
+      throw new Error('Browser not started');
+    }
+
+    const results: Array<LegislatorDetails | Error> = new Array(profileUrls.length);
+    let nextIndex = 0;
+
+    const profileWorker = async (page: Page): Promise<void> => {
+      while (nextIndex < profileUrls.length) {
+        const index = nextIndex++;
+        try {
+          results[index] = await this.scrapeLegislatorDetails(profileUrls[index], page);
+        } catch (error) {
+          results[index] = error instanceof Error ? error : new Error(String(error));
+        }
+      }
+    };
+
+    await Promise.all(this.pages.map(profileWorker));
+    return results;
+  }
+
   /**
    * Scrape detailed information for a specific legislator.
    *
+   * Profiles are static server-rendered pages, so they're fetched through the
+   * page's request API and parsed from the raw HTML instead of being loaded
+   * and rendered in the browser.
+   *
    * @param profileUrl - URL to the legislator's profile page
+   * @param page - Page whose request context fetches the profile (default: the scraper's first page)
    * @returns Object containing legislator details
    */
-  async scrapeLegislatorDetails(profileUrl: string): Promise<LegislatorDetails> {
-    if (!this.page) {
+  async scrapeLegislatorDetails(profileUrl: string, page: Page | null = this.page): Promise<LegislatorDetails> {
+    if (!page) {
       throw new Error('Browser not started');
     }
 
-    await this.page.goto(profileUrl, { waitUntil: 'networkidle' });
-
-    // Extract legislator details
-    const details = await this.page.evaluate(() => {
-      const details: LegislatorDetails = {
-        name: '',
-        legislator_type: '',
-        district: '',
-        party_affiliation: '',
-        year_elected: '',
-        years_served: '',
-        picture_url: '',
-        is_active: true,
-        profile_url: window.location.href,
-      };
-
-      // Extract name and type from h1
-      const h1 = document.querySelector('h1');
-      if (h1) {
-        let fullName = h1.textContent?.trim() || '';
-        // Fix missing space between title and name
-        fullName = fullName.replace(/^(Representative|Senator)([A-Z])/, '$1 $2');
-
-        // Extract legislator type
-        const typeMatch = fullName.match(/^(Representative|Senator)\s+/);
-        if (typeMatch) {
-          details.legislator_type = typeMatch[1];
-        }
-
-        // Remove "Representative" or "Senator" prefix from name
-        details.name = fullName.replace(/^(Representative|Senator)\s+/, '');
+    const html = await fetchHtml(page, profileUrl, { immutable: isClosedSession(this.year) });
+
+    const details: LegislatorDetails = {
+      name: '',
+      legislator_type: '',
+      district: '',
+      party_affiliation: '',
+      year_elected: '',
+      years_served: '',
+      picture_url: '',
+      is_active: true,
+      profile_url: profileUrl,
+    };
+
+    // Extract name and type from h1
+    const h1 = html.match(H1_PATTERN);
+    if (h1) {
+      let fullName = htmlToText(h1[1]);
+      // Fix missing space between title and name
+      fullName = fullName.replace(MISSING_TITLE_SPACE_PATTERN, '$1 $2');
+
+      // Extract legislator type and remove the "Representative" or
+      // "Senator" prefix from the name, matching the prefix only once
+      const typeMatch = fullName.match(TITLE_PREFIX_PATTERN);
+      if (typeMatch) {
+        details.legislator_type = typeMatch[1];
       }
+      details.name = typeMatch ? fullName.slice(typeMatch[0].length) : fullName;
+    }
 
-      // Extract picture URL
-      const pictureImg = document.querySelector('img[src*="MemberPhoto"]');
-      if (pictureImg) {
-        details.picture_url = (pictureImg as HTMLImageElement).src;
-      }
+    // Extract picture URL, resolved against the profile like img.src
+    const pictureSrc = html.match(MEMBER_PHOTO_PATTERN);
+    if (pictureSrc) {
+      details.picture_url = new URL(htmlToText(pictureSrc[1] ?? pictureSrc[2]), profileUrl).href;
+    }
 
-      // Check if this is a former member (inactive)
-      const pageText = document.body.textContent || '';
-      if (
-        pageText.indexOf('This record belongs to a former Representative') !== -1 ||
-        pageText.indexOf('This record belongs to a former Senator') !== -1
-      ) {
-        details.is_active = false;
-      }
+    // Check if this is a former member (inactive)
+    const pageText = htmlToText(html);
+    if (
+      pageText.indexOf('This record belongs to a former Representative') !== -1 ||
+      pageText.indexOf('This record belongs to a former Senator') !== -1
+    ) {
+      details.is_active = false;
+    }
 
-      // Find all StaticText nodes in main content
-      const mainElement = document.querySelector('main');
-      if (mainElement) {
-        // Get all text nodes
-        const walker = document.createTreeWalker(mainElement, NodeFilter.SHOW_TEXT, null);
-
-        const textNodes: string[] = [];
-        let node: Node | null;
-        while ((node = walker.nextNode())) {
-          const text = node.textContent?.trim() || '';
-          if (text) {
-            textNodes.push(text);
-          }
-        }
+    // Walk the text nodes in main content
+    const main = html.match(MAIN_PATTERN);
+    if (main) {
+      const textNodes = extractTextNodes(main[1]);
 
-        for (let i = 0; i < textNodes.length; i++) {
-          const text = textNodes[i];
+      for (let i = 0; i < textNodes.length; i++) {
+        const text = textNodes[i];
 
-          // Extract district
-          if (text.indexOf('District') === 0) {
-            details.district = text.replace('District ', '');
-          }
+        // Extract district
+        if (text.indexOf('District') === 0) {
+          details.district = text.replace('District ', '');
+        }
 
-          // Extract party
-          if (
-            text === 'Republican' ||
-            text === 'Democrat' ||
-            text === 'Democratic' ||
-            text === 'Independent'
-          ) {
-            details.party_affiliation = text;
-          }
+        // Extract party
+        if (
+          text === 'Republican' ||
+          text === 'Democrat' ||
+          text === 'Democratic' ||
+          text === 'Independent'
+        ) {
+          details.party_affiliation = text;
+        }
 
-          // Extract year elected
-          if (text === 'Elected:' && i + 1 < textNodes.length) {
-            details.year_elected = textNodes[i + 1].trim();
-          }
+        // Extract year elected
+        if (text === 'Elected:' && i + 1 < textNodes.length) {
+          details.year_elected = textNodes[i + 1].trim();
+        }
 
-          // Extract years served
-          if (text === 'Years Served:' && i + 1 < textNodes.length) {
-            details.years_served = textNodes[i + 1].trim();
-          }
+        // Extract years served
+        if (text === 'Years Served:' && i + 1 < textNodes.length) {
+          details.years_served = textNodes[i + 1].trim();
         }
       }
+    }
+
+    return details;
+  }
+}
+
+/**
+ * Outcome of saving a scraped roster
+ */
+export interface SaveLegislatorsResult {
+  insertedCount: number;
+  updatedCount: number;
+  vacantCount: number;
+  failures: Array<{ legislator: LegislatorListItem; error: Error }>;
+}
+
+/**
+ * Upsert scraped legislators and link them to a session, with one request for
+ * all legislators and one for all session links.
+ *
+ * @param db - Database client
+ * @param sessionId - Session UUID
+ * @param legislators - Roster entries
+ * @param allDetails - Scraped details (or scrape error) for each roster entry, in order
+ * @returns Counts, plus the entries whose profile couldn't be scraped
+ */
+export async function saveLegislators(
+  db: DatabaseClient,
+  sessionId: string,
+  legislators: LegislatorListItem[],
+  allDetails: Array<LegislatorDetails | Error>
+): Promise<SaveLegislatorsResult> {
+  const records: LegislatorData[] = [];
+  const districts: string[] = [];
+  const result: SaveLegislatorsResult = { insertedCount: 0, updatedCount: 0, vacantCount: 0, failures: [] };
+
+  for (let i = 0; i < legislators.length; i++) {
+    const details = allDetails[i];
+    if (details instanceof Error) {
+      result.failures.push({ legislator: legislators[i], error: details });
+      continue;
+    }
 
-      return details;
+    // Skip vacant districts (no legislator_type means vacant)
+    if (!details.legislator_type) {
+      result.vacantCount++;
+      continue;
+    }
+
+    // Parse year_elected and years_served to numbers
+    records.push({
+      name: details.name,
+      legislator_type: details.legislator_type,
+      party_affiliation: details.party_affiliation,
+      year_elected: details.year_elected ? parseInt(details.year_elected, 10) : undefined,
+      years_served: details.years_served ? parseInt(details.years_served, 10) : undefined,
+      picture_url: details.picture_url,
+      is_active: details.is_active,
+      profile_url: details.profile_url,
     });
+    districts.push(details.district || legislators[i].district);
+  }
 
-    return details;
+  const upserted = await db.upsertLegislators(records);
+  const links: Array<{ legislatorId: string; district: string }> = [];
+  records.forEach((record, i) => {
+    const entry = upserted.get(record.name);
+    if (entry) {
+      links.push({ legislatorId: entry[0], district: districts[i] });
+    }
+  });
+  await db.linkLegislatorsToSession(sessionId, links);
+
+  for (const [, wasUpdated] of upserted.values()) {
+    if (wasUpdated) {
+      result.updatedCount++;
+    } else {
+      result.insertedCount++;
+    }
   }
+  return result;
 }
 
 /**
@@ -317,7 +445,7 @@ export async function runLegislatorScraper(
   const { year, sessionCode = 'R' } = options;
 
   // Get or create Database instance
-  const database = db || new DatabaseClient();
+  const database = db || getDatabase();
 
   // Create scraper instance
   const scraper = new MoLegislatorScraper(year || null, sessionCode, database);
@@ -340,60 +468,21 @@ export async function runLegislatorScraper(
     }
 
     console.log(`\nScraping detailed information for ${legislators.length} legislators...`);
-    let insertedCount = 0;
-    let updatedCount = 0;
-
-    for (let i = 0; i < legislators.length; i++) {
-      const legislator = legislators[i];
-      console.log(
-        `[${i + 1}/${legislators.length}] Scraping ${legislator.name} (District ${legislator.district})...`
-      );
-
-      try {
-        // Scrape full profile
-        const details = await scraper.scrapeLegislatorDetails(legislator.profile_url);
-
-        // Skip vacant districts (no legislator_type means vacant)
-        if (!details.legislator_type) {
-          console.log(`  ⊘ Skipped (vacant district)`);
-          continue;
-        }
-
-        // Parse year_elected and years_served to numbers
-        const yearElected = details.year_elected ? parseInt(details.year_elected, 10) : undefined;
-        const yearsServed = details.years_served ? parseInt(details.years_served, 10) : undefined;
-
-        // Upsert to database
-        const [legislatorId, wasUpdated] = await database.upsertLegislator({
-          name: details.name,
-          legislator_type: details.legislator_type,
-          party_affiliation: details.party_affiliation,
-          year_elected: yearElected,
-          years_served: yearsServed,
-          picture_url: details.picture_url,
-          is_active: details.is_active,
-          profile_url: details.profile_url,
-        });
-
-        // Link legislator to session
-        const district = details.district || legislator.district;
-        await database.linkLegislatorToSession(sessionId, legislatorId, district);
-
-        if (wasUpdated) {
-          console.log(`  ✓ Updated in database with ID: ${legislatorId}`);
-          updatedCount++;
-        } else {
-          console.log(`  ✓ Inserted to database with ID: ${legislatorId}`);
-          insertedCount++;
-        }
-      } catch (e) {
-        console.log(`  Error processing legislator: ${e}`);
-      }
+    const allDetails = await scraper.scrapeAllLegislatorDetails(legislators.map((l) => l.profile_url));
+    const { insertedCount, updatedCount, vacantCount, failures } = await saveLegislators(
+      database,
+      sessionId,
+      legislators,
+      allDetails
+    );
+    for (const { legislator, error } of failures) {
+      console.log(`  Error processing ${legislator.name} (District ${legislator.district}): ${error}`);
     }
 
     console.log(`\n✓ Successfully processed ${legislators.length} legislators`);
     console.log(`  - Inserted: ${insertedCount}`);
     console.log(`  - Updated: ${updatedCount}`);
+    console.log(`  - Skipped (vacant): ${vacantCount}`);
   } finally {
     // Close browser
     await scraper.close();
@@ -5,30 +5,42 @@
  * and stores data in the database.
  */
 
-import { chromium, Browser, Page } from 'playwright';
+import { chromium, Browser, BrowserContext, Page } from 'playwright';
 import {
   DatabaseClient,
+  getDatabase,
   SponsorData,
   ActionData,
   HearingData,
   DocumentData,
+  SessionLegislatorRecord,
 } from '@/database/client';
 import { Database } from '@/database/types';
 
 // Import domain modules
-import { BillData, DocumentInfo } from '../shared/types';
+import { BillData, BillListItem, BillLog, DocumentInfo, SessionScrapeStats } from '../shared/types';
 import { scrapeBillList, scrapeBillDetails } from './bills';
 import { scrapeHearings, parseHearingTime } from './hearings';
 import { scrapeActions } from './actions';
 import { scrapeCosponsors, extractDistrictFromSponsor } from './sponsors';
-import { downloadBillDocuments } from '../shared/documents';
-import { generateEmbeddingsForBill } from '../shared/embeddings';
+import { blockUnusedResources } from '../shared/browser';
+import { BillStore } from '../shared/store';
 import {
   MoLegislatorScraper,
   LegislatorListItem,
   LegislatorDetails,
+  saveLegislators,
 } from './legislators';
 
+// Bills processed at once; each in-flight bill gets its own pooled page
+const BILL_CONCURRENCY = 4;
+
+// Bill filter entries and bill numbers are compared with whitespace collapsed
+const WHITESPACE_PATTERN = /\s+/g;
+
+// session_scrape_runs phase recorded when a session's bills are all stored
+const SESSION_PHASE = 'house_bills';
+
 /**
  * Missouri House Bill Scraper
  *
@@ -39,33 +51,73 @@ class MoHouseBillScraper {
   private year?: number;
   private sessionCode: string;
   private browser: Browser | null = null;
-  private page: Page | null = null;
+  private sharedBrowser?: Browser;
+  private context: BrowserContext | null = null;
+  private pages: Page[] = [];
   private db: DatabaseClient;
   private sessionLegislatorCache: Map<string, string> = new Map();
+  private sessionRepresentatives: SessionLegislatorRecord[] | null = null;
   private sessionId?: string;
 
-  constructor(year: number | undefined, sessionCode: string, db: DatabaseClient) {
+  /**
+   * @param year - Legislative year (undefined for current session)
+   * @param sessionCode - Session code (R for Regular, E for Extraordinary)
+   * @param db - Database instance for all database operations
+   * @param browser - Browser to open the context in (launches and owns one if not provided)
+   */
+  constructor(year: number | undefined, sessionCode: string, db: DatabaseClient, browser?: Browser) {
     this.year = year;
     this.sessionCode = sessionCode;
     this.db = db;
+    this.sharedBrowser = browser;
   }
 
   async start(): Promise<void> {
-    this.browser = await chromium.launch({ headless: true });
-    this.page = await this.browser.newPage();
+    this.browser = this.sharedBrowser ?? (await chromium.launch({ headless: true }));
+
+    // browser.newPage() gives every page its own isolated context; opening
+    // them from one shared context lets all pages (and their page.request
+    // calls) reuse the same connection pool, HTTP cache and cookies
+    const context = await this.browser.newContext();
+    await blockUnusedResources(context);
+    this.context = context;
+    this.pages = await Promise.all(
+      Array.from({ length: BILL_CONCURRENCY }, () => context.newPage())
+    );
   }
 
   async close(): Promise<void> {
-    if (this.browser) {
+    if (this.context) {
+      await this.context.close();
+    }
+    // A shared browser is closed by whoever launched it
+    if (this.browser && !this.sharedBrowser) {
       await this.browser.close();
     }
   }
 
+  /**
+   * Get the browser the scraper's context runs in
+   */
+  getBrowser(): Browser {
+    if (!this.browser) {
+      throw new Error('Browser not started. Call start() first');
+    }
+    return this.browser;
+  }
+
   getPage(): Page {
-    if (!this.page) {
+    return this.getPages()[0];
+  }
+
+  /**
+   * Get all pooled pages, one per concurrently processed bill
+   */
+  getPages(): Page[] {
+    if (this.pages.length === 0) {
       throw new Error('Browser not started. Call start() first');
     }
-    return this.page;
+    return this.pages;
   }
 
   getYear(): number | undefined {
@@ -89,6 +141,31 @@ class MoHouseBillScraper {
     return this.sessionId;
   }
 
+  /**
+   * Load all of the session's Representatives in one query so sponsor lookups
+   * are resolved in memory. Call after legislators have been linked to the session.
+   */
+  async primeSessionLegislatorCache(): Promise<number> {
+    if (!this.sessionId) {
+      throw new Error('Session not initialized');
+    }
+
+    const records = await this.db.getSessionLegislators(this.sessionId);
+    this.sessionRepresentatives = records.filter(
+      (record) => record.legislator_type === 'Representative'
+    );
+    this.sessionLegislatorCache.clear();
+
+    for (const record of this.sessionRepresentatives) {
+      if (record.district) {
+        this.sessionLegislatorCache.set(`district:${record.district}`, record.id);
+      }
+      this.sessionLegislatorCache.set(`name:${record.name}`, record.id);
+    }
+
+    return this.sessionRepresentatives.length;
+  }
+
   async getSessionLegislatorByDistrict(district: string): Promise<string | null> {
     if (!this.sessionId) {
       throw new Error('Session not initialized');
@@ -99,6 +176,11 @@ class MoHouseBillScraper {
       return this.sessionLegislatorCache.get(cacheKey)!;
     }
 
+    // A primed cache holds every district, so a miss is final
+    if (this.sessionRepresentatives) {
+      return null;
+    }
+
     const sessionLegislatorId = await this.db.getSessionLegislatorByDistrict(
       this.sessionId,
       district
@@ -125,6 +207,20 @@ class MoHouseBillScraper {
       return this.sessionLegislatorCache.get(cacheKey)!;
     }
 
+    // A primed cache holds every exact name; fall back to an unambiguous
+    // last-name match, mirroring the database lookup
+    if (this.sessionRepresentatives) {
+      const suffix = ` ${name.toLowerCase()}`;
+      const matches = this.sessionRepresentatives.filter((record) =>
+        record.name.toLowerCase().endsWith(suffix)
+      );
+      if (matches.length !== 1) {
+        return null;
+      }
+      this.sessionLegislatorCache.set(cacheKey, matches[0].id);
+      return matches[0].id;
+    }
+
     // Pass 'Representative' to filter only reps (avoids conflicts with Senators with same last name)
     const sessionLegislatorId = await this.db.getSessionLegislatorByName(this.sessionId, name, 'Representative');
 
@@ -140,7 +236,8 @@ class MoHouseBillScraper {
    */
   async insertBillToDb(
     billData: BillData,
-    documentInfo?: DocumentInfo[]
+    documentInfo?: DocumentInfo[],
+    log: BillLog = console.log
   ): Promise<[string, boolean]> {
     if (!this.sessionId) {
       throw new Error('Session not initialized');
@@ -176,21 +273,16 @@ class MoHouseBillScraper {
             is_primary: true,
           });
         } else {
-          console.log(
-            `  Warning: Primary sponsor from district '${district}' not found in session_legislators`
-          );
+          log(`Warning: Primary sponsor from district '${district}' not found in session_legislators`);
         }
       } else {
-        console.log(
-          `  Warning: Could not extract district from primary sponsor: '${billData.sponsor}'`
-        );
+        log(`Warning: Could not extract district from primary sponsor: '${billData.sponsor}'`);
       }
     }
 
     // Co-sponsors
     if (billData.cosponsors) {
-      const cosponsorsNames = billData.cosponsors.split('; ');
-      for (const cosponsorName of cosponsorsNames) {
+      for (const cosponsorName of billData.cosponsors) {
         if (cosponsorName.trim()) {
           const sessionLegislatorId = await this.getSessionLegislatorByName(
             cosponsorName.trim()
@@ -201,53 +293,34 @@ class MoHouseBillScraper {
               is_primary: false,
             });
           } else {
-            console.log(`  Warning: Co-sponsor '${cosponsorName}' not found in session_legislators`);
+            log(`Warning: Co-sponsor '${cosponsorName}' not found in session_legislators`);
           }
         }
       }
     }
 
     // Prepare actions data
-    const actionsData: ActionData[] = [];
-    if (billData.actions) {
-      const actions = billData.actions.split(' || ');
-      for (let i = 0; i < actions.length; i++) {
-        const parts = actions[i].split(' | ');
-        if (parts.length === 2) {
-          actionsData.push({
-            action_date: parts[0].trim(),
-            description: parts[1].trim(),
-            sequence_order: i,
-          });
-        }
-      }
-    }
+    const actionsData: ActionData[] = (billData.actions || []).map((action, i) => ({
+      action_date: action.action_date,
+      description: action.description,
+      sequence_order: i,
+    }));
 
     // Prepare hearings data
-    const hearingsData: HearingData[] = [];
-    if (billData.hearings) {
-      const hearings = billData.hearings.split(' || ');
-      for (const hearingStr of hearings) {
-        const parts = hearingStr.split(' | ');
-        if (parts.length === 4) {
-          const timeText = parts[2].trim();
-          hearingsData.push({
-            committee_name: parts[0].trim(),
-            hearing_date: parts[1].trim() || undefined,
-            hearing_time: parseHearingTime(timeText) || undefined,
-            hearing_time_text: timeText || undefined,
-            location: parts[3].trim(),
-          });
-        }
-      }
-    }
+    const hearingsData: HearingData[] = (billData.hearings || []).map((hearing) => ({
+      committee_name: hearing.committee_name,
+      hearing_date: hearing.hearing_date || undefined,
+      hearing_time: parseHearingTime(hearing.hearing_time_text) || undefined,
+      hearing_time_text: hearing.hearing_time_text || undefined,
+      location: hearing.location,
+    }));
 
     // Prepare documents data (only include documents with extracted text)
     const documentsData: DocumentData[] = [];
     if (documentInfo && documentInfo.length > 0) {
       for (const docInfo of documentInfo) {
         if (!docInfo.extracted_text) {
-          console.log(`    Skipping ${docInfo.doc_id} - no extracted text`);
+          log(`Skipping ${docInfo.doc_id} - no extracted text`);
           continue;
         }
         documentsData.push({
@@ -280,8 +353,13 @@ class MoHouseBillScraper {
  * 2. Scrape bill list
  * 3. For each bill: scrape details → download PDFs → extract text → DB → embeddings
  *
- * @param options - Scraper options (year, sessionCode, limit, pdfDir, force, bills, skipLegislators)
+ * A closed session (see isClosedSession) is marked done once a full run (no
+ * limit or bill filter) stores every bill, document, embedding and roster
+ * entry; with skipDone, sessions already marked are skipped.
+ *
+ * @param options - Scraper options (year, sessionCode, limit, pdfDir, force, bills, skipLegislators, skipDone, browser)
  * @param db - Optional database instance (creates one if not provided)
+ * @returns Processed, skipped and failed bill counts
  */
 export async function scrapeBillsForSession(
   options: {
@@ -292,17 +370,28 @@ export async function scrapeBillsForSession(
     force?: boolean;
     bills?: string[];
     skipLegislators?: boolean;
+    skipDone?: boolean;
+    browser?: Browser;
   } = {},
   db?: DatabaseClient
-): Promise<void> {
-  const { year, sessionCode = 'R', limit, pdfDir = 'bill_pdfs', force = false, bills: billFilter, skipLegislators = false } = options;
-
-  const database = db || new DatabaseClient();
-  const scraper = new MoHouseBillScraper(year, sessionCode, database);
-
-  let processedCount = 0;
-  let skippedCount = 0;
-  let failedCount = 0;
+): Promise<SessionScrapeStats> {
+  const {
+    year,
+    sessionCode = 'R',
+    limit,
+    pdfDir = 'bill_pdfs',
+    force = false,
+    bills: billFilter,
+    skipLegislators = false,
+    skipDone = false,
+    browser,
+  } = options;
+
+  const database = db || getDatabase();
+  const scraper = new MoHouseBillScraper(year, sessionCode, database, browser);
+
+  // Whether the session's legislators were all saved
+  let rosterComplete = true;
 
   try {
     await scraper.start();
@@ -311,9 +400,37 @@ export async function scrapeBillsForSession(
     const sessionYear = year || 2026;
     console.log(`Session: ${sessionYear} ${sessionCode} (ID: ${sessionId})\n`);
 
+    if (skipDone && (await database.isSessionPhaseDone(sessionId, SESSION_PHASE))) {
+      console.log('Skipping - session already scraped (--skip-done flag set)');
+      return { processed: 0, skipped: 0, failed: 0 };
+    }
+
+    // Warm the bill and legislator ID caches so upserts skip per-row lookups,
+    // and load which bills are already stored and embedded so the skip check
+    // doesn't query per bill
+    const [embeddedBillIds] = await Promise.all([
+      force ? new Set<string>() : database.getFullyEmbeddedBillIds(sessionId),
+      database.prefetchSessionBills(sessionId),
+      database.prefetchLegislators(),
+    ]);
+
+    // The bill list doesn't depend on legislators (only sponsor linking does),
+    // so fetch it on the bill scraper's page while step 1 runs in its own
+    // context; failures surface when it's awaited in step 2
+    const page = scraper.getPage();
+    const billListTask = scrapeBillList(page, year, sessionCode);
+    billListTask.catch(() => {});
+
     // Step 1: Scrape legislators (unless skipped)
     if (!skipLegislators) {
-      const legislatorScraper = new MoLegislatorScraper(year || null, sessionCode, database);
+      // Open the legislator scraper's context in the same browser rather than
+      // launching a second Chromium for it
+      const legislatorScraper = new MoLegislatorScraper(
+        year || null,
+        sessionCode,
+        database,
+        scraper.getBrowser()
+      );
       await legislatorScraper.start();
 
       console.log('Step 1: Scraping legislators...');
@@ -321,72 +438,55 @@ export async function scrapeBillsForSession(
 
       if (!legislators || legislators.length === 0) {
         console.log('No legislators found!');
+        rosterComplete = false;
       } else {
         console.log(`Found ${legislators.length} legislators`);
-        let insertedCount = 0;
-        let updatedCount = 0;
-
-        for (let i = 0; i < legislators.length; i++) {
-          const legislator = legislators[i];
-          try {
-            const details = await legislatorScraper.scrapeLegislatorDetails(legislator.profile_url);
-
-            // Skip vacant districts
-            if (!details.legislator_type) {
-              continue;
-            }
-
-            const yearElected = details.year_elected ? parseInt(details.year_elected, 10) : undefined;
-            const yearsServed = details.years_served ? parseInt(details.years_served, 10) : undefined;
-
-            const [legislatorId, wasUpdated] = await database.upsertLegislator({
-              name: details.name,
-              legislator_type: details.legislator_type,
-              party_affiliation: details.party_affiliation,
-              year_elected: yearElected,
-              years_served: yearsServed,
-              picture_url: details.picture_url,
-              is_active: details.is_active,
-              profile_url: details.profile_url,
-            });
-
-            const district = details.district || legislator.district;
-            await database.linkLegislatorToSession(sessionId, legislatorId, district);
-
-            if (wasUpdated) {
-              updatedCount++;
-            } else {
-              insertedCount++;
-            }
-          } catch (e) {
-            // Silently continue on individual legislator errors
+        const allDetails = await legislatorScraper.scrapeAllLegislatorDetails(
+          legislators.map((l) => l.profile_url)
+        );
+        try {
+          const { insertedCount, updatedCount, failures } = await saveLegislators(
+            database,
+            sessionId,
+            legislators,
+            allDetails
+          );
+          console.log(`  ✓ Inserted: ${insertedCount}, Updated: ${updatedCount}`);
+          if (failures.length > 0) {
+            console.log(`  Warning: Could not scrape ${failures.length} legislator profile(s)`);
+            rosterComplete = false;
           }
+        } catch (e) {
+          // Bills can still be scraped against the legislators already stored
+          console.log(`  Warning: Could not save legislators: ${e}`);
+          rosterComplete = false;
         }
-
-        console.log(`  ✓ Inserted: ${insertedCount}, Updated: ${updatedCount}`);
       }
 
-      // Close legislator scraper browser
+      // Close legislator scraper context
       await legislatorScraper.close();
     } else {
       console.log('Step 1: Skipping legislators (--skip-legislators flag set)');
     }
 
+    // Resolve sponsors from one bulk load rather than a query per sponsor
+    const representativeCount = await scraper.primeSessionLegislatorCache();
+    console.log(`Loaded ${representativeCount} session legislators for sponsor lookup`);
+
     // Step 2: Get bill list
     console.log('\nStep 2: Fetching bill list...');
-    const page = scraper.getPage();
-    let bills = await scrapeBillList(page, year, sessionCode);
+    let bills = await billListTask;
 
     if (!bills || bills.length === 0) {
       console.log('No bills found!');
-      return;
+      return { processed: 0, skipped: 0, failed: 0 };
     }
     console.log(`Found ${bills.length} bills`);
 
     // Filter to specific bills if provided
     if (billFilter && billFilter.length > 0) {
-      const billFilterSet = new Set(billFilter.map(b => b.toUpperCase().replace(/\s+/g, ' ')));
-      bills = bills.filter(b => billFilterSet.has(b.bill_number.toUpperCase().replace(/\s+/g, ' ')));
+      const billFilterSet = new Set(billFilter.map(b => b.toUpperCase().replace(WHITESPACE_PATTERN, ' ')));
+      bills = bills.filter(b => billFilterSet.has(b.bill_number.toUpperCase().replace(WHITESPACE_PATTERN, ' ')));
       console.log(`Filtered to ${bills.length} bills matching --bills filter`);
     }
 
@@ -397,62 +497,49 @@ export async function scrapeBillsForSession(
     );
     console.log('='.repeat(60));
 
-    for (let i = 0; i < billsToProcess.length; i++) {
-      const bill = billsToProcess[i];
+    // Downloads, inserts and embeddings don't need a page, so they run in the
+    // background while the page workers scrape the next bills
+    const billStore = new BillStore(
+      database,
+      sessionId,
+      (billData, documentInfo, log) => scraper.insertBillToDb(billData, documentInfo, log),
+      pdfDir,
+      embeddedBillIds
+    );
+
+    const processBill = async (bill: BillListItem, index: number, page: Page): Promise<void> => {
       const billNumber = bill.bill_number;
-      console.log(`\n[${i + 1}/${billsToProcess.length}] ${billNumber}`);
-
-      // Check if bill already has extracted text (skip unless forced)
-      if (!force) {
-        const existingBillId = await database.getBillIdByNumber(billNumber, sessionId);
-        if (existingBillId) {
-          const hasExtractedText = await database.billHasExtractedText(existingBillId);
-          if (hasExtractedText) {
-            console.log(`  ⏭️  Skipping - already has extracted text`);
-            skippedCount++;
-            continue;
-          }
-        }
+      // Sessions may be scraped concurrently, so every line names the session
+      const log = (message: string) => console.log(`  [${sessionYear} ${sessionCode} ${billNumber}] ${message}`);
+      console.log(`\n[${index + 1}/${billsToProcess.length}] ${sessionYear} ${sessionCode} ${billNumber}`);
+
+      // Skip bills already stored with their embeddings (unless forced)
+      if (!force && (await billStore.skipIfStored(billNumber, log))) {
+        return;
       }
 
       try {
-        // Scrape bill details
-        const details = await scrapeBillDetails(page, billNumber, year, sessionCode);
-        console.log(`  Found ${details.bill_documents?.length || 0} document(s)`);
-
-        // Scrape co-sponsors
-        let cosponsors = '';
-        try {
-          cosponsors = await scrapeCosponsors(page, billNumber, year, sessionCode);
-        } catch (e) {
-          console.log(`  Warning: Could not scrape co-sponsors: ${e}`);
-        }
-
-        // Scrape bill actions
-        let actions = '';
-        try {
-          actions = await scrapeActions(page, billNumber, year, sessionCode);
-        } catch (e) {
-          console.log(`  Warning: Could not scrape actions: ${e}`);
-        }
-
-        // Scrape bill hearings
-        let hearings = '';
-        try {
-          hearings = await scrapeHearings(page, billNumber, year, sessionCode);
-        } catch (e) {
-          console.log(`  Warning: Could not scrape hearings: ${e}`);
-        }
-
-        // Download PDFs and extract text
-        let documentInfo: DocumentInfo[] = [];
-        try {
-          documentInfo = await downloadBillDocuments(billNumber, details.bill_documents || [], pdfDir);
-        } catch (e) {
-          console.log(`  Warning: Could not download PDFs: ${e}`);
-        }
-
-        // Merge and insert to database
+        // Details, co-sponsors, actions and hearings are separate pages with no
+        // dependencies between them, so load them concurrently. Only details
+        // navigates the page; the rest are plain requests through its context.
+        const [details, cosponsors, actions, hearings] = await Promise.all([
+          scrapeBillDetails(page, billNumber, year, sessionCode),
+          scrapeCosponsors(page, billNumber, year, sessionCode).catch((e) => {
+            log(`Warning: Could not scrape co-sponsors: ${e}`);
+            return [];
+          }),
+          scrapeActions(page, billNumber, year, sessionCode).catch((e) => {
+            log(`Warning: Could not scrape actions: ${e}`);
+            return [];
+          }),
+          scrapeHearings(page, billNumber, year, sessionCode).catch((e) => {
+            log(`Warning: Could not scrape hearings: ${e}`);
+            return [];
+          }),
+        ]);
+        log(`Found ${details.bill_documents?.length || 0} document(s)`);
+
+        // Merge for the database
         // Use title from details page, fall back to description from list page
         const merged: BillData = {
           ...bill,
@@ -463,41 +550,31 @@ export async function scrapeBillsForSession(
           hearings,
         };
 
-        const [billId, wasUpdated] = await scraper.insertBillToDb(merged, documentInfo);
-        console.log(`  ✓ ${wasUpdated ? 'Updated' : 'Inserted'} in database`);
-
-        // Delete existing embeddings if force flag is set (ensures idempotency)
-        if (force) {
-          try {
-            await database.deleteEmbeddingsForBill(billId);
-          } catch (e) {
-            console.log(`  Warning: Could not delete existing embeddings: ${e}`);
-          }
-        }
-
-        // Generate embeddings
-        try {
-          const embeddingsCount = await generateEmbeddingsForBill(database, billId, documentInfo);
-          if (embeddingsCount > 0) {
-            console.log(`  ✓ Generated ${embeddingsCount} embeddings`);
-          }
-        } catch (e) {
-          console.log(`  Warning: Could not generate embeddings: ${e}`);
-        }
-
-        processedCount++;
+        await billStore.push(billNumber, merged, details.bill_documents || [], log);
       } catch (e) {
-        console.log(`  ✗ Error: ${e}`);
-        failedCount++;
+        log(`✗ Error: ${e}`);
+        billStore.recordFailure();
       }
-    }
+    };
+
+    // Each worker owns one page and pulls the next bill until none are left
+    let nextIndex = 0;
+    await Promise.all(
+      scraper.getPages().map(async (page) => {
+        while (nextIndex < billsToProcess.length) {
+          const index = nextIndex++;
+          await processBill(billsToProcess[index], index, page);
+        }
+      })
+    );
 
-    // Summary
-    console.log(`\n${'='.repeat(60)}`);
-    console.log('COMPLETE');
-    console.log(`  ✓ Processed: ${processedCount}`);
-    if (skippedCount > 0) console.log(`  ⏭️  Skipped: ${skippedCount}`);
-    if (failedCount > 0) console.log(`  ✗ Failed: ${failedCount}`);
+    return await billStore.finish({
+      phase: SESSION_PHASE,
+      year: sessionYear,
+      sessionCode,
+      fullRun: !limit && !billFilter?.length,
+      rosterComplete,
+    });
   } finally {
     await scraper.close();
   }
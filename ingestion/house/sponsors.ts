@@ -3,6 +3,10 @@
  */
 
 import { Page } from 'playwright';
+import { fetchHtml, isClosedSession, parseTableRows } from '../shared/html';
+
+// Trailing "(151)" district suffix on sponsor names
+const DISTRICT_SUFFIX = /\((\d+)\)\s*$/;
 
 /**
  * Get the co-sponsors URL for a specific bill.
@@ -19,11 +23,8 @@ function getCosponsorsUrl(billNumber: string, year?: number, sessionCode: string
  * @returns District number as string, or null if not found
  */
 export function extractDistrictFromSponsor(sponsorText: string): string | null {
-  const match = sponsorText.match(/\((\d+)\)$/);
-  if (match) {
-    return match[1];
-  }
-  return null;
+  const match = DISTRICT_SUFFIX.exec(sponsorText);
+  return match ? match[1] : null;
 }
 
 /**
@@ -33,33 +34,27 @@ export function extractDistrictFromSponsor(sponsorText: string): string | null {
  * @param billNumber - Bill number (e.g., "HB 1366")
  * @param year - Session year
  * @param sessionCode - Session code
- * @returns Semicolon-delimited string of co-sponsor names
+ * @returns Co-sponsor names
  */
 export async function scrapeCosponsors(
   page: Page,
   billNumber: string,
   year?: number,
   sessionCode: string = 'R'
-): Promise<string> {
+): Promise<string[]> {
   const url = getCosponsorsUrl(billNumber, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
-
-  const cosponsors = await page.evaluate(() => {
-    const rows = Array.from(document.querySelectorAll('tr'));
-    const cosponsorNames: string[] = [];
-
-    for (let i = 0; i < rows.length; i++) {
-      const cells = Array.from(rows[i].querySelectorAll('td'));
-      if (cells.length >= 4) {
-        const name = cells[0].textContent?.trim() || '';
-        if (name && name !== 'Member') {
-          cosponsorNames.push(name);
-        }
+  const html = await fetchHtml(page, url, { immutable: isClosedSession(year) });
+
+  const cosponsorNames: string[] = [];
+  for (const row of parseTableRows(html)) {
+    const cells = row.filter((cell) => cell.tag === 'TD');
+    if (cells.length >= 4) {
+      const name = cells[0].text;
+      if (name && name !== 'Member') {
+        cosponsorNames.push(name);
       }
     }
+  }
 
-    return cosponsorNames.join('; ');
-  });
-
-  return cosponsors;
+  return cosponsorNames;
 }
@@ -3,6 +3,8 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
+import { ScrapedAction } from '../shared/types';
 
 /**
  * Get the two-digit year code for Senate URLs.
@@ -27,19 +29,19 @@ function getActionsUrl(billId: string, year: number, sessionCode: string = 'R'):
  * @param billId - Internal Senate bill ID
  * @param year - Session year
  * @param sessionCode - Session code
- * @returns Actions string in format "date | description || date | description"
+ * @returns Actions in page order
  */
 export async function scrapeSendBillActions(
   page: Page,
   billId: string,
   year: number,
   sessionCode: string = 'R'
-): Promise<string> {
+): Promise<ScrapedAction[]> {
   const url = getActionsUrl(billId, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle' });
 
-  const actions = await page.evaluate((): string => {
-    const actionParts: string[] = [];
+  const actions = await page.evaluate((): ScrapedAction[] => {
+    const actionRows: ScrapedAction[] = [];
 
     // The actions page typically has a table or list of actions
     // Try to find action rows
@@ -52,12 +54,12 @@ export async function scrapeSendBillActions(
         const description = cells[1].textContent?.trim() || '';
 
         if (date && description) {
-          actionParts.push(`${date} | ${description}`);
+          actionRows.push({ action_date: date, description });
         }
       }
     }
 
-    return actionParts.join(' || ');
+    return actionRows;
   });
 
   return actions;
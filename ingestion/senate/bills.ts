@@ -3,8 +3,12 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
 import { BillListItem, BillDetails } from '../shared/types';
 
+const BILL_ID_PATTERN = /BillID=(\d+)/;
+const SENATOR_ID_PATTERN = /\/Member\/(\d+)/;
+
 /**
  * Get the two-digit year code for Senate URLs.
  * e.g., 2026 -> "26", 2025 -> "25"
@@ -33,7 +37,7 @@ function getBillDetailUrl(billId: string, year: number, sessionCode: string = 'R
  * e.g., "https://www.senate.mo.gov/26info/BTS_Web/Bill.aspx?SessionType=R&BillID=416" -> "416"
  */
 export function extractBillIdFromUrl(url: string): string | null {
-  const match = url.match(/BillID=(\d+)/);
+  const match = url.match(BILL_ID_PATTERN);
   return match ? match[1] : null;
 }
 
@@ -42,7 +46,7 @@ export function extractBillIdFromUrl(url: string): string | null {
  * e.g., "https://www.senate.mo.gov/Senators/Member/28" -> "28"
  */
 export function extractSenatorIdFromUrl(url: string): string | null {
-  const match = url.match(/\/Member\/(\d+)/);
+  const match = url.match(SENATOR_ID_PATTERN);
   return match ? match[1] : null;
 }
 
@@ -67,7 +71,7 @@ export async function scrapeSendBillList(
   const url = getBillListUrl(year, sessionCode);
   console.log(`Navigating to ${url}...`);
 
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle' });
 
   // Wait for the bill rows to load
   await page.waitForSelector('.row-even, .row-odd', { timeout: 15000 });
@@ -154,7 +158,7 @@ export async function scrapeSendBillDetails(
   sessionCode: string = 'R'
 ): Promise<SenateBillDetails> {
   const url = getBillDetailUrl(billId, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle', timeout: 60000 });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle', timeout: 60000 });
 
   const details = await page.evaluate((): SenateBillDetails => {
     const result: SenateBillDetails = {
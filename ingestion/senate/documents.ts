@@ -3,6 +3,7 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
 import { ScrapedDocument } from '../shared/types';
 
 /**
@@ -47,7 +48,7 @@ export async function scrapeSendBillDocuments(
   sessionCode: string = 'R'
 ): Promise<ScrapedDocument[]> {
   const url = getBillTextUrl(billId, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle' });
 
   const documents = await page.evaluate((billNum: string): ScrapedDocument[] => {
     const docs: ScrapedDocument[] = [];
@@ -97,7 +98,7 @@ export async function scrapeSendBillSummaries(
   sessionCode: string = 'R'
 ): Promise<ScrapedDocument[]> {
   const url = getSummariesUrl(billId, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle' });
 
   const documents = await page.evaluate((billNum: string): ScrapedDocument[] => {
     const docs: ScrapedDocument[] = [];
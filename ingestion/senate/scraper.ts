@@ -15,24 +15,43 @@
  * 8. Generate embeddings
  */
 
-import { chromium, Browser, Page } from 'playwright';
-import { DatabaseClient, SponsorData, ActionData, DocumentData } from '@/database/client';
+import { chromium, Browser, BrowserContext, Page } from 'playwright';
+import {
+  DatabaseClient,
+  getDatabase,
+  SponsorData,
+  ActionData,
+  DocumentData,
+  SessionLegislatorRecord,
+} from '@/database/client';
 import { Database } from '@/database/types';
 
 // Import domain modules
-import { BillData, DocumentInfo } from '../shared/types';
+import { BillData, BillLog, DocumentInfo, ScrapedAction, SessionScrapeStats } from '../shared/types';
 import {
   scrapeSendBillList,
   scrapeSendBillDetails,
   SenateBillListItem,
-  SenateBillDetails,
 } from './bills';
 import { scrapeSendBillActions } from './actions';
 import { scrapeSendBillDocuments, scrapeSendBillSummaries } from './documents';
 import { scrapeSenatorProfile, SenatorProfile } from './senators';
 import { scrapeSenateCoSponsors } from './sponsors';
-import { downloadBillDocuments } from '../shared/documents';
-import { generateEmbeddingsForBill } from '../shared/embeddings';
+import { blockUnusedResources } from '../shared/browser';
+import { allSettledOrThrow } from '../shared/concurrency';
+import { BillStore } from '../shared/store';
+
+// Bills processed at once
+const BILL_CONCURRENCY = 3;
+
+// Pages per in-flight bill: details, bill text, summaries, actions, co-sponsors
+const PAGES_PER_BILL = 5;
+
+// Bill filter entries and bill numbers are compared with whitespace collapsed
+const WHITESPACE_PATTERN = /\s+/g;
+
+// session_scrape_runs phase recorded when a session's bills are all stored
+const SESSION_PHASE = 'senate_bills';
 
 /**
  * Enhanced bill data with senator profile information.
@@ -50,34 +69,68 @@ class MoSenateBillScraper {
   private year: number;
   private sessionCode: string;
   private browser: Browser | null = null;
-  private page: Page | null = null;
+  private sharedBrowser?: Browser;
+  private context: BrowserContext | null = null;
+  private pageSets: Page[][] = [];
   private db: DatabaseClient;
   private sessionLegislatorCache: Map<string, string> = new Map();
+  private sessionSenators: SessionLegislatorRecord[] | null = null;
   private senatorProfileCache: Map<string, SenatorProfile> = new Map();
   private sessionId?: string;
 
-  constructor(year: number, sessionCode: string, db: DatabaseClient) {
+  /**
+   * @param year - Legislative year
+   * @param sessionCode - Session code (R for Regular, E for Extraordinary)
+   * @param db - Database instance for all database operations
+   * @param browser - Browser to open the context in (launches and owns one if not provided)
+   */
+  constructor(year: number, sessionCode: string, db: DatabaseClient, browser?: Browser) {
     this.year = year;
     this.sessionCode = sessionCode;
     this.db = db;
+    this.sharedBrowser = browser;
   }
 
   async start(): Promise<void> {
-    this.browser = await chromium.launch({ headless: true });
-    this.page = await this.browser.newPage();
+    this.browser = this.sharedBrowser ?? (await chromium.launch({ headless: true }));
+
+    // All pages share one context (connection pool, cookies)
+    const context = await this.browser.newContext();
+    // Keep stylesheets: the Senate extractors read innerText, whose line
+    // breaks depend on CSS layout
+    await blockUnusedResources(context, ['image', 'font', 'media']);
+    this.context = context;
+
+    this.pageSets = await Promise.all(
+      Array.from({ length: BILL_CONCURRENCY }, () =>
+        Promise.all(Array.from({ length: PAGES_PER_BILL }, () => context.newPage()))
+      )
+    );
   }
 
   async close(): Promise<void> {
-    if (this.browser) {
+    if (this.context) {
+      await this.context.close();
+    }
+    // A shared browser is closed by whoever launched it
+    if (this.browser && !this.sharedBrowser) {
       await this.browser.close();
     }
   }
 
   getPage(): Page {
-    if (!this.page) {
+    return this.getPageSets()[0][0];
+  }
+
+  /**
+   * Get the pooled pages: one set per concurrently processed bill, with one
+   * page per sub-page that bill loads in parallel
+   */
+  getPageSets(): Page[][] {
+    if (this.pageSets.length === 0) {
       throw new Error('Browser not started. Call start() first');
     }
-    return this.page;
+    return this.pageSets;
   }
 
   getYear(): number {
@@ -102,17 +155,43 @@ class MoSenateBillScraper {
 
   /**
    * Scrape senator profile with caching.
+   *
+   * @param senatorId - Senator member ID
+   * @param page - Page to load the profile in (default: the first pooled page)
    */
-  async getSenatorProfile(senatorId: string): Promise<SenatorProfile> {
+  async getSenatorProfile(senatorId: string, page: Page = this.getPage()): Promise<SenatorProfile> {
     if (this.senatorProfileCache.has(senatorId)) {
       return this.senatorProfileCache.get(senatorId)!;
     }
 
-    const profile = await scrapeSenatorProfile(this.getPage(), senatorId);
+    const profile = await scrapeSenatorProfile(page, senatorId);
     this.senatorProfileCache.set(senatorId, profile);
     return profile;
   }
 
+  /**
+   * Load all of the session's Senators in one query so sponsor lookups are
+   * resolved in memory. Call after senators have been linked to the session.
+   */
+  async primeSessionLegislatorCache(): Promise<number> {
+    if (!this.sessionId) {
+      throw new Error('Session not initialized');
+    }
+
+    const records = await this.db.getSessionLegislators(this.sessionId);
+    this.sessionSenators = records.filter((record) => record.legislator_type === 'Senator');
+    this.sessionLegislatorCache.clear();
+
+    for (const record of this.sessionSenators) {
+      if (record.profile_url) {
+        this.sessionLegislatorCache.set(`profile_url:${record.profile_url}`, record.id);
+      }
+      this.sessionLegislatorCache.set(`name:${record.name}`, record.id);
+    }
+
+    return this.sessionSenators.length;
+  }
+
   /**
    * Get session legislator by profile URL (from sponsor URL).
    * This is the most reliable method as it directly matches the stored profile_url.
@@ -127,6 +206,11 @@ class MoSenateBillScraper {
       return this.sessionLegislatorCache.get(cacheKey)!;
     }
 
+    // A primed cache holds every profile URL, so a miss is final
+    if (this.sessionSenators) {
+      return null;
+    }
+
     const sessionLegislatorId = await this.db.getSessionLegislatorByProfileUrl(this.sessionId, profileUrl);
 
     if (sessionLegislatorId) {
@@ -151,6 +235,20 @@ class MoSenateBillScraper {
       return this.sessionLegislatorCache.get(cacheKey)!;
     }
 
+    // A primed cache holds every exact name; fall back to an unambiguous
+    // last-name match, mirroring the database lookup
+    if (this.sessionSenators) {
+      const suffix = ` ${name.toLowerCase()}`;
+      const matches = this.sessionSenators.filter((record) =>
+        record.name.toLowerCase().endsWith(suffix)
+      );
+      if (matches.length !== 1) {
+        return null;
+      }
+      this.sessionLegislatorCache.set(cacheKey, matches[0].id);
+      return matches[0].id;
+    }
+
     // Pass 'Senator' to filter only senators (avoids conflicts with House reps with same last name)
     const sessionLegislatorId = await this.db.getSessionLegislatorByName(this.sessionId, name, 'Senator');
 
@@ -166,7 +264,8 @@ class MoSenateBillScraper {
    */
   async insertBillToDb(
     billData: BillData,
-    documentInfo?: DocumentInfo[]
+    documentInfo?: DocumentInfo[],
+    log: BillLog = console.log
   ): Promise<[string, boolean]> {
     if (!this.sessionId) {
       throw new Error('Session not initialized');
@@ -197,14 +296,13 @@ class MoSenateBillScraper {
           is_primary: true,
         });
       } else {
-        console.log(`  Warning: Sponsor '${billData.sponsor}' (URL: ${billData.sponsor_url}) not found in session_legislators`);
+        log(`Warning: Sponsor '${billData.sponsor}' (URL: ${billData.sponsor_url}) not found in session_legislators`);
       }
     }
 
     // Co-sponsors
     if (billData.cosponsors) {
-      const cosponsorNames = billData.cosponsors.split('; ');
-      for (const cosponsorName of cosponsorNames) {
+      for (const cosponsorName of billData.cosponsors) {
         if (cosponsorName.trim()) {
           const sessionLegislatorId = await this.getSessionLegislatorByName(cosponsorName.trim());
           if (sessionLegislatorId) {
@@ -213,34 +311,25 @@ class MoSenateBillScraper {
               is_primary: false,
             });
           } else {
-            console.log(`  Warning: Co-sponsor '${cosponsorName}' not found in session_legislators`);
+            log(`Warning: Co-sponsor '${cosponsorName}' not found in session_legislators`);
           }
         }
       }
     }
 
     // Prepare actions data
-    const actionsData: ActionData[] = [];
-    if (billData.actions) {
-      const actions = billData.actions.split(' || ');
-      for (let i = 0; i < actions.length; i++) {
-        const parts = actions[i].split(' | ');
-        if (parts.length === 2) {
-          actionsData.push({
-            action_date: parts[0].trim(),
-            description: parts[1].trim(),
-            sequence_order: i,
-          });
-        }
-      }
-    }
+    const actionsData: ActionData[] = (billData.actions || []).map((action, i) => ({
+      action_date: action.action_date,
+      description: action.description,
+      sequence_order: i,
+    }));
 
     // Prepare documents data (only include documents with extracted text)
     const documentsData: DocumentData[] = [];
     if (documentInfo && documentInfo.length > 0) {
       for (const docInfo of documentInfo) {
         if (!docInfo.extracted_text) {
-          console.log(`    Skipping ${docInfo.doc_id} - no extracted text`);
+          log(`Skipping ${docInfo.doc_id} - no extracted text`);
           continue;
         }
         documentsData.push({
@@ -271,8 +360,13 @@ class MoSenateBillScraper {
  *
  * Processes each bill sequentially: scrape → download PDFs → extract text → DB → embeddings.
  *
- * @param options - Scraper options (year, sessionCode, limit, pdfDir, force, bills, skipLegislators)
+ * A closed session (see isClosedSession) is marked done once a full run (no
+ * limit or bill filter) stores every bill, document, embedding and roster
+ * entry; with skipDone, sessions already marked are skipped.
+ *
+ * @param options - Scraper options (year, sessionCode, limit, pdfDir, force, bills, skipLegislators, skipDone, browser)
  * @param db - Optional database instance (creates one if not provided)
+ * @returns Processed, skipped and failed bill counts
  */
 export async function scrapeSenateBillsForSession(
   options: {
@@ -283,9 +377,11 @@ export async function scrapeSenateBillsForSession(
     force?: boolean;
     bills?: string[];
     skipLegislators?: boolean;
+    skipDone?: boolean;
+    browser?: Browser;
   } = {},
   db?: DatabaseClient
-): Promise<void> {
+): Promise<SessionScrapeStats> {
   const {
     year = 2026,
     sessionCode = 'R',
@@ -294,14 +390,15 @@ export async function scrapeSenateBillsForSession(
     force = false,
     bills: billFilter,
     skipLegislators = false,
+    skipDone = false,
+    browser,
   } = options;
 
-  const database = db || new DatabaseClient();
-  const scraper = new MoSenateBillScraper(year, sessionCode, database);
+  const database = db || getDatabase();
+  const scraper = new MoSenateBillScraper(year, sessionCode, database, browser);
 
-  let processedCount = 0;
-  let skippedCount = 0;
-  let failedCount = 0;
+  // Whether the session's senators were all saved
+  let rosterComplete = true;
 
   try {
     await scraper.start();
@@ -309,6 +406,20 @@ export async function scrapeSenateBillsForSession(
     const sessionId = await scraper.getOrCreateSession();
     console.log(`Session: ${year} ${sessionCode} (ID: ${sessionId})\n`);
 
+    if (skipDone && (await database.isSessionPhaseDone(sessionId, SESSION_PHASE))) {
+      console.log('Skipping - session already scraped (--skip-done flag set)');
+      return { processed: 0, skipped: 0, failed: 0 };
+    }
+
+    // Warm the bill and legislator ID caches so upserts skip per-row lookups,
+    // and load which bills are already stored and embedded so the skip check
+    // doesn't query per bill
+    const [embeddedBillIds] = await Promise.all([
+      force ? new Set<string>() : database.getFullyEmbeddedBillIds(sessionId),
+      database.prefetchSessionBills(sessionId),
+      database.prefetchLegislators(),
+    ]);
+
     const page = scraper.getPage();
 
     // Step 1: Get list of bills from the main screen
@@ -317,7 +428,7 @@ export async function scrapeSenateBillsForSession(
 
     if (!bills || bills.length === 0) {
       console.log('No Senate bills found!');
-      return;
+      return { processed: 0, skipped: 0, failed: 0 };
     }
 
     console.log(`Found ${bills.length} bills`);
@@ -325,8 +436,8 @@ export async function scrapeSenateBillsForSession(
     // Filter to specific bills if provided
     let filteredBills = bills;
     if (billFilter && billFilter.length > 0) {
-      const billFilterSet = new Set(billFilter.map(b => b.toUpperCase().replace(/\s+/g, ' ')));
-      filteredBills = bills.filter(b => billFilterSet.has(b.bill_number.toUpperCase().replace(/\s+/g, ' ')));
+      const billFilterSet = new Set(billFilter.map(b => b.toUpperCase().replace(WHITESPACE_PATTERN, ' ')));
+      filteredBills = bills.filter(b => billFilterSet.has(b.bill_number.toUpperCase().replace(WHITESPACE_PATTERN, ' ')));
       console.log(`Filtered to ${filteredBills.length} bills matching --bills filter`);
     }
 
@@ -342,37 +453,51 @@ export async function scrapeSenateBillsForSession(
 
       const senatorProfiles = new Map<string, SenatorProfile>();
 
-      for (let i = 0; i < uniqueSenatorIds.length; i++) {
-        const senatorId = uniqueSenatorIds[i]!;
-        let retries = 3;
-        while (retries > 0) {
-          try {
-            console.log(`  [${i + 1}/${uniqueSenatorIds.length}] Scraping senator ${senatorId}...`);
-            const profile = await scraper.getSenatorProfile(senatorId);
-            senatorProfiles.set(senatorId, profile);
-            console.log(`    ${profile.name} (District ${profile.district})`);
-            break; // Success, exit retry loop
-          } catch (e) {
-            retries--;
-            if (retries > 0) {
-              console.log(`    Retry (${3 - retries}/3) after error: ${e}`);
-              await new Promise((r) => setTimeout(r, 2000)); // Wait 2s before retry
-            } else {
-              console.log(`    Failed after 3 attempts: ${e}`);
+      // Profiles are independent pages, so load them on every pooled page at once
+      let nextSenator = 0;
+      const profileWorker = async (page: Page): Promise<void> => {
+        while (nextSenator < uniqueSenatorIds.length) {
+          const i = nextSenator++;
+          const senatorId = uniqueSenatorIds[i]!;
+          let retries = 3;
+          while (retries > 0) {
+            try {
+              console.log(`  [${i + 1}/${uniqueSenatorIds.length}] Scraping senator ${senatorId}...`);
+              const profile = await scraper.getSenatorProfile(senatorId, page);
+              senatorProfiles.set(senatorId, profile);
+              console.log(`    ${profile.name} (District ${profile.district})`);
+              break; // Success, exit retry loop
+            } catch (e) {
+              retries--;
+              if (retries > 0) {
+                console.log(`    Retry (${3 - retries}/3) for senator ${senatorId} after error: ${e}`);
+                await new Promise((r) => setTimeout(r, 2000)); // Wait 2s before retry
+              } else {
+                console.log(`    Failed senator ${senatorId} after 3 attempts: ${e}`);
+              }
             }
           }
         }
-      }
+      };
+      await Promise.all(scraper.getPageSets().flat().map(profileWorker));
 
-      // Insert senators into database
+      // Insert senators into database: one upsert for all senators and one
+      // for their session links
       console.log('\n  Inserting senators into database...');
       let insertedCount = 0;
       let updatedCount = 0;
 
-      for (const profile of senatorProfiles.values()) {
-        try {
-          // Upsert legislator to database
-          const [legislatorId, wasUpdated] = await database.upsertLegislator({
+      // Keep the roster order stable regardless of which profile loaded first
+      const profiles = uniqueSenatorIds
+        .map((senatorId) => senatorProfiles.get(senatorId!))
+        .filter((profile): profile is SenatorProfile => profile !== undefined);
+      if (profiles.length < uniqueSenatorIds.length) {
+        rosterComplete = false;
+      }
+
+      try {
+        const upserted = await database.upsertLegislators(
+          profiles.map((profile) => ({
             name: profile.name,
             legislator_type: 'Senator',
             party_affiliation: profile.party || null,
@@ -381,19 +506,28 @@ export async function scrapeSenateBillsForSession(
             picture_url: profile.photo_url || null,
             is_active: true,
             profile_url: profile.profile_url,
-          });
+          }))
+        );
 
-          // Link to session
-          await database.linkLegislatorToSession(sessionId, legislatorId, profile.district);
+        const links: Array<{ legislatorId: string; district: string }> = [];
+        for (const profile of profiles) {
+          const entry = upserted.get(profile.name);
+          if (entry) {
+            links.push({ legislatorId: entry[0], district: profile.district });
+          }
+        }
+        await database.linkLegislatorsToSession(sessionId, links);
 
+        for (const [, wasUpdated] of upserted.values()) {
           if (wasUpdated) {
             updatedCount++;
           } else {
             insertedCount++;
           }
-        } catch (e) {
-          console.log(`    Warning: Failed to insert senator ${profile.name}: ${e}`);
         }
+      } catch (e) {
+        console.log(`    Warning: Failed to insert senators: ${e}`);
+        rosterComplete = false;
       }
 
       console.log(`  ✓ Inserted: ${insertedCount}, Updated: ${updatedCount}`);
@@ -407,6 +541,10 @@ export async function scrapeSenateBillsForSession(
       console.log('\nStep 2: Skipping legislators (--skip-legislators flag set)');
     }
 
+    // Resolve sponsors from one bulk load rather than a query per sponsor
+    const senatorCount = await scraper.primeSessionLegislatorCache();
+    console.log(`Loaded ${senatorCount} session senators for sponsor lookup`);
+
     // Step 3+: Process bills
     const billsToProcess = limit ? enhancedBills.slice(0, limit) : enhancedBills;
     console.log(
@@ -414,84 +552,71 @@ export async function scrapeSenateBillsForSession(
     );
     console.log('='.repeat(60));
 
-    for (let i = 0; i < billsToProcess.length; i++) {
-      const bill = billsToProcess[i];
+    // Downloads, inserts and embeddings don't need a page, so they run in the
+    // background while the page workers scrape the next bills
+    const billStore = new BillStore(
+      database,
+      sessionId,
+      (billData, documentInfo, log) => scraper.insertBillToDb(billData, documentInfo, log),
+      pdfDir,
+      embeddedBillIds
+    );
+
+    const processBill = async (
+      bill: EnhancedSenateBillListItem,
+      index: number,
+      pages: Page[]
+    ): Promise<void> => {
       const billNumber = bill.bill_number;
       const billId = bill.bill_id;
-      console.log(`\n[${i + 1}/${billsToProcess.length}] ${billNumber}`);
-
-      // Check if bill already has extracted text (skip unless forced)
-      if (!force) {
-        const existingBillId = await database.getBillIdByNumber(billNumber, sessionId);
-        if (existingBillId) {
-          const hasExtractedText = await database.billHasExtractedText(existingBillId);
-          if (hasExtractedText) {
-            console.log(`  Skipping - already has extracted text`);
-            skippedCount++;
-            continue;
-          }
-        }
+      // Sessions may be scraped concurrently, so every line names the session
+      const log = (message: string) => console.log(`  [${year} ${sessionCode} ${billNumber}] ${message}`);
+      console.log(`\n[${index + 1}/${billsToProcess.length}] ${year} ${sessionCode} ${billNumber}`);
+
+      // Skip bills already stored with their embeddings (unless forced)
+      if (!force && (await billStore.skipIfStored(billNumber, log))) {
+        return;
       }
 
       try {
-        // Scrape bill details
-        const details: SenateBillDetails = await scrapeSendBillDetails(page, billId, year, sessionCode);
-        console.log(`  Title: ${details.title?.substring(0, 50)}...`);
+        // The detail, document, summary, action and co-sponsor pages are
+        // independent, so load them concurrently, one pooled page each. Every
+        // load settles before a failure is raised, so no navigation for this
+        // bill is still running when the next bill reuses the page set.
+        const [detailsPage, documentsPage, summariesPage, actionsPage, cosponsorsPage] = pages;
+        const [details, billDocs, summaryDocs, actions, cosponsors] = await allSettledOrThrow([
+          scrapeSendBillDetails(detailsPage, billId, year, sessionCode),
+          scrapeSendBillDocuments(documentsPage, billId, billNumber, year, sessionCode),
+          scrapeSendBillSummaries(summariesPage, billId, billNumber, year, sessionCode),
+          scrapeSendBillActions(actionsPage, billId, year, sessionCode).catch((e): ScrapedAction[] => {
+            log(`Warning: Could not scrape actions: ${e}`);
+            return [];
+          }),
+          scrapeSenateCoSponsors(cosponsorsPage, billId, year, sessionCode).catch((e): string[] => {
+            log(`Warning: Could not scrape co-sponsors: ${e}`);
+            return [];
+          }),
+        ]);
+
+        log(`Title: ${details.title?.substring(0, 50)}...`);
         if (details.committee_name) {
-          console.log(`  Committee: ${details.committee_name}`);
+          log(`Committee: ${details.committee_name}`);
         }
         if (details.bill_summary) {
-          console.log(`  Summary: ${details.bill_summary.substring(0, 60)}...`);
+          log(`Summary: ${details.bill_summary.substring(0, 60)}...`);
         }
-
-        // Scrape bill documents (PDFs)
-        const billDocs = await scrapeSendBillDocuments(page, billId, billNumber, year, sessionCode);
-        console.log(`  Found ${billDocs.length} bill text document(s)`);
-
-        // Scrape bill summaries
-        const summaryDocs = await scrapeSendBillSummaries(
-          page,
-          billId,
-          billNumber,
-          year,
-          sessionCode
-        );
+        log(`Found ${billDocs.length} bill text document(s)`);
         if (summaryDocs.length > 0) {
-          console.log(`  Found ${summaryDocs.length} summary document(s)`);
+          log(`Found ${summaryDocs.length} summary document(s)`);
+        }
+        if (cosponsors.length > 0) {
+          log(`Found ${cosponsors.length} co-sponsor(s)`);
         }
 
         // Combine all documents
         const allDocs = [...billDocs, ...summaryDocs];
 
-        // Scrape bill actions
-        let actions = '';
-        try {
-          actions = await scrapeSendBillActions(page, billId, year, sessionCode);
-        } catch (e) {
-          console.log(`  Warning: Could not scrape actions: ${e}`);
-        }
-
-        // Scrape co-sponsors
-        let cosponsors = '';
-        try {
-          cosponsors = await scrapeSenateCoSponsors(page, billId, year, sessionCode);
-          if (cosponsors) {
-            const count = cosponsors.split('; ').length;
-            console.log(`  Found ${count} co-sponsor(s)`);
-          }
-        } catch (e) {
-          console.log(`  Warning: Could not scrape co-sponsors: ${e}`);
-        }
-
-        // Download PDFs and extract text
-        let documentInfo: DocumentInfo[] = [];
-        try {
-          documentInfo = await downloadBillDocuments(billNumber, allDocs, pdfDir);
-        } catch (e) {
-          console.log(`  Warning: Could not download PDFs: ${e}`);
-        }
-
-        // Merge and insert to database
+        // Merge for the database
         // Use title from details page, fall back to description from list page
         const merged: BillData = {
           bill_number: billNumber,
@@ -506,41 +631,31 @@ export async function scrapeSenateBillsForSession(
           cosponsors,
         };
 
-        const [dbBillId, wasUpdated] = await scraper.insertBillToDb(merged, documentInfo);
-        console.log(`  ${wasUpdated ? 'Updated' : 'Inserted'} in database`);
-
-        // Delete existing embeddings if force flag is set (ensures idempotency)
-        if (force) {
-          try {
-            await database.deleteEmbeddingsForBill(dbBillId);
-          } catch (e) {
-            console.log(`  Warning: Could not delete existing embeddings: ${e}`);
-          }
-        }
-
-        // Generate embeddings
-        try {
-          const embeddingsCount = await generateEmbeddingsForBill(database, dbBillId, documentInfo);
-          if (embeddingsCount > 0) {
-            console.log(`  Generated ${embeddingsCount} embeddings`);
-          }
-        } catch (e) {
-          console.log(`  Warning: Could not generate embeddings: ${e}`);
-        }
-
-        processedCount++;
+        await billStore.push(billNumber, merged, allDocs, log);
       } catch (e) {
-        console.log(`  Error: ${e}`);
-        failedCount++;
+        log(`Error: ${e}`);
+        billStore.recordFailure();
       }
-    }
+    };
+
+    // Each worker owns one page set and pulls the next bill until none are left
+    let nextIndex = 0;
+    await Promise.all(
+      scraper.getPageSets().map(async (pages) => {
+        while (nextIndex < billsToProcess.length) {
+          const index = nextIndex++;
+          await processBill(billsToProcess[index], index, pages);
+        }
+      })
+    );
 
-    // Summary
-    console.log(`\n${'='.repeat(60)}`);
-    console.log('COMPLETE');
-    console.log(`  Processed: ${processedCount}`);
-    if (skippedCount > 0) console.log(`  Skipped: ${skippedCount}`);
-    if (failedCount > 0) console.log(`  Failed: ${failedCount}`);
+    return await billStore.finish({
+      phase: SESSION_PHASE,
+      year,
+      sessionCode,
+      fullRun: !limit && !billFilter?.length,
+      rosterComplete,
+    });
   } finally {
     await scraper.close();
   }
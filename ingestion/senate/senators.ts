@@ -3,6 +3,7 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
 
 /**
  * Senator profile data - aligned with database schema.
@@ -38,7 +39,7 @@ export async function scrapeSenatorProfile(
   senatorId: string
 ): Promise<SenatorProfile> {
   const url = getSenatorProfileUrl(senatorId);
-  await page.goto(url, { waitUntil: 'networkidle', timeout: 60000 });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle', timeout: 60000 });
 
   const currentYear = new Date().getFullYear();
 
@@ -3,6 +3,7 @@
  */
 
 import { Page } from 'playwright';
+import { gotoWithRetry } from '../shared/browser';
 
 /**
  * Get the two-digit year code for Senate URLs.
@@ -27,16 +28,16 @@ function getCosponsorsUrl(billId: string, year: number, sessionCode: string = 'R
  * @param billId - Internal Senate bill ID (e.g., "394")
  * @param year - Session year
  * @param sessionCode - Session code
- * @returns Semicolon-delimited string of co-sponsor names
+ * @returns Co-sponsor names
  */
 export async function scrapeSenateCoSponsors(
   page: Page,
   billId: string,
   year: number,
   sessionCode: string = 'R'
-): Promise<string> {
+): Promise<string[]> {
   const url = getCosponsorsUrl(billId, year, sessionCode);
-  await page.goto(url, { waitUntil: 'networkidle' });
+  await gotoWithRetry(page, url, { waitUntil: 'networkidle' });
 
   const cosponsors = await page.evaluate(() => {
     const cosponsorNames: string[] = [];
@@ -56,7 +57,7 @@ export async function scrapeSenateCoSponsors(
       }
     }
 
-    return cosponsorNames.join('; ');
+    return cosponsorNames;
   });
 
   return cosponsors;
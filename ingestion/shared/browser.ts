@@ -0,0 +1,60 @@
+/**
+ * Shared Playwright setup for the scrapers.
+ */
+
+import { BrowserContext, Page, Response } from 'playwright';
+import { isTransientStatus, parseRetryAfter, withRetry } from '@/shared/retry';
+
+/**
+ * Resource types the scrapers never read. Stylesheets are included because
+ * the extractors only use textContent and attributes.
+ */
+export const UNUSED_RESOURCE_TYPES = ['image', 'font', 'media', 'stylesheet'];
+
+/**
+ * Abort requests for resources the scrapers don't use, so navigations only
+ * download the documents (and scripts) they need.
+ *
+ * Note that Playwright disables the HTTP cache for routed pages.
+ *
+ * @param target - Browser context or page to apply the route to
+ * @param resourceTypes - Resource types to block (default: UNUSED_RESOURCE_TYPES)
+ */
+export async function blockUnusedResources(
+  target: BrowserContext | Page,
+  resourceTypes: string[] = UNUSED_RESOURCE_TYPES
+): Promise<void> {
+  const blocked = new Set(resourceTypes);
+  await target.route('**/*', (route) =>
+    blocked.has(route.request().resourceType()) ? route.abort() : route.continue()
+  );
+}
+
+/**
+ * Navigate a page, retrying network errors and transient statuses (429, 5xx)
+ * with backoff, or after the server's Retry-After delay when it sends one.
+ *
+ * @param page - Playwright page instance
+ * @param url - URL to load
+ * @param options - page.goto options
+ * @returns The main resource response
+ */
+export async function gotoWithRetry(
+  page: Page,
+  url: string,
+  options?: Parameters<Page['goto']>[1]
+): Promise<Response | null> {
+  let retryAfterMs: number | undefined;
+  return withRetry(
+    async () => {
+      retryAfterMs = undefined;
+      const response = await page.goto(url, options);
+      if (response && isTransientStatus(response.status())) {
+        retryAfterMs = parseRetryAfter(response.headers()['retry-after']);
+        throw new Error(`Failed to load ${url}: HTTP ${response.status()}`);
+      }
+      return response;
+    },
+    { retryDelayMs: () => retryAfterMs }
+  );
+}
@@ -2,7 +2,41 @@
  * Text chunking strategies for legislative documents and bill summaries.
  */
 
-import { encodingForModel, TiktokenModel } from "js-tiktoken";
+import { encodingForModel, Tiktoken, TiktokenModel } from "js-tiktoken";
+
+// Text cleanup patterns (see cleanLegislativeText)
+const NULL_BYTE_PATTERN = /\x00/g;
+const HYPHENATED_BREAK_PATTERN = /(\w+)-\s*\n\s*(\w+)/g;
+const PAGE_HEADER_PATTERN = /^[A-Z]{2,}\s+(?:[A-Z]{2,}\s+)*(?:HBs?|SBs?)\s+[\d\s&]+\s+\d+\s*$/gm;
+const LINE_NUMBER_PATTERN = /^\s*\d+\s+/gm;
+// Space runs and 3+ newline runs in one pass; collapsing spaces never creates
+// or breaks up a newline run, so this matches doing them one after the other
+const WHITESPACE_RUN_PATTERN = / +|\n{3,}/g;
+
+// ICU sentence segmenter; the regex split is the fallback for runtimes built
+// without Intl.Segmenter
+const SENTENCE_SEGMENTER =
+  typeof Intl.Segmenter === "function" ? new Intl.Segmenter("en", { granularity: "sentence" }) : null;
+
+// Chunk boundary patterns
+const SENTENCE_SPLIT_PATTERN = /(?<=[.!?])\s+/;
+const WORD_SPLIT_PATTERN = /\s+/;
+const SECTION_BOUNDARY_PATTERN = /(?:Section\s+[A-Z\d]+\.|(?:^|\n)(?:\d{3}\.\d{3}\.\s+1\.))/gm;
+const SECTION_BOUNDARY_TEST_PATTERN = new RegExp(SECTION_BOUNDARY_PATTERN.source, "m");
+const HAS_SECTIONS_PATTERN = /(?:Section\s+[A-Z\d]+\.|(?:\d{3}\.\d{3}\.\s+1\.))/m;
+
+// encodingForModel builds a new encoder (decoding the whole BPE rank table)
+// on every call, so keep one per model
+const encodingCache = new Map<TiktokenModel, Tiktoken>();
+
+function getEncoding(model: TiktokenModel): Tiktoken {
+  let encoding = encodingCache.get(model);
+  if (!encoding) {
+    encoding = encodingForModel(model);
+    encodingCache.set(model, encoding);
+  }
+  return encoding;
+}
 
 /**
  * Options for chunking text.
@@ -32,6 +66,8 @@ export type DocumentType = "legislative_text" | "summary";
  */
 export interface ChunkDocumentResult {
   chunks: string[];
+  /** Token count of each chunk, parallel to chunks */
+  tokenCounts: number[];
   documentType: DocumentType;
 }
 
@@ -48,8 +84,31 @@ export function countTokens(
   text: string,
   model: TiktokenModel = "text-embedding-3-small"
 ): number {
-  const encoding = encodingForModel(model);
-  return encoding.encode(text).length;
+  return getEncoding(model).encode(text).length;
+}
+
+/**
+ * Split text into sentences.
+ *
+ * Uses ICU's sentence boundary rules, which unlike a split on [.!?] followed
+ * by whitespace don't break after common abbreviations or decimal numbers.
+ *
+ * @param text Text to split
+ * @returns Trimmed, non-empty sentences in order
+ */
+export function splitSentences(text: string): string[] {
+  if (!SENTENCE_SEGMENTER) {
+    return text.split(SENTENCE_SPLIT_PATTERN);
+  }
+
+  const sentences: string[] = [];
+  for (const { segment } of SENTENCE_SEGMENTER.segment(text)) {
+    const sentence = segment.trim();
+    if (sentence) {
+      sentences.push(sentence);
+    }
+  }
+  return sentences;
 }
 
 /**
@@ -67,26 +126,21 @@ export function countTokens(
  */
 export function cleanLegislativeText(text: string): string {
   // Remove null bytes (causes PostgreSQL errors)
-  text = text.replace(/\x00/g, "");
+  text = text.replace(NULL_BYTE_PATTERN, "");
 
   // Fix hyphenated words split across lines
-  text = text.replace(/(\w+)-\s*\n\s*(\w+)/g, "$1$2");
+  text = text.replace(HYPHENATED_BREAK_PATTERN, "$1$2");
 
   // Remove page headers
   // Pattern: bill type codes followed by bill numbers and page number
-  text = text.replace(
-    /^[A-Z]{2,}\s+(?:[A-Z]{2,}\s+)*(?:HBs?|SBs?)\s+[\d\s&]+\s+\d+\s*$/gm,
-    ""
-  );
+  text = text.replace(PAGE_HEADER_PATTERN, "");
 
   // Remove line numbers at start of lines
-  text = text.replace(/^\s*\d+\s+/gm, "");
-
-  // Normalize whitespace (multiple spaces to single space)
-  text = text.replace(/ +/g, " ");
+  text = text.replace(LINE_NUMBER_PATTERN, "");
 
-  // Remove excessive newlines (more than 2 consecutive)
-  text = text.replace(/\n{3,}/g, "\n\n");
+  // Normalize whitespace (multiple spaces to single space) and remove
+  // excessive newlines (more than 2 consecutive)
+  text = text.replace(WHITESPACE_RUN_PATTERN, (run) => (run[0] === " " ? " " : "\n\n"));
 
   return text.trim();
 }
@@ -107,15 +161,19 @@ export function chunkBySentences(
     ...options,
   };
 
-  // Split into sentences
-  const sentences = text.split(/(?<=[.!?])\s+/);
+  // Split into sentences and count each one's tokens once; the overlap walk
+  // below reuses these counts instead of re-encoding sentences
+  const sentences = splitSentences(text);
+  const sentenceTokenCounts = sentences.map((sentence) => countTokens(sentence, model));
 
   const chunks: string[] = [];
   let currentChunk: string[] = [];
+  let currentChunkTokenCounts: number[] = [];
   let currentTokens = 0;
 
-  for (const sentence of sentences) {
-    const sentenceTokens = countTokens(sentence, model);
+  for (let index = 0; index < sentences.length; index++) {
+    const sentence = sentences[index];
+    const sentenceTokens = sentenceTokenCounts[index];
 
     // If a single sentence is too large, split it by words
     if (sentenceTokens > targetTokens) {
@@ -123,10 +181,11 @@ export function chunkBySentences(
       if (currentChunk.length > 0) {
         chunks.push(currentChunk.join(" "));
         currentChunk = [];
+        currentChunkTokenCounts = [];
         currentTokens = 0;
       }
       // Split oversized sentence by words
-      const words = sentence.split(/\s+/);
+      const words = sentence.split(WORD_SPLIT_PATTERN);
       let wordChunk: string[] = [];
       let wordTokens = 0;
       for (const word of words) {
@@ -150,26 +209,25 @@ export function chunkBySentences(
       chunks.push(currentChunk.join(" "));
 
       // Keep last few sentences for overlap
-      const overlapSentences: string[] = [];
+      let overlapStart = currentChunk.length;
       let overlapCount = 0;
 
       // Work backwards to get overlap
-      for (let i = currentChunk.length - 1; i >= 0; i--) {
-        const s = currentChunk[i];
-        const sTokens = countTokens(s, model);
-        if (overlapCount + sTokens <= overlapTokens) {
-          overlapSentences.unshift(s);
-          overlapCount += sTokens;
-        } else {
-          break;
-        }
+      while (
+        overlapStart > 0 &&
+        overlapCount + currentChunkTokenCounts[overlapStart - 1] <= overlapTokens
+      ) {
+        overlapStart--;
+        overlapCount += currentChunkTokenCounts[overlapStart];
       }
 
-      currentChunk = overlapSentences;
+      currentChunk = currentChunk.slice(overlapStart);
+      currentChunkTokenCounts = currentChunkTokenCounts.slice(overlapStart);
       currentTokens = overlapCount;
     }
 
     currentChunk.push(sentence);
+    currentChunkTokenCounts.push(sentenceTokens);
     currentTokens += sentenceTokens;
   }
 
@@ -181,6 +239,21 @@ export function chunkBySentences(
   return chunks;
 }
 
+/**
+ * Lazily yield a document's sections: the text before the first section
+ * boundary (if any), then each boundary up to the next one.
+ */
+function* iterSections(text: string): Generator<string> {
+  let start = 0;
+  for (const match of text.matchAll(SECTION_BOUNDARY_PATTERN)) {
+    if (match.index! > start) {
+      yield text.slice(start, match.index);
+    }
+    start = match.index!;
+  }
+  yield text.slice(start);
+}
+
 /**
  * Chunk by major legislative sections, keeping subsections together.
  *
@@ -203,38 +276,17 @@ export function chunkBySections(
     ...options,
   };
 
-  // Match major section boundaries
-  const sectionPattern = /(?:Section\s+[A-Z\d]+\.|(?:^|\n)(?:\d{3}\.\d{3}\.\s+1\.))/gm;
-
-  // Find all section boundaries
-  const matches = Array.from(text.matchAll(sectionPattern));
-
-  if (matches.length === 0) {
+  if (!SECTION_BOUNDARY_TEST_PATTERN.test(text)) {
     // No sections found, fall back to sentence-based chunking
     return chunkBySentences(text, { targetTokens, overlapTokens, model });
   }
 
-  const sections: string[] = [];
-
-  // Extract text from start to first section
-  if (matches[0].index !== undefined && matches[0].index > 0) {
-    sections.push(text.slice(0, matches[0].index));
-  }
-
-  // Extract each section (from section marker to next section marker)
-  for (let i = 0; i < matches.length; i++) {
-    const match = matches[i];
-    const start = match.index!;
-    const end = i + 1 < matches.length ? matches[i + 1].index! : text.length;
-    sections.push(text.slice(start, end));
-  }
-
   // Combine sections into chunks respecting target size
   const chunks: string[] = [];
   let currentChunk: string[] = [];
   let currentTokens = 0;
 
-  for (const section of sections) {
+  for (const section of iterSections(text)) {
     if (!section.trim()) {
       continue;
     }
@@ -276,7 +328,7 @@ export function chunkBySections(
  *
  * @param text Cleaned text to chunk
  * @param options Chunking options
- * @returns Object with chunks and document type
+ * @returns Object with chunks, their token counts and document type
  */
 export function chunkDocument(
   text: string,
@@ -288,12 +340,14 @@ export function chunkDocument(
   };
 
   // Detect if it's legislative text (has Section markers or statute sections)
-  const hasSections = /(?:Section\s+[A-Z\d]+\.|(?:\d{3}\.\d{3}\.\s+1\.))/m.test(text);
+  const hasSections = HAS_SECTIONS_PATTERN.test(text);
 
   if (hasSections) {
     // Legislative text - use section-based chunking
+    const chunks = chunkBySections(text, { targetTokens, model });
     return {
-      chunks: chunkBySections(text, { targetTokens, model }),
+      chunks,
+      tokenCounts: chunks.map((chunk) => countTokens(chunk, model)),
       documentType: "legislative_text",
     };
   } else {
@@ -303,12 +357,15 @@ export function chunkDocument(
       // Keep short summaries as single chunk
       return {
         chunks: [text],
+        tokenCounts: [tokenCount],
         documentType: "summary",
       };
     } else {
       // Long summary - use sentence-based chunking
+      const chunks = chunkBySentences(text, { targetTokens, overlapTokens, model });
       return {
-        chunks: chunkBySentences(text, { targetTokens, overlapTokens, model }),
+        chunks,
+        tokenCounts: chunks.map((chunk) => countTokens(chunk, model)),
         documentType: "summary",
       };
     }
@@ -0,0 +1,136 @@
+/**
+ * Concurrency helpers for the ingestion pipeline.
+ */
+
+/**
+ * Concurrency limiter whose limit adapts to server throttling (AIMD).
+ *
+ * Callers wait in `acquire()` until fewer than `limit` tasks are active. A
+ * throttled response (HTTP 429/503) halves the limit; every `successWindow`
+ * consecutive successes raise it by one, up to `maxLimit`. Waiters are woken
+ * whenever a slot frees up or the limit grows.
+ */
+export class AdaptiveConcurrencyLimiter {
+  private active = 0;
+  private limit: number;
+  private successStreak = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(
+    private readonly minLimit: number = 1,
+    private readonly maxLimit: number = 16,
+    initialLimit: number = 8,
+    private readonly successWindow: number = 20
+  ) {
+    this.limit = Math.min(Math.max(initialLimit, minLimit), maxLimit);
+  }
+
+  /**
+   * Current concurrency limit
+   */
+  get currentLimit(): number {
+    return this.limit;
+  }
+
+  /**
+   * Wait for a free slot and claim it
+   */
+  async acquire(): Promise<void> {
+    while (this.active >= this.limit) {
+      await new Promise<void>((resolve) => this.waiters.push(resolve));
+    }
+    this.active++;
+  }
+
+  /**
+   * Free a slot, adjusting the limit from the task's outcome
+   *
+   * @param throttled - Whether the server throttled the request
+   */
+  release(throttled: boolean = false): void {
+    this.active--;
+
+    if (throttled) {
+      this.successStreak = 0;
+      this.limit = Math.max(this.minLimit, Math.floor(this.limit / 2));
+    } else if (++this.successStreak >= this.successWindow) {
+      this.successStreak = 0;
+      this.limit = Math.min(this.maxLimit, this.limit + 1);
+    }
+
+    // Woken waiters re-check the limit, so waking extras is harmless
+    const wake = this.waiters.splice(0, Math.max(this.limit - this.active, 0));
+    for (const resolve of wake) {
+      resolve();
+    }
+  }
+}
+
+/**
+ * Like Promise.all, but waits for every promise to settle before rejecting
+ * with the first failure.
+ *
+ * Use it when the promises share resources (such as pooled pages) that the
+ * caller reuses afterwards, so nothing is still running on them once it moves
+ * on.
+ *
+ * @param promises - Promises to wait for
+ * @returns Their values, in order
+ * @throws The first rejection reason, in input order
+ */
+export async function allSettledOrThrow<T extends readonly unknown[] | []>(
+  promises: T
+): Promise<{ -readonly [K in keyof T]: Awaited<T[K]> }> {
+  const results = await Promise.allSettled(promises);
+  for (const result of results) {
+    if (result.status === 'rejected') throw result.reason;
+  }
+  return results.map((result) => (result as PromiseFulfilledResult<unknown>).value) as {
+    -readonly [K in keyof T]: Awaited<T[K]>;
+  };
+}
+
+/**
+ * Whether an HTTP status means the server is asking clients to slow down
+ */
+export function isThrottleStatus(status: number | undefined): boolean {
+  return status === 429 || status === 503;
+}
+
+/**
+ * Bounded set of background tasks, used to hand work from one pipeline stage
+ * to the next without waiting for it.
+ *
+ * `push()` starts the task immediately unless `maxPending` tasks are already
+ * running, in which case it waits for one to finish first (backpressure on the
+ * producer). Tasks are expected to handle their own errors; a rejection is
+ * logged and dropped so it can't break the producer.
+ */
+export class BackgroundTaskQueue {
+  private pending = new Set<Promise<void>>();
+
+  constructor(private readonly maxPending: number) {}
+
+  /**
+   * Start a task, first waiting for a free slot if the queue is full
+   */
+  async push(task: () => Promise<void>): Promise<void> {
+    while (this.pending.size >= this.maxPending) {
+      await Promise.race(this.pending);
+    }
+
+    const promise: Promise<void> = task()
+      .catch((error) => console.log(`Background task failed: ${error}`))
+      .finally(() => this.pending.delete(promise));
+    this.pending.add(promise);
+  }
+
+  /**
+   * Wait for every started task to finish
+   */
+  async drain(): Promise<void> {
+    while (this.pending.size > 0) {
+      await Promise.all(this.pending);
+    }
+  }
+}
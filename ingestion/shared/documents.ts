@@ -3,85 +3,235 @@
  */
 
 import axios from 'axios';
-import { promises as fs } from 'fs';
+import { createWriteStream, promises as fs } from 'fs';
+import http from 'http';
+import https from 'https';
 import path from 'path';
-import pdfParse from 'pdf-parse';
-import { DocumentInfo, ScrapedDocument } from './types';
+import { pipeline } from 'stream/promises';
+import { AdaptiveConcurrencyLimiter, isThrottleStatus } from './concurrency';
+import { extractPdfText } from './pdf';
+import { isTransientStatus, parseRetryAfter, withRetry } from '@/shared/retry';
+import { BillLog, DocumentInfo, ScrapedDocument } from './types';
+
+// Maximum PDFs downloaded at once for a single bill
+const MAX_CONCURRENT_DOWNLOADS = 8;
+
+// Connection pool limits for PDF downloads: at most MAX_SOCKETS_PER_HOST open
+// to one legislature host and MAX_TOTAL_SOCKETS overall (extra requests queue
+// for a free socket); idle keep-alive sockets close after SOCKET_IDLE_TIMEOUT_MS
+const MAX_SOCKETS_PER_HOST = 16;
+const MAX_TOTAL_SOCKETS = 32;
+const SOCKET_IDLE_TIMEOUT_MS = 60000;
+
+const agentOptions: http.AgentOptions = {
+  keepAlive: true,
+  maxSockets: MAX_SOCKETS_PER_HOST,
+  maxTotalSockets: MAX_TOTAL_SOCKETS,
+  maxFreeSockets: MAX_SOCKETS_PER_HOST,
+  timeout: SOCKET_IDLE_TIMEOUT_MS,
+};
+
+// Downloads in flight across all bills; backs off when the servers throttle
+const downloadLimiter = new AdaptiveConcurrencyLimiter(2, MAX_TOTAL_SOCKETS, MAX_SOCKETS_PER_HOST);
+
+// One client for every bill so keep-alive sockets (and their TLS sessions)
+// to the legislature hosts are reused across downloads
+const pdfClient = axios.create({
+  timeout: 30000,
+  httpAgent: new http.Agent(agentOptions),
+  httpsAgent: new https.Agent(agentOptions),
+});
+
+/**
+ * HTTP validators saved next to a downloaded PDF for conditional GETs
+ */
+interface PdfValidators {
+  url: string;
+  etag: string | null;
+  lastModified: string | null;
+}
+
+async function readValidators(filepath: string, url: string): Promise<PdfValidators | null> {
+  try {
+    // Validators are only useful if the PDF they describe is still on disk
+    await fs.access(filepath);
+    const validators = JSON.parse(await fs.readFile(`${filepath}.json`, 'utf-8')) as PdfValidators;
+    return validators.url === url ? validators : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Path of the extracted text saved beside a PDF
+ */
+function getTextPath(filepath: string): string {
+  return `${filepath}.txt`;
+}
+
+async function readExtractedText(filepath: string): Promise<string | null> {
+  try {
+    return await fs.readFile(getTextPath(filepath), 'utf-8');
+  } catch {
+    return null;
+  }
+}
+
+async function writeExtractedText(filepath: string, text: string): Promise<void> {
+  try {
+    await fs.writeFile(getTextPath(filepath), text);
+  } catch (error) {
+    console.log(`Warning: Could not save extracted text for ${filepath}: ${error}`);
+  }
+}
 
 /**
  * Download bill document PDFs and extract text in-memory.
  * PDFs are saved locally and text is extracted for embedding generation.
  * No longer uploads to Supabase Storage.
  *
+ * A PDF already on disk from a previous run is revalidated with a conditional
+ * GET (ETag / Last-Modified saved in a `.json` file beside it) and reused when
+ * the server answers 304, instead of being downloaded again. Text extracted
+ * from a PDF is saved in a `.txt` file beside it, so an unchanged PDF isn't
+ * parsed again either.
+ *
  * @param billNumber - Bill number (e.g., "HB 1366")
  * @param documents - Array of scraped document references
  * @param outputDir - Directory to save PDFs locally
+ * @param log - Logger for the bill's messages
  * @returns Array of document info including extracted text
  */
 export async function downloadBillDocuments(
   billNumber: string,
   documents: ScrapedDocument[],
-  outputDir: string
+  outputDir: string,
+  log: BillLog
 ): Promise<DocumentInfo[]> {
   if (!documents || documents.length === 0) {
-    console.log(`  [${billNumber}] No documents to download`);
+    log(`No documents to download`);
     return [];
   }
 
-  console.log(`  [${billNumber}] Downloading ${documents.length} document(s)...`);
-  const documentInfo: DocumentInfo[] = [];
+  log(`Downloading ${documents.length} document(s)...`);
 
   // Create output directory for this bill
   const billDir = path.join(outputDir, billNumber);
   await fs.mkdir(billDir, { recursive: true });
 
-  for (const doc of documents) {
-    const { doc_id, type, title, url } = doc;
+  // Download concurrently (capped), keeping results in document order
+  const downloadedPaths: (string | null)[] = new Array(documents.length).fill(null);
+  const unchanged: boolean[] = new Array(documents.length).fill(false);
+  let nextIndex = 0;
 
-    // Use doc_id for filename (it's already unique per document)
-    const filename = `${doc_id}.pdf`;
-    const filepath = path.join(billDir, filename);
+  const downloadWorker = async (): Promise<void> => {
+    while (nextIndex < documents.length) {
+      const index = nextIndex++;
+      const { doc_id, type, title, url } = documents[index];
 
-    try {
-      console.log(`  [${billNumber}] Downloading ${doc_id} (${type} - ${title})...`);
-      const response = await axios.get(url, {
-        responseType: 'arraybuffer',
-        timeout: 30000,
-      });
+      // Use doc_id for filename (it's already unique per document)
+      const filepath = path.join(billDir, `${doc_id}.pdf`);
+      const validatorsPath = `${filepath}.json`;
 
-      // Save PDF locally
-      const pdfContent = Buffer.from(response.data);
-      await fs.writeFile(filepath, pdfContent);
+      await downloadLimiter.acquire();
+      let throttled = false;
 
-      // Extract text from PDF in-memory
-      let extractedText: string | null = null;
       try {
-        // Suppress pdf.js font warnings (TT: undefined function, etc.)
-        const originalWarn = console.warn;
-        console.warn = () => {};
-        try {
-          const pdfData = await pdfParse(pdfContent);
-          extractedText = pdfData.text;
-        } finally {
-          console.warn = originalWarn;
+        const cached = await readValidators(filepath, url);
+        const headers: Record<string, string> = {};
+        if (cached?.etag) headers['If-None-Match'] = cached.etag;
+        if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+
+        log(`Downloading ${doc_id} (${type} - ${title})...`);
+        const response = await withRetry(
+          () =>
+            pdfClient.get(url, {
+              responseType: 'stream',
+              headers,
+              validateStatus: (status) => (status >= 200 && status < 300) || (status === 304 && cached !== null),
+            }),
+          {
+            // Retry network errors and transient statuses, noting throttling
+            // so the shared limiter backs off
+            shouldRetry: (error) => {
+              if (!axios.isAxiosError(error)) return false;
+              const status = error.response?.status;
+              if (isThrottleStatus(status)) throttled = true;
+              return status === undefined || isTransientStatus(status);
+            },
+            retryDelayMs: (error) =>
+              axios.isAxiosError(error) ? parseRetryAfter(error.response?.headers['retry-after']) : undefined,
+          }
+        );
+
+        if (response.status === 304) {
+          response.data.resume();
+          log(`${doc_id} unchanged, using cached PDF`);
+          downloadedPaths[index] = filepath;
+          unchanged[index] = true;
+          continue;
+        }
+
+        // Stream the PDF to disk rather than buffering the whole response;
+        // write to a temp file first so an interrupted download never leaves
+        // a truncated PDF behind a valid validators file
+        const tempPath = `${filepath}.part`;
+        await pipeline(response.data, createWriteStream(tempPath));
+        await fs.rm(getTextPath(filepath), { force: true });
+        await fs.rename(tempPath, filepath);
+        downloadedPaths[index] = filepath;
+
+        const etag = (response.headers['etag'] as string | undefined) ?? null;
+        const lastModified = (response.headers['last-modified'] as string | undefined) ?? null;
+        if (etag || lastModified) {
+          await fs.writeFile(validatorsPath, JSON.stringify({ url, etag, lastModified } satisfies PdfValidators));
+        } else {
+          await fs.rm(validatorsPath, { force: true });
         }
-        console.log(`  [${billNumber}] ✓ ${doc_id}: Extracted ${extractedText.length} chars`);
       } catch (error) {
-        console.log(`  [${billNumber}] Warning: Could not extract text from ${doc_id}: ${error}`);
+        throttled ||= axios.isAxiosError(error) && isThrottleStatus(error.response?.status);
+        log(`Error downloading ${doc_id}: ${error}`);
+      } finally {
+        downloadLimiter.release(throttled);
       }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(MAX_CONCURRENT_DOWNLOADS, documents.length) }, downloadWorker)
+  );
+
+  // Extract text concurrently; parsing runs on the PDF worker pool, which
+  // bounds how many files are parsed (and held in memory) at once
+  const extracted = await Promise.all(
+    documents.map(async ({ doc_id, type, title, url }, i): Promise<DocumentInfo | null> => {
+      const filepath = downloadedPaths[i];
+      if (!filepath) return null;
 
-      documentInfo.push({
+      // An unchanged PDF reuses the text extracted from it on a previous run
+      let extractedText: string | null = unchanged[i] ? await readExtractedText(filepath) : null;
+      if (extractedText !== null) {
+        log(`✓ ${doc_id}: Reused ${extractedText.length} extracted chars`);
+      } else {
+        try {
+          extractedText = await extractPdfText(filepath);
+          await writeExtractedText(filepath, extractedText);
+          log(`✓ ${doc_id}: Extracted ${extractedText.length} chars`);
+        } catch (error) {
+          log(`Warning: Could not extract text from ${doc_id}: ${error}`);
+        }
+      }
+
+      return {
         doc_id,
         type,
         title,
         url,
         local_path: filepath,
         extracted_text: extractedText,
-      });
-    } catch (error) {
-      console.log(`  [${billNumber}] Error downloading ${doc_id}: ${error}`);
-    }
-  }
+      };
+    })
+  );
 
-  return documentInfo;
+  return extracted.filter((info): info is DocumentInfo => info !== null);
 }
@@ -2,18 +2,35 @@
  * Embedding generation functions for bill documents.
  */
 
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
 import { OpenAIEmbeddings } from '@langchain/openai';
 import { SupabaseVectorStore } from '@langchain/community/vectorstores/supabase';
 import { Document } from '@langchain/core/documents';
 import { DatabaseClient } from '@/database/client';
-import { DocumentInfo } from './types';
+import { BillLog, DocumentInfo } from './types';
 import {
   cleanLegislativeText,
   chunkDocument,
-  countTokens,
   DocumentType,
 } from './chunking';
 
+// OpenAI accepts up to 2048 inputs and 300k tokens per embeddings request;
+// the token budget leaves headroom for tokenizer differences
+const EMBEDDING_BATCH_SIZE = 2048;
+const EMBEDDING_BATCH_TOKEN_LIMIT = 250000;
+
+const EMBEDDING_MODEL = 'text-embedding-3-small';
+
+// OpenAI embeddings requests in flight across every bill; LangChain queues
+// calls beyond this and retries 429s and 5xx responses with backoff
+const MAX_CONCURRENT_EMBEDDING_REQUESTS = 8;
+const MAX_EMBEDDING_RETRIES = 6;
+
+// Directory for vectors cached by model and chunk text (set EMBEDDING_CACHE_DIR to '' to disable)
+const EMBEDDING_CACHE_DIR = process.env.EMBEDDING_CACHE_DIR ?? '.embedding_cache';
+
 /**
  * Metadata structure for bill embeddings.
  */
@@ -35,6 +52,32 @@ interface ChunkMetadata {
   committee_names?: string[];
 }
 
+let embeddingsClient: OpenAIEmbeddings | null = null;
+
+/**
+ * Get the shared embeddings client.
+ *
+ * One client serves every bill, so its request queue enforces
+ * MAX_CONCURRENT_EMBEDDING_REQUESTS across the whole run rather than per bill.
+ */
+function getEmbeddingsClient(): OpenAIEmbeddings {
+  if (!embeddingsClient) {
+    const apiKey = process.env.OPENAI_API_KEY;
+    if (!apiKey) {
+      throw new Error('OPENAI_API_KEY environment variable not set');
+    }
+
+    embeddingsClient = new OpenAIEmbeddings({
+      model: EMBEDDING_MODEL,
+      openAIApiKey: apiKey,
+      batchSize: EMBEDDING_BATCH_SIZE,
+      maxConcurrency: MAX_CONCURRENT_EMBEDDING_REQUESTS,
+      maxRetries: MAX_EMBEDDING_RETRIES,
+    });
+  }
+  return embeddingsClient;
+}
+
 /**
  * Filter document info to only include embeddable documents.
  * Returns all Bill Text and Bill Summary documents.
@@ -52,22 +95,23 @@ export function filterEmbeddableDocuments(documentInfo: DocumentInfo[]): Documen
 }
 
 /**
- * Process text into embeddings and store them.
+ * Chunk metadata shared by every chunk of a bill
+ */
+type BillChunkMetadata = Omit<
+  ChunkMetadata,
+  'document_id' | 'content_type' | 'chunk_index' | 'doc_type' | 'token_count'
+>;
+
+/**
+ * Build the bill-level chunk metadata once, so the sponsor and committee
+ * fields aren't rebuilt for every chunk.
  *
- * @param vectorStore - Supabase vector store
  * @param billId - Bill UUID
- * @param documentId - Document ID from Missouri House website
- * @param rawText - Raw extracted text
- * @param contentType - Document title (e.g., "Introduced")
  * @param billMetadata - Bill metadata for embedding context
- * @returns Number of embeddings created
+ * @returns Metadata fields common to all of the bill's chunks
  */
-async function processDocumentText(
-  vectorStore: SupabaseVectorStore,
+function buildBillChunkMetadata(
   billId: string,
-  documentId: string,
-  rawText: string,
-  contentType: string,
   billMetadata: {
     bill_number: string;
     session_year: number;
@@ -76,61 +120,189 @@ async function processDocumentText(
     cosponsors: Array<{ id: string; name: string }>;
     committees: Array<{ id: string; name: string }>;
   }
-): Promise<number> {
+): BillChunkMetadata {
+  const metadata: BillChunkMetadata = {
+    bill_id: billId,
+    bill_number: billMetadata.bill_number,
+    session_year: billMetadata.session_year,
+    session_code: billMetadata.session_code,
+  };
+
+  // Add primary sponsor
+  if (billMetadata.primary_sponsor) {
+    metadata.primary_sponsor_id = billMetadata.primary_sponsor.id;
+    metadata.primary_sponsor_name = billMetadata.primary_sponsor.name;
+  }
+
+  // Add co-sponsors
+  if (billMetadata.cosponsors.length > 0) {
+    metadata.cosponsor_ids = billMetadata.cosponsors.map((cs) => cs.id);
+    metadata.cosponsor_names = billMetadata.cosponsors.map((cs) => cs.name);
+  }
+
+  // Add committees
+  if (billMetadata.committees.length > 0) {
+    metadata.committee_ids = billMetadata.committees.map((c) => c.id);
+    metadata.committee_names = billMetadata.committees.map((c) => c.name);
+  }
+
+  return metadata;
+}
+
+/**
+ * Clean and chunk a document's text into LangChain Documents with metadata.
+ * Nothing is embedded here; see storeDocumentEmbeddings.
+ *
+ * @param documentId - Document ID from Missouri House website
+ * @param rawText - Raw extracted text
+ * @param contentType - Document title (e.g., "Introduced")
+ * @param billChunkMetadata - Metadata shared by all of the bill's chunks
+ * @param log - Logger for the bill's messages
+ * @returns One Document per chunk
+ */
+function prepareDocumentChunks(
+  documentId: string,
+  rawText: string,
+  contentType: string,
+  billChunkMetadata: BillChunkMetadata,
+  log: BillLog
+): Document[] {
   // Clean text
   const cleanText = cleanLegislativeText(rawText);
-  console.log(`      Tokens: ${countTokens(cleanText)}`);
-
-  // Chunk document
-  const { chunks, documentType } = chunkDocument(cleanText);
-  console.log(`      Document type: ${documentType}`);
-  console.log(`      Chunks: ${chunks.length}`);
 
-  // Create LangChain Documents with metadata
-  const documents: Document[] = [];
-  for (let i = 0; i < chunks.length; i++) {
-    const chunk = chunks[i];
+  // Chunk document; the chunker reports each chunk's token count, so no
+  // chunk (or the whole document) is tokenized a second time here
+  const { chunks, tokenCounts, documentType } = chunkDocument(cleanText);
+  log(`  Document type: ${documentType}`);
+  log(`  Chunks: ${chunks.length} (${tokenCounts.reduce((sum, count) => sum + count, 0)} tokens)`);
 
-    // Build metadata
+  // Create LangChain Documents, adding only the per-chunk fields to the
+  // shared metadata
+  return chunks.map((chunk, i) => {
     const metadata: ChunkMetadata = {
-      bill_id: billId,
-      bill_number: billMetadata.bill_number,
+      ...billChunkMetadata,
       document_id: documentId,
       content_type: contentType,
       chunk_index: i,
       doc_type: documentType,
-      token_count: countTokens(chunk),
-      session_year: billMetadata.session_year,
-      session_code: billMetadata.session_code,
+      token_count: tokenCounts[i],
     };
+    return new Document({ pageContent: chunk, metadata });
+  });
+}
 
-    // Add primary sponsor
-    if (billMetadata.primary_sponsor) {
-      metadata.primary_sponsor_id = billMetadata.primary_sponsor.id;
-      metadata.primary_sponsor_name = billMetadata.primary_sponsor.name;
-    }
+/**
+ * Cache key for a chunk's vector: identical text embedded with the same model
+ * always yields the same vector, so reintroduced bills and shared boilerplate
+ * can reuse it.
+ */
+function getEmbeddingCacheKey(text: string): string {
+  return createHash('sha256').update(`${EMBEDDING_MODEL}\0${text}`).digest('hex');
+}
 
-    // Add co-sponsors
-    if (billMetadata.cosponsors.length > 0) {
-      metadata.cosponsor_ids = billMetadata.cosponsors.map((cs) => cs.id);
-      metadata.cosponsor_names = billMetadata.cosponsors.map((cs) => cs.name);
-    }
+function getEmbeddingCachePath(key: string): string {
+  return path.join(EMBEDDING_CACHE_DIR, key.slice(0, 2), `${key}.bin`);
+}
 
-    // Add committees
-    if (billMetadata.committees.length > 0) {
-      metadata.committee_ids = billMetadata.committees.map((c) => c.id);
-      metadata.committee_names = billMetadata.committees.map((c) => c.name);
+async function readCachedEmbedding(key: string): Promise<number[] | null> {
+  if (!EMBEDDING_CACHE_DIR) return null;
+  try {
+    const buffer = await fs.readFile(getEmbeddingCachePath(key));
+    if (buffer.byteLength === 0 || buffer.byteLength % 4 !== 0) return null;
+    const bytes = buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.byteLength);
+    return Array.from(new Float32Array(bytes));
+  } catch {
+    return null;
+  }
+}
+
+async function writeCachedEmbedding(key: string, vector: number[]): Promise<void> {
+  if (!EMBEDDING_CACHE_DIR) return;
+  try {
+    const cachePath = getEmbeddingCachePath(key);
+    await fs.mkdir(path.dirname(cachePath), { recursive: true });
+    // OpenAI returns float32 values, so storing them as float32 is lossless.
+    // Written under a temporary name so readers never see a partial vector.
+    const partPath = `${cachePath}.${process.pid}.part`;
+    await fs.writeFile(partPath, Buffer.from(new Float32Array(vector).buffer));
+    await fs.rename(partPath, cachePath);
+  } catch (error) {
+    console.log(`      Warning: Could not cache embedding ${key}: ${error}`);
+  }
+}
+
+/**
+ * Embed and store chunks from any number of documents.
+ *
+ * Vectors for previously embedded text are read from the local cache. The
+ * remaining distinct texts are packed into as few embeddings requests as
+ * OpenAI's input and token limits allow, then every chunk is inserted into the
+ * vector store together.
+ *
+ * @param embeddings - OpenAI embeddings client
+ * @param vectorStore - Supabase vector store
+ * @param documents - Chunk Documents from prepareDocumentChunks
+ * @param log - Logger for the bill's messages
+ */
+async function storeDocumentEmbeddings(
+  embeddings: OpenAIEmbeddings,
+  vectorStore: SupabaseVectorStore,
+  documents: Document[],
+  log: BillLog
+): Promise<void> {
+  const keys = documents.map((document) => getEmbeddingCacheKey(document.pageContent));
+  const vectorsByKey = new Map<string, number[]>();
+  const cached = await Promise.all(keys.map((key) => readCachedEmbedding(key)));
+  cached.forEach((vector, i) => {
+    if (vector) vectorsByKey.set(keys[i], vector);
+  });
+
+  // Distinct uncached texts, batched by OpenAI's request limits
+  const batches: Array<Array<{ key: string; text: string }>> = [];
+  let batch: Array<{ key: string; text: string }> = [];
+  let batchTokens = 0;
+  const queued = new Set<string>();
+  documents.forEach((document, i) => {
+    const key = keys[i];
+    if (vectorsByKey.has(key) || queued.has(key)) return;
+    queued.add(key);
+
+    const tokens = (document.metadata as ChunkMetadata).token_count;
+    if (
+      batch.length > 0 &&
+      (batch.length >= EMBEDDING_BATCH_SIZE || batchTokens + tokens > EMBEDDING_BATCH_TOKEN_LIMIT)
+    ) {
+      batches.push(batch);
+      batch = [];
+      batchTokens = 0;
     }
+    batch.push({ key, text: document.pageContent });
+    batchTokens += tokens;
+  });
+  if (batch.length > 0) {
+    batches.push(batch);
+  }
 
-    documents.push(new Document({ pageContent: chunk, metadata }));
+  if (queued.size < documents.length) {
+    log(`  Reusing ${documents.length - queued.size} cached embedding(s)`);
   }
 
-  // Store embeddings
-  console.log(`      Storing ${documents.length} embedding(s)...`);
-  await vectorStore.addDocuments(documents);
-  console.log(`      ✓ Created ${documents.length} embeddings`);
+  await Promise.all(
+    batches.map(async (entries) => {
+      const vectors = await embeddings.embedDocuments(entries.map((entry) => entry.text));
+      await Promise.all(
+        entries.map((entry, i) => {
+          vectorsByKey.set(entry.key, vectors[i]);
+          return writeCachedEmbedding(entry.key, vectors[i]);
+        })
+      );
+    })
+  );
 
-  return documents.length;
+  await vectorStore.addVectors(
+    keys.map((key) => vectorsByKey.get(key)!),
+    documents
+  );
 }
 
 /**
@@ -140,69 +312,76 @@ async function processDocumentText(
  * @param db - Database client
  * @param billId - Bill UUID
  * @param documentInfo - Array of document info with extracted text
+ * @param log - Logger for the bill's messages
  * @returns Total number of embeddings created
+ * @throws If any embeddable document could not be embedded; documents that
+ *   were chunked are still stored when only others failed to chunk
  */
 export async function generateEmbeddingsForBill(
   db: DatabaseClient,
   billId: string,
-  documentInfo: DocumentInfo[]
+  documentInfo: DocumentInfo[],
+  log: BillLog
 ): Promise<number> {
   // Get bill metadata for embeddings
   const billMetadata = await db.getBillMetadataForEmbeddings(billId);
   if (!billMetadata) {
-    console.log(`    Could not fetch metadata for bill ${billId}`);
-    return 0;
+    throw new Error(`Failed to generate embeddings: could not fetch metadata for bill ${billId}`);
   }
 
   // Filter to embeddable documents (Introduced + most recent, excluding fiscal notes)
   const embeddableDocs = filterEmbeddableDocuments(documentInfo);
   if (embeddableDocs.length === 0) {
-    console.log(`    No embeddable documents with extracted text`);
+    log(`No embeddable documents with extracted text`);
     return 0;
   }
 
   // Initialize embeddings and vector store
-  const apiKey = process.env.OPENAI_API_KEY;
-  if (!apiKey) {
-    throw new Error('OPENAI_API_KEY environment variable not set');
-  }
-
-  const embeddings = new OpenAIEmbeddings({
-    model: 'text-embedding-3-small',
-    openAIApiKey: apiKey,
-  });
-
+  const embeddings = getEmbeddingsClient();
   const vectorStore = new SupabaseVectorStore(embeddings, {
     client: db.client,
     tableName: 'bill_embeddings',
     queryName: 'match_bill_embeddings',
   });
 
-  let totalEmbeddings = 0;
-
+  // Chunk every document first so all of the bill's chunks share as few
+  // embeddings requests as possible
+  const billChunkMetadata = buildBillChunkMetadata(billId, billMetadata);
+  const chunkDocuments: Document[] = [];
+  const preparedDocs: DocumentInfo[] = [];
+  const chunkFailures: string[] = [];
   for (const doc of embeddableDocs) {
     if (!doc.extracted_text) {
       continue;
     }
 
-    console.log(`    Generating embeddings for ${doc.title} (${doc.type})...`);
+    log(`Preparing chunks for ${doc.title} (${doc.type})...`);
     try {
-      const count = await processDocumentText(
-        vectorStore,
-        billId,
-        doc.doc_id,
-        doc.extracted_text,
-        doc.title,
-        billMetadata
+      chunkDocuments.push(
+        ...prepareDocumentChunks(doc.doc_id, doc.extracted_text, doc.title, billChunkMetadata, log)
       );
-      totalEmbeddings += count;
+      preparedDocs.push(doc);
+    } catch (error) {
+      chunkFailures.push(`${doc.title}: ${error}`);
+    }
+  }
 
-      // Mark document as having embeddings generated
-      await db.markDocumentEmbeddingsGenerated(billId, doc.doc_id);
+  if (chunkDocuments.length > 0) {
+    log(`Storing ${chunkDocuments.length} embedding(s) from ${preparedDocs.length} document(s)...`);
+    try {
+      await storeDocumentEmbeddings(embeddings, vectorStore, chunkDocuments, log);
     } catch (error) {
-      console.log(`    Warning: Could not generate embeddings for ${doc.title}: ${error}`);
+      throw new Error(`Failed to generate embeddings for bill ${billId}: ${error}`);
     }
+    log(`✓ Created ${chunkDocuments.length} embeddings`);
+
+    // Mark documents as having embeddings generated
+    await Promise.all(preparedDocs.map((doc) => db.markDocumentEmbeddingsGenerated(billId, doc.doc_id)));
+  }
+
+  if (chunkFailures.length > 0) {
+    throw new Error(`Failed to chunk ${chunkFailures.length} document(s): ${chunkFailures.join('; ')}`);
   }
 
-  return totalEmbeddings;
+  return chunkDocuments.length;
 }
@@ -0,0 +1,247 @@
+/**
+ * Lightweight HTML fetching and table parsing for static pages.
+ *
+ * Several legislature pages are plain server-rendered tables. Fetching them
+ * through the browser context's request API and parsing the table markup
+ * directly avoids a full page load and render per request.
+ */
+
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
+import { Page } from 'playwright';
+import { isTransientStatus, parseRetryAfter, withRetry } from '@/shared/retry';
+
+/**
+ * A fetched page stored with its validators for conditional GETs
+ */
+interface CachedPage {
+  url: string;
+  etag: string | null;
+  lastModified: string | null;
+  body: string;
+}
+
+// Directory for cached pages (set HTML_CACHE_DIR to '' to disable)
+const HTML_CACHE_DIR = process.env.HTML_CACHE_DIR ?? '.html_cache';
+
+// Revalidate cached pages even for closed sessions (set HTML_CACHE_REFRESH=true)
+const HTML_CACHE_REFRESH = process.env.HTML_CACHE_REFRESH === 'true';
+
+/**
+ * Options for fetchHtml
+ */
+export interface FetchHtmlOptions {
+  /**
+   * Whether the page can no longer change, so a cached copy is served without
+   * any request and the body is cached even without validators (default false)
+   */
+  immutable?: boolean;
+}
+
+/**
+ * A table cell parsed from raw HTML
+ */
+export interface HtmlCell {
+  tag: 'TD' | 'TH';
+  text: string;
+  linkText: string | null;
+  linkHref: string | null;
+}
+
+const COMMENT_PATTERN = /<!--[\s\S]*?-->/g;
+const TABLE_PATTERN = /<table\b[^>]*>([\s\S]*?)<\/table>/i;
+const TABLES_PATTERN = /<table\b[^>]*>([\s\S]*?)<\/table>/gi;
+const ROW_PATTERN = /<tr\b[^>]*>([\s\S]*?)<\/tr>/gi;
+const CELL_PATTERN = /<(td|th)\b[^>]*>([\s\S]*?)<\/\1>/gi;
+const LINK_PATTERN = /<a\b([^>]*)>([\s\S]*?)<\/a>/i;
+const HREF_PATTERN = /\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))/i;
+const TAG_PATTERN = /<[^>]+>/g;
+const SCRIPT_STYLE_PATTERN = /<(script|style)\b[^>]*>[\s\S]*?<\/\1>/gi;
+const ENTITY_PATTERN = /&(#x[0-9a-f]+|#\d+|[a-z]+);/gi;
+
+const NAMED_ENTITIES: Record<string, string> = {
+  amp: '&',
+  lt: '<',
+  gt: '>',
+  quot: '"',
+  apos: "'",
+  nbsp: '\u00a0',
+};
+
+function getCachePath(url: string): string {
+  return path.join(HTML_CACHE_DIR, `${createHash('sha1').update(url).digest('hex')}.json`);
+}
+
+async function readCachedPage(url: string): Promise<CachedPage | null> {
+  if (!HTML_CACHE_DIR) return null;
+  try {
+    return JSON.parse(await fs.readFile(getCachePath(url), 'utf-8')) as CachedPage;
+  } catch {
+    return null;
+  }
+}
+
+async function writeCachedPage(cachedPage: CachedPage): Promise<void> {
+  if (!HTML_CACHE_DIR) return;
+  try {
+    await fs.mkdir(HTML_CACHE_DIR, { recursive: true });
+    await fs.writeFile(getCachePath(cachedPage.url), JSON.stringify(cachedPage));
+  } catch (error) {
+    console.log(`Warning: Could not cache ${cachedPage.url}: ${error}`);
+  }
+}
+
+/**
+ * Whether a session's pages are settled: sessions from before last year are
+ * closed, so their bills and rosters no longer change.
+ *
+ * @param year - Session year (undefined for the current session)
+ */
+export function isClosedSession(year?: number | null): boolean {
+  return !!year && year < new Date().getFullYear() - 1;
+}
+
+/**
+ * Fetch a page's HTML without rendering it.
+ *
+ * Uses the page's browser context request API, so cookies are shared with
+ * any pages loaded in the browser. Responses carrying an ETag or
+ * Last-Modified header are cached on disk and revalidated with a conditional
+ * GET on later runs; a 304 returns the cached body without re-downloading.
+ * Network errors and transient statuses (429, 5xx) are retried with backoff,
+ * or after the server's Retry-After delay when it sends one.
+ *
+ * Immutable pages (see isClosedSession) are always cached and, once cached,
+ * served from disk without touching the network unless HTML_CACHE_REFRESH is
+ * set.
+ *
+ * @param page - Playwright page instance
+ * @param url - URL to fetch
+ * @param options - Fetch options (immutable)
+ * @returns Response body as text
+ */
+export async function fetchHtml(page: Page, url: string, options: FetchHtmlOptions = {}): Promise<string> {
+  const { immutable = false } = options;
+  const cached = await readCachedPage(url);
+  if (cached && immutable && !HTML_CACHE_REFRESH) {
+    return cached.body;
+  }
+
+  const headers: Record<string, string> = {};
+  if (cached?.etag) headers['If-None-Match'] = cached.etag;
+  if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+
+  let retryAfterMs: number | undefined;
+  const response = await withRetry(
+    async () => {
+      retryAfterMs = undefined;
+      const attemptResponse = await page.request.get(url, { headers });
+      if (isTransientStatus(attemptResponse.status())) {
+        retryAfterMs = parseRetryAfter(attemptResponse.headers()['retry-after']);
+        throw new Error(`Failed to fetch ${url}: HTTP ${attemptResponse.status()}`);
+      }
+      return attemptResponse;
+    },
+    { retryDelayMs: () => retryAfterMs }
+  );
+
+  if (response.status() === 304 && cached) {
+    return cached.body;
+  }
+  if (!response.ok()) {
+    throw new Error(`Failed to fetch ${url}: HTTP ${response.status()}`);
+  }
+
+  const body = await response.text();
+  const responseHeaders = response.headers();
+  const etag = responseHeaders['etag'] ?? null;
+  const lastModified = responseHeaders['last-modified'] ?? null;
+
+  if (etag || lastModified || immutable) {
+    await writeCachedPage({ url, etag, lastModified, body });
+  }
+
+  return body;
+}
+
+/**
+ * Convert an HTML fragment to its trimmed text content
+ */
+export function htmlToText(fragment: string): string {
+  return fragment
+    .replace(TAG_PATTERN, '')
+    .replace(ENTITY_PATTERN, (entity, code: string) => {
+      if (code[0] === '#') {
+        const codePoint =
+          code[1] === 'x' || code[1] === 'X' ? parseInt(code.slice(2), 16) : parseInt(code.slice(1), 10);
+        return String.fromCodePoint(codePoint);
+      }
+      return NAMED_ENTITIES[code.toLowerCase()] ?? entity;
+    })
+    .trim();
+}
+
+/**
+ * Split an HTML fragment into its trimmed, non-empty text nodes, in document
+ * order, like a DOM TreeWalker over text nodes. Script and style contents are
+ * skipped.
+ */
+export function extractTextNodes(fragment: string): string[] {
+  return fragment
+    .replace(COMMENT_PATTERN, '')
+    .replace(SCRIPT_STYLE_PATTERN, '')
+    .split(TAG_PATTERN)
+    .map(htmlToText)
+    .filter((text) => text !== '');
+}
+
+/**
+ * Parse table rows into cells.
+ *
+ * @param html - Page HTML
+ * @param firstTableOnly - Only parse rows of the first <table> (default: all rows in the page)
+ * @returns One array of cells per <tr>, in document order
+ */
+export function parseTableRows(html: string, firstTableOnly: boolean = false): HtmlCell[][] {
+  let source = html.replace(COMMENT_PATTERN, '');
+
+  if (firstTableOnly) {
+    const table = source.match(TABLE_PATTERN);
+    if (!table) return [];
+    source = table[1];
+  }
+
+  return parseRows(source);
+}
+
+/**
+ * Parse every table in the page separately.
+ *
+ * @param html - Page HTML
+ * @returns Rows of cells for each <table>, in document order
+ */
+export function parseTables(html: string): HtmlCell[][][] {
+  const source = html.replace(COMMENT_PATTERN, '');
+  return Array.from(source.matchAll(TABLES_PATTERN), (table) => parseRows(table[1]));
+}
+
+function parseRows(source: string): HtmlCell[][] {
+  const rows: HtmlCell[][] = [];
+  for (const rowMatch of source.matchAll(ROW_PATTERN)) {
+    const cells: HtmlCell[] = [];
+    for (const cellMatch of rowMatch[1].matchAll(CELL_PATTERN)) {
+      const link = cellMatch[2].match(LINK_PATTERN);
+      const href = link ? link[1].match(HREF_PATTERN) : null;
+      cells.push({
+        tag: cellMatch[1].toUpperCase() as 'TD' | 'TH',
+        text: htmlToText(cellMatch[2]),
+        linkText: link ? htmlToText(link[2]) : null,
+        linkHref: href ? htmlToText(href[1] ?? href[2] ?? href[3]) : null,
+      });
+    }
+    rows.push(cells);
+  }
+
+  return rows;
+}
@@ -0,0 +1,23 @@
+/**
+ * Worker thread that extracts text from PDFs for the pool in pdf.ts.
+ *
+ * Receives a PDF path, replies with `{ text }` or `{ error }`. The pool sends
+ * one path at a time, so each worker parses a single PDF at once.
+ */
+
+import { readFile } from 'fs/promises';
+import { parentPort } from 'worker_threads';
+import pdfParse from 'pdf-parse';
+
+// Suppress pdf.js font warnings (TT: undefined function, etc.); this thread
+// only parses PDFs, so nothing else is silenced
+console.warn = () => {};
+
+parentPort!.on('message', async (filepath: string) => {
+  try {
+    const pdfData = await pdfParse(await readFile(filepath));
+    parentPort!.postMessage({ text: pdfData.text });
+  } catch (error) {
+    parentPort!.postMessage({ error: String(error) });
+  }
+});
@@ -0,0 +1,112 @@
+/**
+ * PDF text extraction on a pool of worker threads.
+ *
+ * pdf-parse is CPU-bound and blocks the event loop for the whole parse, so
+ * extracting on the main thread stalls every concurrent download and database
+ * write and uses a single core. Workers parse PDFs in parallel instead.
+ */
+
+import os from 'os';
+import path from 'path';
+import { Worker } from 'worker_threads';
+
+// Workers inherit the parent's execArgv, so under tsx the TypeScript worker
+// script is loaded the same way as this module
+const PDF_WORKER_PATH = path.join(__dirname, 'pdf-worker.ts');
+
+// Leave a core for the main thread's scraping and database work
+const MAX_PDF_WORKERS = Math.max(1, Math.min(os.availableParallelism() - 1, 8));
+
+interface PdfTask {
+  filepath: string;
+  resolve: (text: string) => void;
+  reject: (error: Error) => void;
+}
+
+/**
+ * Fixed-size pool that hands each worker one PDF at a time.
+ *
+ * Workers are started on demand and unref'd while idle, so an idle pool never
+ * keeps the process alive. A worker that crashes fails its current PDF and
+ * is replaced on the next dispatch.
+ */
+class PdfWorkerPool {
+  private idle: Worker[] = [];
+  private busy = new Map<Worker, PdfTask>();
+  private workerCount = 0;
+  private queue: PdfTask[] = [];
+
+  constructor(private readonly maxWorkers: number) {}
+
+  /**
+   * Extract a PDF's text on the next free worker
+   */
+  extract(filepath: string): Promise<string> {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ filepath, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      let worker = this.idle.pop();
+      if (!worker) {
+        if (this.workerCount >= this.maxWorkers) return;
+        worker = this.spawn();
+      }
+
+      const task = this.queue.shift()!;
+      this.busy.set(worker, task);
+      worker.ref();
+      worker.postMessage(task.filepath);
+    }
+  }
+
+  private spawn(): Worker {
+    const worker = new Worker(PDF_WORKER_PATH);
+    this.workerCount++;
+
+    worker.on('message', (message: { text?: string; error?: string }) => {
+      const task = this.busy.get(worker);
+      this.busy.delete(worker);
+      worker.unref();
+      this.idle.push(worker);
+
+      if (message.error !== undefined) {
+        task?.reject(new Error(message.error));
+      } else {
+        task?.resolve(message.text ?? '');
+      }
+      this.dispatch();
+    });
+
+    worker.on('error', (error) => {
+      this.busy.get(worker)?.reject(error);
+      this.busy.delete(worker);
+    });
+
+    worker.on('exit', (code) => {
+      this.workerCount--;
+      this.idle = this.idle.filter((w) => w !== worker);
+      this.busy.get(worker)?.reject(new Error(`PDF worker exited with code ${code}`));
+      this.busy.delete(worker);
+      this.dispatch();
+    });
+
+    return worker;
+  }
+}
+
+const pdfWorkerPool = new PdfWorkerPool(MAX_PDF_WORKERS);
+
+/**
+ * Extract the text of a PDF on disk.
+ *
+ * @param filepath - Path to the PDF
+ * @returns The PDF's text
+ * @throws If the PDF can't be read or parsed
+ */
+export function extractPdfText(filepath: string): Promise<string> {
+  return pdfWorkerPool.extract(filepath);
+}
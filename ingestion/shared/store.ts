@@ -0,0 +1,183 @@
+/**
+ * Storing scraped bills, shared by the House and Senate scrapers.
+ *
+ * Each scraped bill's PDF download, database write and embeddings run in the
+ * background while the page workers move on, and the outcome of every bill is
+ * counted so a closed session can be marked done once it is fully stored.
+ */
+
+import { DatabaseClient } from '@/database/client';
+import { BackgroundTaskQueue } from './concurrency';
+import { downloadBillDocuments } from './documents';
+import { generateEmbeddingsForBill } from './embeddings';
+import { isClosedSession } from './html';
+import { BillData, BillLog, DocumentInfo, ScrapedDocument, SessionScrapeStats } from './types';
+
+// Scraped bills whose PDF download, database write and embeddings may run in
+// the background while the page workers move on to the next bill
+const MAX_PENDING_BILL_WRITES = 8;
+
+/**
+ * A scraper's database write for one bill
+ *
+ * @returns Tuple of [bill_id, was_updated]
+ */
+export type InsertBillToDb = (
+  billData: BillData,
+  documentInfo: DocumentInfo[],
+  log: BillLog
+) => Promise<[string, boolean]>;
+
+/**
+ * Stores a session's scraped bills and tallies the results.
+ */
+export class BillStore {
+  private processedCount = 0;
+  private skippedCount = 0;
+  private failedCount = 0;
+  // Bills stored with a missing PDF or text
+  private incompleteCount = 0;
+  private readonly writer = new BackgroundTaskQueue(MAX_PENDING_BILL_WRITES);
+
+  /**
+   * @param db - Database client
+   * @param sessionId - Session UUID
+   * @param insertBillToDb - The scraper's write for one bill
+   * @param pdfDir - Directory PDFs are downloaded to
+   * @param embeddedBillIds - Bills already stored with their embeddings (see getFullyEmbeddedBillIds)
+   */
+  constructor(
+    private readonly db: DatabaseClient,
+    private readonly sessionId: string,
+    private readonly insertBillToDb: InsertBillToDb,
+    private readonly pdfDir: string,
+    private readonly embeddedBillIds: Set<string>
+  ) {}
+
+  /**
+   * Skip a bill that is already stored with its embeddings. A bill whose
+   * embeddings failed isn't in the set, so it is processed again.
+   *
+   * @returns Whether the bill was skipped
+   */
+  async skipIfStored(billNumber: string, log: BillLog): Promise<boolean> {
+    const existingBillId = await this.db.getBillIdByNumber(billNumber, this.sessionId);
+    if (!existingBillId || !this.embeddedBillIds.has(existingBillId)) {
+      return false;
+    }
+
+    log(`⏭️  Skipping - already has extracted text and embeddings`);
+    this.skippedCount++;
+    return true;
+  }
+
+  /**
+   * Count a bill that failed before it could be stored
+   */
+  recordFailure(): void {
+    this.failedCount++;
+  }
+
+  /**
+   * Queue a scraped bill's PDF download, database write and embeddings,
+   * waiting first if too many bills are already pending.
+   */
+  async push(
+    billNumber: string,
+    billData: BillData,
+    documents: ScrapedDocument[],
+    log: BillLog
+  ): Promise<void> {
+    await this.writer.push(() => this.store(billNumber, billData, documents, log));
+  }
+
+  /**
+   * Download, store and embed one bill
+   */
+  private async store(
+    billNumber: string,
+    billData: BillData,
+    documents: ScrapedDocument[],
+    log: BillLog
+  ): Promise<void> {
+    try {
+      // Download PDFs and extract text
+      let documentInfo: DocumentInfo[] = [];
+      let documentsComplete = true;
+      try {
+        documentInfo = await downloadBillDocuments(billNumber, documents, this.pdfDir, log);
+        // Failed downloads are dropped and failed extractions have no text
+        documentsComplete =
+          documentInfo.length === documents.length && documentInfo.every((doc) => doc.extracted_text !== null);
+      } catch (e) {
+        log(`Warning: Could not download PDFs: ${e}`);
+        documentsComplete = false;
+      }
+
+      const [billId, wasUpdated] = await this.insertBillToDb(billData, documentInfo, log);
+      log(`✓ ${wasUpdated ? 'Updated' : 'Inserted'} in database`);
+
+      // No explicit embeddings delete is needed on --force: replacing the
+      // bill's documents cascades to their old embeddings, and unchanged
+      // chunks are re-embedded from the local embedding cache
+
+      // Generate embeddings; a failure fails the bill rather than leaving it
+      // silently unembedded
+      const embeddingsCount = await generateEmbeddingsForBill(this.db, billId, documentInfo, log);
+      if (embeddingsCount > 0) {
+        log(`✓ Generated ${embeddingsCount} embeddings`);
+      }
+
+      if (!documentsComplete) this.incompleteCount++;
+      this.processedCount++;
+    } catch (e) {
+      log(`✗ Error: ${e}`);
+      this.failedCount++;
+    }
+  }
+
+  /**
+   * Wait for every queued bill, print the summary, and mark a closed session
+   * done when everything in a full run was stored.
+   *
+   * @param options.phase - session_scrape_runs phase to record
+   * @param options.year - Session year
+   * @param options.sessionCode - Session code, shown in the summary
+   * @param options.fullRun - Whether every bill was processed (no limit or bill filter)
+   * @param options.rosterComplete - Whether the session's legislators were all saved
+   * @returns Processed, skipped and failed bill counts
+   */
+  async finish(options: {
+    phase: string;
+    year?: number;
+    sessionCode: string;
+    fullRun: boolean;
+    rosterComplete: boolean;
+  }): Promise<SessionScrapeStats> {
+    const { phase, year, sessionCode, fullRun, rosterComplete } = options;
+    await this.writer.drain();
+
+    console.log(`\n${'='.repeat(60)}`);
+    console.log(`COMPLETE: ${year} ${sessionCode}`);
+    console.log(`  ✓ Processed: ${this.processedCount}`);
+    if (this.skippedCount > 0) console.log(`  ⏭️  Skipped: ${this.skippedCount}`);
+    if (this.failedCount > 0) console.log(`  ✗ Failed: ${this.failedCount}`);
+    if (this.incompleteCount > 0) console.log(`  Incomplete documents: ${this.incompleteCount}`);
+    if (!rosterComplete) console.log('  Roster not fully saved');
+
+    // An open session's bills keep changing, so only closed ones are marked.
+    // Skipped bills count as clean only because the skip set holds just the
+    // bills whose documents are all embedded; a bill left unembedded by an
+    // earlier run is processed, and counted, again.
+    const complete = this.failedCount === 0 && this.incompleteCount === 0 && rosterComplete;
+    if (complete && fullRun && isClosedSession(year)) {
+      try {
+        await this.db.markSessionPhaseDone(this.sessionId, phase);
+      } catch (e) {
+        console.log(`Warning: Could not mark session done: ${e}`);
+      }
+    }
+
+    return { processed: this.processedCount, skipped: this.skippedCount, failed: this.failedCount };
+  }
+}
@@ -51,6 +51,24 @@ export interface DocumentInfo extends ScrapedDocument {
   extracted_text: string | null;
 }
 
+/**
+ * A bill action row from the actions page
+ */
+export interface ScrapedAction {
+  action_date: string;
+  description: string;
+}
+
+/**
+ * A committee hearing from the hearings page
+ */
+export interface ScrapedHearing {
+  committee_name: string;
+  hearing_date: string;
+  hearing_time_text: string;
+  location: string;
+}
+
 /**
  * Bill data for database insertion
  */
@@ -67,9 +85,9 @@ export interface BillData {
   hearing_status?: string;
   bill_url?: string;
   bill_documents?: ScrapedDocument[];
-  cosponsors?: string;
-  actions?: string;
-  hearings?: string;
+  cosponsors?: string[];
+  actions?: ScrapedAction[];
+  hearings?: ScrapedHearing[];
 }
 
 /**
@@ -81,6 +99,21 @@ export interface ScraperOptions {
   db?: DatabaseClient;
 }
 
+/**
+ * Logger for one bill's messages; the scrapers prefix them with the session
+ * and bill number so concurrent sessions' output stays attributable
+ */
+export type BillLog = (message: string) => void;
+
+/**
+ * Bill counts from scraping one session
+ */
+export interface SessionScrapeStats {
+  processed: number;
+  skipped: number;
+  failed: number;
+}
+
 /**
  * Options for the scrapeBillsForSession convenience function
  */
@@ -0,0 +1,79 @@
+/**
+ * Bounded retries with exponential backoff for transient HTTP failures.
+ *
+ * Shared by the ingestion layer and the Next.js app.
+ */
+
+export interface RetryOptions {
+  /** Total attempts including the first (default 4) */
+  attempts?: number;
+  /** Backoff cap for the first retry, doubled on each later one (default 500ms) */
+  baseDelayMs?: number;
+  /** Upper bound on any single backoff (default 10s) */
+  maxDelayMs?: number;
+  /** Whether an error is worth retrying (default: every error) */
+  shouldRetry?: (error: unknown) => boolean;
+  /** Server-requested delay for an error (e.g. from Retry-After), used instead of the backoff */
+  retryDelayMs?: (error: unknown) => number | undefined;
+}
+
+// Statuses a server may return while briefly overloaded or rate limiting
+const TRANSIENT_STATUSES = new Set([408, 429, 500, 502, 503, 504]);
+
+/**
+ * Whether an HTTP status is likely to succeed if the request is repeated
+ */
+export function isTransientStatus(status: number | undefined): boolean {
+  return status !== undefined && TRANSIENT_STATUSES.has(status);
+}
+
+/**
+ * Parse a Retry-After header, given either in seconds or as an HTTP date
+ *
+ * @returns Delay in milliseconds, or undefined if the header is missing or invalid
+ */
+export function parseRetryAfter(value: string | null | undefined): number | undefined {
+  if (!value) return undefined;
+
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
+
+/**
+ * Run an async operation, retrying failures with exponential backoff and full
+ * jitter (a random delay up to the current backoff cap), so concurrent workers
+ * that fail together don't retry in lockstep. A delay the server asked for
+ * (see retryDelayMs) is honored instead, up to maxDelayMs.
+ *
+ * @param operation - Operation to run
+ * @param options - Retry limits and filter
+ * @returns The operation's result
+ * @throws The last error once attempts are exhausted or shouldRetry declines
+ */
+export async function withRetry<T>(operation: () => Promise<T>, options: RetryOptions = {}): Promise<T> {
+  const {
+    attempts = 4,
+    baseDelayMs = 500,
+    maxDelayMs = 10000,
+    shouldRetry = () => true,
+    retryDelayMs = () => undefined,
+  } = options;
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await operation();
+    } catch (error) {
+      if (attempt >= attempts || !shouldRetry(error)) throw error;
+
+      const requestedDelay = retryDelayMs(error);
+      const delay =
+        requestedDelay !== undefined
+          ? Math.min(maxDelayMs, requestedDelay)
+          : Math.random() * Math.min(maxDelayMs, baseDelayMs * 2 ** (attempt - 1));
+      await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+  }
+}